@@ -290,6 +290,7 @@ class BenchmarkExecutor:
         metrics: dict[str, Any] = {
             "prompt_tokens": 0,
             "completion_tokens": 0,
+            "cached": False,
             "error": None,
         }
 
@@ -304,6 +305,7 @@ class BenchmarkExecutor:
 
             metrics["prompt_tokens"] = task_result.prompt_tokens
             metrics["completion_tokens"] = task_result.completion_tokens
+            metrics["cached"] = task_result.cached
             metrics["error"] = task_result.error[:150] if task_result.error else None
 
         except Exception as e:
@@ -4,15 +4,42 @@ This module provides format fidelity scoring for comparing
 original and rebuilt documents.
 """
 
+import functools
+import os
 import subprocess
 import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
+import numpy as np
 from docx import Document
 from docx.oxml.ns import qn
+from docx.styles import BabelFish
+from lxml import etree
 
 
+_W_NS = {"w": "http://schemas.openxmlformats.org/wordprocessingml/2006/main"}
+
+# Compiled once; each call is a single libxml2 walk with no python-docx wrappers
+_XP_PARAGRAPH_STYLE_ID = etree.XPath("string(w:pPr/w:pStyle/@w:val)", namespaces=_W_NS)
+_XP_HAS_NUMPR = etree.XPath("boolean(w:pPr/w:numPr)", namespaces=_W_NS)
+# A w:style without w:type is a paragraph style (ECMA-376 default for w:type)
+_XP_PARAGRAPH_STYLES = etree.XPath(
+    "/w:styles/w:style[@w:type='paragraph' or not(@w:type)]", namespaces=_W_NS
+)
+_XP_STYLE_NAME = etree.XPath("string(w:name/@w:val)", namespaces=_W_NS)
+
+_W_BODY = qn("w:body")
+_W_P = qn("w:p")
+_W_TBL = qn("w:tbl")
+_W_STYLE_ID = qn("w:styleId")
+_W_DEFAULT = qn("w:default")
+
+# Run attributes compared by score_formatting, in column order
+_RUN_FORMAT_ATTRS = ("bold", "italic", "underline", "font_name", "font_size")
+
 _SOFFICE_CANDIDATES = [
     "soffice",
     "/Applications/LibreOffice.app/Contents/MacOS/soffice",
@@ -21,9 +48,12 @@ _SOFFICE_CANDIDATES = [
 ]
 
 
+@functools.cache
 def _find_soffice() -> str | None:
     """Find a working LibreOffice soffice binary.
 
+    Probing launches soffice, so the result is cached for the process.
+
     Returns:
         Path to soffice binary, or None if not found.
     """
@@ -41,6 +71,124 @@ def _find_soffice() -> str | None:
     return None
 
 
+def _render_first_page(pdf_bytes: bytes, dpi: int = 200) -> Any | None:
+    """Rasterize the first page of a PDF.
+
+    Renders in-process with pypdfium2 when it is installed, which avoids
+    spawning Poppler's pdfinfo and pdftoppm for every page. Falls back to
+    pdf2image (Poppler) otherwise.
+
+    Args:
+        pdf_bytes: Contents of the PDF file.
+        dpi: Render resolution.
+
+    Returns:
+        PIL Image of the first page, or None if the PDF has no pages.
+    """
+    try:
+        import pypdfium2 as pdfium
+    except ImportError:
+        from pdf2image import convert_from_bytes
+
+        images = convert_from_bytes(pdf_bytes, dpi=dpi, first_page=1, last_page=1)
+        return images[0] if images else None
+
+    pdf = pdfium.PdfDocument(pdf_bytes)
+    try:
+        if len(pdf) == 0:
+            return None
+        return pdf[0].render(scale=dpi / 72).to_pil()
+    finally:
+        pdf.close()
+
+
+def _encode_attribute_rows(
+    orig_rows: list[tuple[Any, ...]], rebuilt_rows: list[tuple[Any, ...]]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Encode aligned attribute rows as integer ID arrays.
+
+    Each distinct attribute value (None, bools, font names, Lengths, enums)
+    gets a small integer ID from a shared table, so equal values map to equal
+    IDs and the comparison can run as one array operation.
+
+    Args:
+        orig_rows: Attribute tuples for the original document's runs.
+        rebuilt_rows: Attribute tuples for the rebuilt document's runs.
+
+    Returns:
+        Two int32 arrays of shape (n_runs, n_attributes).
+    """
+    ids: dict[Any, int] = {}
+    orig_ids = np.array(
+        [[ids.setdefault(v, len(ids)) for v in row] for row in orig_rows], dtype=np.int32
+    )
+    rebuilt_ids = np.array(
+        [[ids.setdefault(v, len(ids)) for v in row] for row in rebuilt_rows], dtype=np.int32
+    )
+    return orig_ids, rebuilt_ids
+
+
+def _heading_level(style_name: str) -> int | None:
+    """Parse the level out of a "Heading N" style name.
+
+    Args:
+        style_name: UI name of a paragraph style.
+
+    Returns:
+        Heading level, or None if the style is not a numbered heading.
+    """
+    if not style_name.startswith("Heading"):
+        return None
+    try:
+        return int(style_name.replace("Heading", "").strip())
+    except ValueError:
+        return None
+
+
+def _read_paragraph_style_names(archive: zipfile.ZipFile) -> tuple[dict[str, str], str]:
+    """Map paragraph style IDs to UI names straight from word/styles.xml.
+
+    A style without w:type is a paragraph style, as ECMA-376 specifies, both
+    for ID lookup and when choosing the default. When several styles are
+    marked w:default the last one wins.
+
+    Args:
+        archive: Open docx archive.
+
+    Returns:
+        Tuple of (style ID to name map, default paragraph style name).
+    """
+    try:
+        root = etree.fromstring(archive.read("word/styles.xml"))
+    except KeyError:
+        return {}, ""
+
+    names_by_id: dict[str, str] = {}
+    default_name = ""
+    for style in _XP_PARAGRAPH_STYLES(root):
+        name = BabelFish.internal2ui(_XP_STYLE_NAME(style))
+        names_by_id[style.get(_W_STYLE_ID, "")] = name
+        if style.get(_W_DEFAULT) in ("1", "true", "on"):
+            default_name = name
+    return names_by_id, default_name
+
+
+def _stat_key(path: str | Path) -> tuple[str, int, int]:
+    """Build a cache key that changes whenever a file is rewritten.
+
+    Uses a single stat() call and the nanosecond mtime, so rewrites within
+    the same second still produce a new key.
+
+    Args:
+        path: Path to the file.
+
+    Returns:
+        Tuple of (path string, mtime in nanoseconds, size in bytes).
+    """
+    st = os.stat(path)
+    return str(path), st.st_mtime_ns, st.st_size
+
+
 class FidelityScorer:
     """Scorer for measuring format fidelity between original and rebuilt documents.
 
@@ -54,6 +202,12 @@ class FidelityScorer:
     - Combined weighted score
     """
 
+    def __init__(self) -> None:
+        """Initialize the scorer with an empty rendered-PDF cache."""
+        self._pdf_cache: dict[tuple[str, int, int], bytes] = {}
+        # Parsed documents shared across dimensions, only while score_total runs
+        self._documents: dict[str, Any] | None = None
+
     def _validate_path(self, path: Path) -> Path:
         """Validate a path is safe for subprocess use.
 
@@ -103,26 +257,39 @@ class FidelityScorer:
 
     # ── Helpers ──────────────────────────────────────────────────────────
 
-    def _extract_heading_levels(self, docx_path: Path) -> list[int]:
-        """Ordered heading levels (e.g., [1, 2, 2, 1]).
+    def _is_same_file(self, original_path: Path, rebuilt_path: Path) -> bool:
+        """Check whether both paths refer to the same file.
+
+        Every dimension scores a document against itself as a perfect match,
+        so callers use this to skip extraction of the second document.
+
+        Args:
+            original_path: Path to the original document.
+            rebuilt_path: Path to the rebuilt document.
+
+        Returns:
+            True if both paths resolve to the same location.
+        """
+        return original_path.resolve() == rebuilt_path.resolve()
+
+    def _open_document(self, docx_path: Path) -> Any:
+        """Return the parsed Document for a path.
+
+        Inside score_total each document is parsed once and shared by all
+        dimensions; otherwise every call parses the file again.
 
         Args:
             docx_path: Path to the document.
 
         Returns:
-            List of heading level integers in document order.
+            Parsed python-docx Document.
         """
-        doc = Document(str(docx_path))
-        levels: list[int] = []
-        for para in doc.paragraphs:
-            style_name = para.style.name if para.style else ""
-            if style_name.startswith("Heading"):
-                try:
-                    level = int(style_name.replace("Heading", "").strip())
-                    levels.append(level)
-                except ValueError:
-                    pass
-        return levels
+        if self._documents is None:
+            return Document(str(docx_path))
+        key = str(docx_path)
+        if key not in self._documents:
+            self._documents[key] = Document(key)
+        return self._documents[key]
 
     def _extract_all_run_formatting(self, docx_path: Path) -> list[list[dict]]:
         """Per-paragraph, per-run formatting.
@@ -135,7 +302,7 @@ class FidelityScorer:
         Returns:
             List of lists. Outer list = paragraphs, inner list = runs in that paragraph.
         """
-        doc = Document(str(docx_path))
+        doc = self._open_document(docx_path)
         result: list[list[dict]] = []
         for para in doc.paragraphs:
             runs_fmt: list[dict] = []
@@ -159,7 +326,7 @@ class FidelityScorer:
         Returns:
             List of table metadata dicts.
         """
-        doc = Document(str(docx_path))
+        doc = self._open_document(docx_path)
         tables_meta: list[dict] = []
         for table in doc.tables:
             tbl = table._tbl
@@ -227,7 +394,7 @@ class FidelityScorer:
         Returns:
             List of (text, url) tuples.
         """
-        doc = Document(str(docx_path))
+        doc = self._open_document(docx_path)
         rels = doc.part.rels
         body = doc.element.body
         links: list[tuple[str, str]] = []
@@ -259,7 +426,7 @@ class FidelityScorer:
         Returns:
             Dict with 'insertions' (int), 'deletions' (int), 'authors' (set[str]).
         """
-        doc = Document(str(docx_path))
+        doc = self._open_document(docx_path)
         body = doc.element.body
 
         insertions = 0
@@ -284,49 +451,55 @@ class FidelityScorer:
             "authors": authors,
         }
 
-    def _is_list_item(self, para: Any) -> bool:
-        """Check if a paragraph is a list item by examining its XML.
+    def _fast_counts(self, docx_path: Path) -> tuple[list[int], dict[str, int]]:
+        """Heading levels and structural counts without building a Document.
 
-        Args:
-            para: A python-docx paragraph object.
-
-        Returns:
-            True if the paragraph is a list item.
-        """
-        pPr = para._p.find(qn("w:pPr"))
-        if pPr is not None:
-            numPr = pPr.find(qn("w:numPr"))
-            return numPr is not None
-        return False
-
-    def _count_structure(self, docx_path: Path) -> dict[str, int]:
-        """Count structural elements in a document.
+        Reads word/styles.xml for style names, then stream-parses
+        word/document.xml and clears each top-level block once counted, so
+        peak memory stays flat regardless of document size. Style names are
+        resolved by _read_paragraph_style_names.
 
         Args:
             docx_path: Path to the document.
 
         Returns:
-            Dict with counts for headings, paragraphs, list_items, and tables.
+            Tuple of (ordered heading levels, dict with counts for headings,
+            paragraphs, list_items, and tables).
         """
-        doc = Document(str(docx_path))
-
+        levels: list[int] = []
         heading_count = 0
         paragraph_count = 0
         list_item_count = 0
+        table_count = 0
+
+        with zipfile.ZipFile(docx_path) as archive:
+            names_by_id, default_name = _read_paragraph_style_names(archive)
+            with archive.open("word/document.xml") as f:
+                for _, el in etree.iterparse(f, events=("end",), tag=(_W_P, _W_TBL)):
+                    parent = el.getparent()
+                    if parent is None or parent.tag != _W_BODY:
+                        continue
+
+                    if el.tag == _W_TBL:
+                        table_count += 1
+                    else:
+                        style_name = names_by_id.get(_XP_PARAGRAPH_STYLE_ID(el), default_name)
+                        if style_name.startswith("Heading"):
+                            heading_count += 1
+                            level = _heading_level(style_name)
+                            if level is not None:
+                                levels.append(level)
+                        elif style_name == "List Paragraph" or _XP_HAS_NUMPR(el):
+                            list_item_count += 1
+                        else:
+                            paragraph_count += 1
 
-        for para in doc.paragraphs:
-            style_name = para.style.name if para.style else ""
-
-            if style_name.startswith("Heading"):
-                heading_count += 1
-            elif style_name == "List Paragraph" or self._is_list_item(para):
-                list_item_count += 1
-            else:
-                paragraph_count += 1
-
-        table_count = len(doc.tables)
+                    # Drop the counted block and everything before it
+                    el.clear(keep_tail=False)
+                    while el.getprevious() is not None:
+                        del parent[0]
 
-        return {
+        return levels, {
             "headings": heading_count,
             "paragraphs": paragraph_count,
             "list_items": list_item_count,
@@ -367,9 +540,13 @@ class FidelityScorer:
         original_path = Path(original_docx)
         rebuilt_path = Path(rebuilt_docx)
 
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
+        orig_levels, original_counts = self._fast_counts(original_path)
+        rebuilt_levels, rebuilt_counts = self._fast_counts(rebuilt_path)
+
         # Heading level comparison (30%)
-        orig_levels = self._extract_heading_levels(original_path)
-        rebuilt_levels = self._extract_heading_levels(rebuilt_path)
 
         if orig_levels or rebuilt_levels:
             max_len = max(len(orig_levels), len(rebuilt_levels))
@@ -383,10 +560,6 @@ class FidelityScorer:
         else:
             heading_score = 100.0
 
-        # Count-based comparisons
-        original_counts = self._count_structure(original_path)
-        rebuilt_counts = self._count_structure(rebuilt_path)
-
         # Paragraph count comparison (30%)
         para_score = self._count_similarity(
             original_counts["paragraphs"], rebuilt_counts["paragraphs"]
@@ -429,13 +602,15 @@ class FidelityScorer:
         original_path = Path(original_docx)
         rebuilt_path = Path(rebuilt_docx)
 
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
         orig_fmt = self._extract_all_run_formatting(original_path)
         rebuilt_fmt = self._extract_all_run_formatting(rebuilt_path)
 
-        total_attributes = 0
-        matching_attributes = 0
-
-        # Compare paragraph by paragraph
+        # Align runs paragraph by paragraph; a missing run compares as all-None
+        orig_rows: list[tuple[Any, ...]] = []
+        rebuilt_rows: list[tuple[Any, ...]] = []
         max_paras = max(len(orig_fmt), len(rebuilt_fmt))
         for i in range(max_paras):
             orig_runs = orig_fmt[i] if i < len(orig_fmt) else []
@@ -445,18 +620,14 @@ class FidelityScorer:
             for j in range(max_runs):
                 orig_run = orig_runs[j] if j < len(orig_runs) else {}
                 rebuilt_run = rebuilt_runs[j] if j < len(rebuilt_runs) else {}
+                orig_rows.append(tuple(orig_run.get(attr) for attr in _RUN_FORMAT_ATTRS))
+                rebuilt_rows.append(tuple(rebuilt_run.get(attr) for attr in _RUN_FORMAT_ATTRS))
 
-                # Compare 5 attributes: bold, italic, underline, font_name, font_size
-                attrs = ["bold", "italic", "underline", "font_name", "font_size"]
-                for attr in attrs:
-                    total_attributes += 1
-                    if orig_run.get(attr) == rebuilt_run.get(attr):
-                        matching_attributes += 1
-
-        if total_attributes == 0:
+        if not orig_rows:
             return 100.0
 
-        return (matching_attributes / total_attributes) * 100
+        orig_ids, rebuilt_ids = _encode_attribute_rows(orig_rows, rebuilt_rows)
+        return float(np.mean(orig_ids == rebuilt_ids) * 100)
 
     def score_styles(
         self, original_docx: str | Path, rebuilt_docx: str | Path
@@ -493,10 +664,12 @@ class FidelityScorer:
         rebuilt_path = Path(rebuilt_docx)
 
         orig_tables = self._extract_tables_metadata(original_path)
-        rebuilt_tables = self._extract_tables_metadata(rebuilt_path)
-
         if not orig_tables:
             return None
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
+        rebuilt_tables = self._extract_tables_metadata(rebuilt_path)
 
         total_checks = 0
         matching_checks = 0
@@ -566,10 +739,12 @@ class FidelityScorer:
         rebuilt_path = Path(rebuilt_docx)
 
         orig_links = self._extract_hyperlinks(original_path)
-        rebuilt_links = self._extract_hyperlinks(rebuilt_path)
-
         if not orig_links:
             return None
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
+        rebuilt_links = self._extract_hyperlinks(rebuilt_path)
 
         max_links = max(len(orig_links), len(rebuilt_links))
 
@@ -600,11 +775,14 @@ class FidelityScorer:
         rebuilt_path = Path(rebuilt_docx)
 
         orig_tc = self._extract_track_changes(original_path)
-        rebuilt_tc = self._extract_track_changes(rebuilt_path)
 
         # No track changes in original
         if orig_tc["insertions"] == 0 and orig_tc["deletions"] == 0:
             return None
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
+        rebuilt_tc = self._extract_track_changes(rebuilt_path)
 
         total_checks = 0
         matching_checks = 0
@@ -642,7 +820,8 @@ class FidelityScorer:
         """Score visual fidelity between two documents.
 
         Renders first page of each docx to PNG and computes perceptual hash
-        difference using imagehash.
+        difference using imagehash. Byte-identical PDFs score 100 without
+        rendering, since they always render to the same image.
 
         Args:
             original_docx: Path to the original document.
@@ -655,82 +834,114 @@ class FidelityScorer:
             RuntimeError: If LibreOffice or Poppler are not available.
         """
         import imagehash
-        from pdf2image import convert_from_path
-        from PIL import Image
 
         original_path = Path(original_docx)
         rebuilt_path = Path(rebuilt_docx)
 
+        # The same file always renders identically
+        if self._is_same_file(original_path, rebuilt_path):
+            return 100.0
+
+        if _find_soffice() is None:
+            raise RuntimeError(
+                "LibreOffice (soffice) not found. Install LibreOffice for visual comparison."
+            )
+
         with tempfile.TemporaryDirectory() as tmp_dir:
-            tmp_path = Path(tmp_dir)
+            # Convert both docx files to PDF using LibreOffice
+            original_pdf, rebuilt_pdf = self._convert_docx_to_pdfs(
+                [original_path, rebuilt_path], Path(tmp_dir)
+            )
 
-            # Convert docx to PDF using LibreOffice
-            original_pdf = self._convert_docx_to_pdf(original_path, tmp_path)
-            rebuilt_pdf = self._convert_docx_to_pdf(rebuilt_path, tmp_path)
+        # Identical PDFs render to identical images, so the full comparison
+        # would score 100 as well
+        if original_pdf == rebuilt_pdf:
+            return 100.0
 
-            # Convert first page of each PDF to image
-            original_images = convert_from_path(str(original_pdf), first_page=1, last_page=1)
-            rebuilt_images = convert_from_path(str(rebuilt_pdf), first_page=1, last_page=1)
+        # Convert first page of each PDF to image
+        original_img = _render_first_page(original_pdf)
+        rebuilt_img = _render_first_page(rebuilt_pdf)
 
-            if not original_images or not rebuilt_images:
-                return 0.0
+        if original_img is None or rebuilt_img is None:
+            return 0.0
 
-            original_img = original_images[0]
-            rebuilt_img = rebuilt_images[0]
+        # Compute perceptual hashes
+        original_hash = imagehash.phash(original_img)
+        rebuilt_hash = imagehash.phash(rebuilt_img)
 
-            # Compute perceptual hashes
-            original_hash = imagehash.phash(original_img)
-            rebuilt_hash = imagehash.phash(rebuilt_img)
+        # Hash difference: 0 = identical, higher = more different
+        # Max possible difference for 64-bit hash is 64
+        hash_diff = original_hash - rebuilt_hash
 
-            # Hash difference: 0 = identical, higher = more different
-            # Max possible difference for 64-bit hash is 64
-            hash_diff = original_hash - rebuilt_hash
+        # Convert to 0-100 score (0 diff = 100 score)
+        score = max(0.0, 100 - (hash_diff / 64) * 100)
 
-            # Convert to 0-100 score (0 diff = 100 score)
-            score = max(0.0, 100 - (hash_diff / 64) * 100)
+        return score
 
-            return score
+    def _convert_docx_to_pdfs(
+        self, docx_paths: list[Path], output_dir: Path
+    ) -> list[bytes]:
+        """Convert docx files to PDF using as few LibreOffice launches as possible.
 
-    def _convert_docx_to_pdf(self, docx_path: Path, output_dir: Path) -> Path:
-        """Convert a docx file to PDF using LibreOffice.
+        Each soffice launch has a multi-second cold start, so all inputs that
+        are not already cached are converted in one invocation. Inputs that
+        share a file stem would overwrite each other's output, so they are
+        split into separate invocations. Results are cached per
+        (path, mtime, size) for the lifetime of the scorer.
 
         Args:
-            docx_path: Path to the docx file.
-            output_dir: Directory for output PDF.
+            docx_paths: Paths to the docx files.
+            output_dir: Scratch directory for generated PDFs.
 
         Returns:
-            Path to the generated PDF.
+            PDF bytes for each input, in the same order as docx_paths.
 
         Raises:
             RuntimeError: If LibreOffice is not available.
-            ValueError: If docx_path is invalid.
+            ValueError: If a docx path is invalid.
         """
-        # Validate input path before subprocess call
-        validated_docx = self._validate_path(docx_path)
-        validated_outdir = output_dir.resolve()
+        # Validate input paths before subprocess call
+        validated = [self._validate_path(p) for p in docx_paths]
+        keys = [_stat_key(p) for p in validated]
 
-        soffice_cmd = _find_soffice()
-        if soffice_cmd is None:
-            raise RuntimeError(
-                "LibreOffice (soffice) not found. Install LibreOffice for visual comparison."
-            )
-
-        # Convert docx to PDF using validated paths
-        subprocess.run(
-            [
-                soffice_cmd,
-                "--headless",
-                "--convert-to", "pdf",
-                "--outdir", str(validated_outdir),
-                str(validated_docx),
-            ],
-            capture_output=True,
-            check=True,
-        )
-
-        # Return path to generated PDF
-        pdf_path = validated_outdir / f"{validated_docx.stem}.pdf"
-        return pdf_path
+        pending: dict[tuple[str, int, int], Path] = {
+            key: path for key, path in zip(keys, validated) if key not in self._pdf_cache
+        }
+        if pending:
+            soffice_cmd = _find_soffice()
+            if soffice_cmd is None:
+                raise RuntimeError(
+                    "LibreOffice (soffice) not found. Install LibreOffice for visual comparison."
+                )
+
+            # soffice names each PDF after its input's stem
+            batches: list[dict[tuple[str, int, int], Path]] = []
+            for key, path in pending.items():
+                for batch in batches:
+                    if all(other.stem != path.stem for other in batch.values()):
+                        batch[key] = path
+                        break
+                else:
+                    batches.append({key: path})
+
+            for index, batch in enumerate(batches):
+                batch_dir = output_dir.resolve() / f"batch{index}"
+                batch_dir.mkdir()
+                subprocess.run(
+                    [
+                        soffice_cmd,
+                        "--headless",
+                        "--convert-to", "pdf",
+                        "--outdir", str(batch_dir),
+                        *(str(path) for path in batch.values()),
+                    ],
+                    capture_output=True,
+                    check=True,
+                )
+                for key, path in batch.items():
+                    self._pdf_cache[key] = (batch_dir / f"{path.stem}.pdf").read_bytes()
+
+        return [self._pdf_cache[key] for key in keys]
 
     def score_total(
         self, original_docx: str | Path, rebuilt_docx: str | Path
@@ -749,18 +960,31 @@ class FidelityScorer:
             Dict with keys: structure, formatting, tables, hyperlinks,
             track_changes, visual, total.
         """
-        structure = self.score_structure(original_docx, rebuilt_docx)
-        formatting = self.score_formatting(original_docx, rebuilt_docx)
-        tables = self.score_tables(original_docx, rebuilt_docx)
-        hyperlinks = self.score_hyperlinks(original_docx, rebuilt_docx)
-        track_changes = self.score_track_changes(original_docx, rebuilt_docx)
-
-        visual: float | None = None
-        try:
-            visual = self.score_visual(original_docx, rebuilt_docx)
-        except Exception:
-            # Visual scoring not available (missing LibreOffice/Poppler)
-            pass
+        # Visual scoring mostly waits on LibreOffice/Poppler subprocesses, so
+        # run it in the background while the XML dimensions are computed.
+        # Without LibreOffice it cannot run at all, so no worker is started.
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            visual_future = None
+            if _find_soffice() is not None:
+                visual_future = pool.submit(self.score_visual, original_docx, rebuilt_docx)
+
+            self._documents = {}
+            try:
+                structure = self.score_structure(original_docx, rebuilt_docx)
+                formatting = self.score_formatting(original_docx, rebuilt_docx)
+                tables = self.score_tables(original_docx, rebuilt_docx)
+                hyperlinks = self.score_hyperlinks(original_docx, rebuilt_docx)
+                track_changes = self.score_track_changes(original_docx, rebuilt_docx)
+            finally:
+                self._documents = None
+
+            visual: float | None = None
+            if visual_future is not None:
+                try:
+                    visual = visual_future.result()
+                except Exception:
+                    # Visual scoring failed (e.g. Poppler missing or conversion error)
+                    pass
 
         # Total = mean of non-None dimensions (excluding visual)
         scores = [structure, formatting] + [s for s in (tables, hyperlinks, track_changes) if s is not None]
@@ -4,8 +4,28 @@ This module provides accurate token counting using tiktoken
 with the cl100k_base encoding (used by Claude and GPT-4).
 """
 
+import functools
+import os
+from collections.abc import Sequence
+
 import tiktoken
 
+_ENCODING_NAME = "cl100k_base"
+_MAX_BATCH_THREADS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def _get_encoding(name: str) -> tiktoken.Encoding:
+    """Load a tiktoken encoding once per process.
+
+    Args:
+        name: Name of the tiktoken encoding.
+
+    Returns:
+        The shared Encoding instance.
+    """
+    return tiktoken.get_encoding(name)
+
 
 class TokenCounter:
     """Token counter using tiktoken cl100k_base encoding.
@@ -16,12 +36,12 @@ class TokenCounter:
 
     def __init__(self) -> None:
         """Initialize the token counter with cl100k_base encoding."""
-        self._encoding = tiktoken.get_encoding("cl100k_base")
+        self._encoding = _get_encoding(self.encoding_name)
 
     @property
     def encoding_name(self) -> str:
         """Get the name of the encoding being used."""
-        return "cl100k_base"
+        return _ENCODING_NAME
 
     def count_tokens(self, text: str) -> int:
         """Count the number of tokens in a text string.
@@ -37,3 +57,22 @@ class TokenCounter:
 
         tokens = self._encoding.encode(text)
         return len(tokens)
+
+    def count_tokens_batch(self, texts: Sequence[str]) -> list[int]:
+        """Count tokens for many strings using tiktoken's threaded batch encoder.
+
+        Single texts skip the thread pool, since there is nothing to
+        parallelize.
+
+        Args:
+            texts: The texts to count tokens for.
+
+        Returns:
+            Token counts in the same order as texts.
+        """
+        if len(texts) < 2:
+            return [self.count_tokens(text) for text in texts]
+
+        num_threads = min(_MAX_BATCH_THREADS, len(texts), os.cpu_count() or 1)
+        encoded = self._encoding.encode_batch(list(texts), num_threads=num_threads)
+        return [len(tokens) for tokens in encoded]
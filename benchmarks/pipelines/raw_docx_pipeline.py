@@ -5,13 +5,47 @@ It serves as a baseline for comparison - it can extract text but cannot
 apply edits or rebuild documents.
 """
 
+import zipfile
 from pathlib import Path
 
 from docx import Document
+from docx.oxml.ns import qn
+from docx.oxml.parser import parse_xml
 
 from benchmarks.metrics.token_counter import TokenCounter
 from benchmarks.pipelines.base import BasePipeline, PipelineResult
 
+_DOCUMENT_PART = "word/document.xml"
+
+
+def _paragraph_texts(document_path: Path) -> list[str]:
+    """Return the text of each body-level paragraph, like ``doc.paragraphs``.
+
+    Parses word/document.xml straight out of the archive with python-docx's
+    oxml parser, so each paragraph's text comes from its CT_P element without
+    loading the rest of the package or wrapping elements in Paragraph objects.
+    Falls back to Document() when the archive has no word/document.xml.
+
+    Args:
+        document_path: Path to the .docx file.
+
+    Returns:
+        Paragraph texts in document order, including empty paragraphs.
+    """
+    with zipfile.ZipFile(document_path) as docx_zip:
+        try:
+            xml = docx_zip.read(_DOCUMENT_PART)
+        except KeyError:
+            xml = None
+
+    if xml is None:
+        return [para.text for para in Document(str(document_path)).paragraphs]
+
+    body = parse_xml(xml).find(qn("w:body"))
+    if body is None:
+        return []
+    return [p.text for p in body.iterchildren(qn("w:p"))]
+
 
 class RawDocxPipeline(BasePipeline):
     """Pipeline that extracts raw text from docx files.
@@ -38,10 +72,8 @@ class RawDocxPipeline(BasePipeline):
         Returns:
             The extracted text content as a string (all paragraph text).
         """
-        doc = Document(str(document_path))
-
-        # Extract text from all paragraphs
-        paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
+        # Extract text from all non-blank paragraphs
+        paragraphs = [text for text in _paragraph_texts(document_path) if text.strip()]
         content = "\n".join(paragraphs)
 
         self._current_content = content
@@ -5,17 +5,20 @@ It extracts content to markdown, applies edits, and rebuilds documents
 while preserving original formatting.
 """
 
+import functools
 import hashlib
 import json
+import os
 import tempfile
 import time
 import zipfile
+import zlib
 from pathlib import Path
 from typing import Optional, Self
 
 from benchmarks.metrics.token_counter import TokenCounter
 from benchmarks.pipelines.base import BasePipeline, PipelineResult
-from sidedoc.extract import extract_blocks, extract_styles, blocks_to_markdown
+from sidedoc.extract import extract_all, blocks_to_markdown
 from sidedoc.package import create_sidedoc_archive
 from sidedoc.models import Block
 from sidedoc.sync import match_blocks, generate_updated_docx
@@ -91,6 +94,37 @@ def _parse_markdown_to_blocks(markdown: str) -> list[Block]:
     return blocks
 
 
+@functools.lru_cache(maxsize=32)
+def _build_sidedoc(path_str: str, mtime_ns: int, size: int) -> tuple[str, bytes]:
+    """Convert a docx to markdown and a sidedoc archive, memoized per file version.
+
+    The mtime and size are part of the cache key so that a document
+    rewritten in place is converted again rather than served stale.
+
+    Args:
+        path_str: Resolved path to the docx file.
+        mtime_ns: File modification time in nanoseconds.
+        size: File size in bytes.
+
+    Returns:
+        Tuple of (markdown content, sidedoc archive bytes).
+    """
+    blocks, styles, image_data = extract_all(path_str)
+    markdown_content: str = blocks_to_markdown(blocks)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        archive_path = Path(tmp_dir) / f"{Path(path_str).stem}.sidedoc"
+        create_sidedoc_archive(
+            str(archive_path),
+            markdown_content,
+            blocks,
+            styles,
+            path_str,
+            image_data,
+        )
+        return markdown_content, archive_path.read_bytes()
+
+
 class SidedocPipeline(BasePipeline):
     """Pipeline that uses Sidedoc format for document processing.
 
@@ -133,22 +167,14 @@ class SidedocPipeline(BasePipeline):
         self._temp_dir = tempfile.TemporaryDirectory()
         self._sidedoc_path = Path(self._temp_dir.name) / f"{document_path.stem}.sidedoc"
 
-        # Extract blocks and styles from the docx
-        blocks, image_data = extract_blocks(str(document_path))
-        styles = extract_styles(str(document_path), blocks)
-
-        # Convert blocks to markdown
-        markdown_content: str = blocks_to_markdown(blocks)
-
-        # Create the sidedoc archive
-        create_sidedoc_archive(
-            str(self._sidedoc_path),
-            markdown_content,
-            blocks,
-            styles,
-            str(document_path),
-            image_data,
+        # Conversion is memoized per file version; each pipeline still gets
+        # its own archive copy since apply_edit rewrites it in place
+        resolved = document_path.resolve()
+        stat = os.stat(resolved)
+        markdown_content, archive_bytes = _build_sidedoc(
+            str(resolved), stat.st_mtime_ns, stat.st_size
         )
+        self._sidedoc_path.write_bytes(archive_bytes)
 
         self._current_content = markdown_content
         return markdown_content
@@ -185,17 +211,16 @@ class SidedocPipeline(BasePipeline):
         if not self._sidedoc_path:
             return
 
-        # Read existing archive
+        new_bytes = new_content.encode("utf-8")
+
         with zipfile.ZipFile(self._sidedoc_path, "r") as zip_file:
-            structure_json = zip_file.read("structure.json").decode("utf-8")
-            styles_json = zip_file.read("styles.json").decode("utf-8")
-            manifest_json = zip_file.read("manifest.json").decode("utf-8")
+            # Skip the rewrite when content.md already holds these bytes
+            content_info = zip_file.getinfo("content.md")
+            if content_info.file_size == len(new_bytes) and content_info.CRC == zlib.crc32(new_bytes):
+                return
 
-            # Collect assets
-            assets: dict[str, bytes] = {}
-            for file_info in zip_file.filelist:
-                if file_info.filename.startswith("assets/"):
-                    assets[file_info.filename] = zip_file.read(file_info.filename)
+            with zip_file.open("manifest.json") as manifest_file:
+                manifest_data = json.load(manifest_file)
 
         # Parse new content into blocks
         new_blocks = _parse_markdown_to_blocks(new_content)
@@ -219,19 +244,30 @@ class SidedocPipeline(BasePipeline):
         }
 
         # Update manifest with new content hash
-        manifest_data = json.loads(manifest_json)
         manifest_data["content_hash"] = _compute_content_hash(new_content)
 
-        # Rewrite archive
-        with zipfile.ZipFile(self._sidedoc_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
-            zip_file.writestr("content.md", new_content)
-            zip_file.writestr("structure.json", json.dumps(structure_data, indent=2))
-            zip_file.writestr("styles.json", styles_json)
-            zip_file.writestr("manifest.json", json.dumps(manifest_data, indent=2))
+        regenerated = {
+            "content.md": new_bytes,
+            "structure.json": json.dumps(structure_data, indent=2),
+            "manifest.json": json.dumps(manifest_data, indent=2),
+        }
 
-            # Preserve assets
-            for asset_path, asset_data in assets.items():
-                zip_file.writestr(asset_path, asset_data)
+        # Rewrite into a sibling file, then swap it in. Members that are not
+        # regenerated keep their original compress_type (precompressed assets
+        # stay stored); zipfile has no raw copy, so they are still
+        # decompressed and, if deflated, recompressed.
+        tmp_path = self._sidedoc_path.with_suffix(".sidedoc.tmp")
+        with zipfile.ZipFile(self._sidedoc_path, "r") as src, zipfile.ZipFile(
+            tmp_path, "w", zipfile.ZIP_DEFLATED
+        ) as dst:
+            for info in src.infolist():
+                if info.filename in regenerated:
+                    dst.writestr(info.filename, regenerated.pop(info.filename))
+                else:
+                    dst.writestr(info, src.read(info))
+            for name, data in regenerated.items():
+                dst.writestr(name, data)
+        os.replace(tmp_path, self._sidedoc_path)
 
     def rebuild_document(
         self, content: str, original_path: Path, output_path: Path
@@ -254,9 +290,13 @@ class SidedocPipeline(BasePipeline):
 
             # Read structure and styles from sidedoc
             if self._sidedoc_path and self._sidedoc_path.exists():
+                # Parse straight from the member streams rather than
+                # buffering each decompressed JSON document first
                 with zipfile.ZipFile(self._sidedoc_path, "r") as zip_file:
-                    structure_data = json.loads(zip_file.read("structure.json").decode("utf-8"))
-                    styles_data = json.loads(zip_file.read("styles.json").decode("utf-8"))
+                    with zip_file.open("structure.json") as structure_file:
+                        structure_data = json.load(structure_file)
+                    with zip_file.open("styles.json") as styles_file:
+                        styles_data = json.load(styles_file)
 
                 # Reconstruct old blocks from structure
                 old_blocks = [
@@ -282,9 +322,8 @@ class SidedocPipeline(BasePipeline):
                 generate_updated_docx(new_blocks, matches, styles_data, str(output_path))
             else:
                 # No sidedoc available, extract fresh
-                blocks, _ = extract_blocks(str(original_path))
+                blocks, styles, _ = extract_all(str(original_path))
                 matches = match_blocks(blocks, new_blocks)
-                styles = extract_styles(str(original_path), blocks)
 
                 styles_data = {
                     "block_styles": {
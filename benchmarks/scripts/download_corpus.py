@@ -50,11 +50,8 @@ def compute_sha256(path: Path) -> str:
     Returns:
         Hexadecimal SHA256 hash string.
     """
-    sha256 = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256.update(chunk)
-    return sha256.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def verify_checksum(path: Path, expected: Optional[str]) -> bool:
@@ -18,12 +18,14 @@ class TaskResult:
         completion_tokens: Number of tokens in the API response.
         result_text: The text result from the task execution.
         error: Error message if the task failed, None otherwise.
+        cached: True if the result was served from a cache without an API call.
     """
 
     prompt_tokens: int
     completion_tokens: int
     result_text: str
     error: Optional[str]
+    cached: bool = False
 
 
 class BaseTask(ABC):
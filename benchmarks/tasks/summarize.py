@@ -4,10 +4,21 @@ This module provides the SummarizeTask which uses LiteLLM
 to generate bullet point summaries of document content.
 """
 
+import asyncio
+import dataclasses
+import hashlib
+from typing import Any
+
 import litellm
 
 from benchmarks.tasks.base import BaseTask, TaskResult
 
+# Successful results keyed by (content digest, prompt, model)
+_SUMMARY_CACHE: dict[tuple[str, str, str], TaskResult] = {}
+
+_DEFAULT_CONCURRENCY = 16
+_NUM_RETRIES = 3
+
 
 class SummarizeTask(BaseTask):
     """Task that summarizes document content in 3-5 bullet points.
@@ -21,6 +32,58 @@ class SummarizeTask(BaseTask):
         "Focus on the key points and main ideas."
     )
 
+    def _cache_key(self, content: str, model: str) -> tuple[str, str, str]:
+        """Build the summary cache key for content and model."""
+        return (
+            hashlib.blake2b(content.encode("utf-8")).hexdigest(),
+            self.SUMMARIZATION_PROMPT,
+            model,
+        )
+
+    def _messages(self, content: str) -> list[dict[str, str]]:
+        """Build the chat messages for summarizing content."""
+        return [
+            {
+                "role": "user",
+                "content": f"{self.SUMMARIZATION_PROMPT}\n\n{content}",
+            }
+        ]
+
+    @staticmethod
+    def _cached_result(cache_key: tuple[str, str, str]) -> TaskResult | None:
+        """Return a cached TaskResult for the key, if any.
+
+        The original call's token counts are kept, so a cache hit reports what
+        the content costs rather than zero.
+        """
+        result = _SUMMARY_CACHE.get(cache_key)
+        if result is None:
+            return None
+        return dataclasses.replace(result, cached=True)
+
+    @staticmethod
+    def _result_from_response(response: Any, cache_key: tuple[str, str, str]) -> TaskResult:
+        """Convert a LiteLLM response to a TaskResult and cache the summary."""
+        result_text = ""
+        if response.choices and response.choices[0].message:
+            result_text = response.choices[0].message.content or ""
+
+        # Get token usage from response
+        prompt_tokens = 0
+        completion_tokens = 0
+        if response.usage:
+            prompt_tokens = response.usage.prompt_tokens or 0
+            completion_tokens = response.usage.completion_tokens or 0
+
+        result = TaskResult(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            result_text=result_text,
+            error=None,
+        )
+        _SUMMARY_CACHE[cache_key] = result
+        return result
+
     def execute(self, content: str, model: str) -> TaskResult:
         """Execute the summarization task on the given content.
 
@@ -29,38 +92,50 @@ class SummarizeTask(BaseTask):
             model: The LLM model identifier (e.g., 'claude-sonnet-4-20250514', 'ollama/llama3').
 
         Returns:
-            TaskResult with summary and token counts.
+            TaskResult with summary and token counts. Repeat calls with the
+            same content, prompt, and model are served from an in-process
+            cache with the original token counts and cached set.
         """
+        cache_key = self._cache_key(content, model)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             response = litellm.completion(
                 model=model,
                 max_tokens=1024,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": f"{self.SUMMARIZATION_PROMPT}\n\n{content}",
-                    }
-                ],
+                messages=self._messages(content),
             )
+            return self._result_from_response(response, cache_key)
 
-            result_text = ""
-            if response.choices and response.choices[0].message:
-                result_text = response.choices[0].message.content or ""
-
-            # Get token usage from response
-            prompt_tokens = 0
-            completion_tokens = 0
-            if response.usage:
-                prompt_tokens = response.usage.prompt_tokens or 0
-                completion_tokens = response.usage.completion_tokens or 0
-
+        except Exception as e:
             return TaskResult(
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                result_text=result_text,
-                error=None,
+                prompt_tokens=0,
+                completion_tokens=0,
+                result_text="",
+                error=str(e),
             )
 
+    async def _execute_async(
+        self, content: str, model: str, semaphore: asyncio.Semaphore
+    ) -> TaskResult:
+        """Summarize one document, holding the semaphore for the API call."""
+        cache_key = self._cache_key(content, model)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
+        try:
+            async with semaphore:
+                response = await litellm.acompletion(
+                    model=model,
+                    max_tokens=1024,
+                    messages=self._messages(content),
+                    num_retries=_NUM_RETRIES,
+                )
+            return self._result_from_response(response, cache_key)
+
         except Exception as e:
             return TaskResult(
                 prompt_tokens=0,
@@ -68,3 +143,33 @@ class SummarizeTask(BaseTask):
                 result_text="",
                 error=str(e),
             )
+
+    async def _gather(
+        self, contents: list[str], model: str, concurrency: int
+    ) -> list[TaskResult]:
+        """Summarize all documents with at most concurrency calls in flight."""
+        semaphore = asyncio.Semaphore(concurrency)
+        return list(
+            await asyncio.gather(
+                *(self._execute_async(content, model, semaphore) for content in contents)
+            )
+        )
+
+    def execute_many(
+        self, contents: list[str], model: str, concurrency: int = _DEFAULT_CONCURRENCY
+    ) -> list[TaskResult]:
+        """Summarize many documents concurrently.
+
+        Rate-limit and transient errors are retried by LiteLLM with
+        backoff; any remaining failure is reported on that document's
+        TaskResult like execute().
+
+        Args:
+            contents: The document contents to summarize.
+            model: The LLM model identifier.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            TaskResults in the same order as contents.
+        """
+        return asyncio.run(self._gather(contents, model, concurrency))
@@ -1,26 +1,49 @@
 """Shared fixtures for benchmark tests."""
 
+import functools
+import shutil
 from pathlib import Path
 
 import pytest
 
-BENCHMARKS_DIR = Path(__file__).parent.parent
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent
 FIXTURES_DIR = BENCHMARKS_DIR.parent / "tests" / "fixtures"
+SIMPLE_DOCX = FIXTURES_DIR / "simple.docx"
 
 
-@pytest.fixture
+@functools.cache
+def _visual_scorer_available() -> bool:
+    """Check if visual scoring dependencies (LibreOffice, a PDF renderer) are available."""
+    from benchmarks.metrics.fidelity_scorer import _SOFFICE_CANDIDATES
+
+    try:
+        import pypdfium2  # noqa: F401
+
+        has_renderer = True
+    except ImportError:
+        has_renderer = shutil.which("pdfinfo") is not None
+
+    return any(shutil.which(p) for p in _SOFFICE_CANDIDATES) and has_renderer
+
+
+@pytest.fixture(scope="session")
 def benchmarks_dir() -> Path:
     return BENCHMARKS_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures_dir() -> Path:
     return FIXTURES_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_docx() -> Path:
-    path = FIXTURES_DIR / "simple.docx"
-    if not path.exists():
+    if not SIMPLE_DOCX.exists():
         pytest.skip("simple.docx fixture not found")
-    return path
+    return SIMPLE_DOCX
+
+
+@pytest.fixture(scope="session")
+def visual_available() -> None:
+    if not _visual_scorer_available():
+        pytest.skip("Visual scoring requires LibreOffice and pypdfium2 or Poppler (pdfinfo)")
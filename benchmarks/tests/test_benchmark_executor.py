@@ -63,6 +63,7 @@ def mock_executor():
     real documents or API calls.
     """
     from benchmarks.benchmark_executor import BenchmarkExecutor
+    from benchmarks.tasks.base import TaskResult
 
     with (
         patch("benchmarks.benchmark_executor.get_pipeline") as mock_get_pipeline,
@@ -73,9 +74,10 @@ def mock_executor():
         mock_get_pipeline.return_value = mock_pipe
 
         mock_t = MagicMock()
-        mock_t.execute.return_value = MagicMock(
+        mock_t.execute.return_value = TaskResult(
             prompt_tokens=100,
             completion_tokens=50,
+            result_text="",
             error=None,
         )
         mock_get_task.return_value = mock_t
@@ -216,6 +218,40 @@ class TestBenchmarkExecutor:
             error = results["results"][0]["metrics"]["error"]
             assert len(error) == 150
 
+    def test_cached_task_result_is_flagged_in_metrics(self) -> None:
+        """Test that a cache hit keeps its token counts and is marked cached."""
+        from benchmarks.benchmark_executor import BenchmarkExecutor
+        from benchmarks.tasks.base import TaskResult
+
+        with (
+            patch("benchmarks.benchmark_executor.get_pipeline") as mock_pipeline,
+            patch("benchmarks.benchmark_executor.get_task") as mock_task,
+        ):
+            mock_pipe = MagicMock()
+            mock_pipe.extract_content.return_value = "content"
+            mock_pipeline.return_value = mock_pipe
+
+            mock_t = MagicMock()
+            mock_t.execute.return_value = TaskResult(
+                prompt_tokens=100,
+                completion_tokens=50,
+                result_text="- summary",
+                error=None,
+                cached=True,
+            )
+            mock_task.return_value = mock_t
+
+            executor = BenchmarkExecutor(
+                pipelines=["sidedoc"],
+                tasks=["summarize"],
+                corpus="synthetic",
+            )
+            results = executor.run()
+
+            metrics = results["results"][0]["metrics"]
+            assert metrics["cached"] is True
+            assert (metrics["prompt_tokens"], metrics["completion_tokens"]) == (100, 50)
+
 
 class TestResultsJsonOutput:
     """Test the results JSON output (US-023)."""
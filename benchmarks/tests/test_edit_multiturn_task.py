@@ -1,11 +1,19 @@
 """Tests for multi-turn edit task (US-020)."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
 
 
+@pytest.fixture
+def mock_litellm(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the litellm module used by the task with a MagicMock."""
+    fake = MagicMock()
+    monkeypatch.setattr("benchmarks.tasks.edit_multiturn.litellm", fake)
+    return fake
+
+
 class TestMultiTurnEditTask:
     """Test the multi-turn edit task (US-020)."""
 
@@ -47,7 +55,7 @@ class TestMultiTurnEditTask:
         assert hasattr(task, "execute")
         assert callable(task.execute)
 
-    def test_execute_returns_task_result(self) -> None:
+    def test_execute_returns_task_result(self, mock_litellm: MagicMock) -> None:
         """Test that execute returns a TaskResult."""
         from benchmarks.tasks.base import TaskResult
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
@@ -61,15 +69,14 @@ class TestMultiTurnEditTask:
             response.usage.completion_tokens = 50
             return response
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = mock_completion
+        mock_litellm.completion.side_effect = mock_completion
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            result = task.execute("Original content", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        result = task.execute("Original content", "claude-sonnet-4-20250514")
 
-            assert isinstance(result, TaskResult)
+        assert isinstance(result, TaskResult)
 
-    def test_execute_runs_3_rounds(self) -> None:
+    def test_execute_runs_3_rounds(self, mock_litellm: MagicMock) -> None:
         """Test that execute runs 3 rounds of edits."""
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
 
@@ -86,15 +93,14 @@ class TestMultiTurnEditTask:
             response.usage.completion_tokens = 50
             return response
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = mock_completion
+        mock_litellm.completion.side_effect = mock_completion
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            task.execute("Content", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        task.execute("Content", "claude-sonnet-4-20250514")
 
-            assert call_count == 3
+        assert call_count == 3
 
-    def test_execute_accumulates_tokens(self) -> None:
+    def test_execute_accumulates_tokens(self, mock_litellm: MagicMock) -> None:
         """Test that execute accumulates token counts across rounds."""
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
 
@@ -111,17 +117,16 @@ class TestMultiTurnEditTask:
             response.usage.completion_tokens = 50 * round_num
             return response
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = mock_completion
+        mock_litellm.completion.side_effect = mock_completion
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            result = task.execute("Content", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        result = task.execute("Content", "claude-sonnet-4-20250514")
 
-            # Total should be 100+200+300=600 input, 50+100+150=300 output
-            assert result.prompt_tokens == 600
-            assert result.completion_tokens == 300
+        # Total should be 100+200+300=600 input, 50+100+150=300 output
+        assert result.prompt_tokens == 600
+        assert result.completion_tokens == 300
 
-    def test_result_contains_final_edited_content(self) -> None:
+    def test_result_contains_final_edited_content(self, mock_litellm: MagicMock) -> None:
         """Test that the result contains the final edited content."""
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
 
@@ -138,16 +143,15 @@ class TestMultiTurnEditTask:
             response.usage.completion_tokens = 25
             return response
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = mock_completion
+        mock_litellm.completion.side_effect = mock_completion
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            result = task.execute("Original", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        result = task.execute("Original", "claude-sonnet-4-20250514")
 
-            # Final result should be from round 3
-            assert result.result_text == "After edit 3"
+        # Final result should be from round 3
+        assert result.result_text == "After edit 3"
 
-    def test_execute_passes_output_to_next_round(self) -> None:
+    def test_execute_passes_output_to_next_round(self, mock_litellm: MagicMock) -> None:
         """Test that each round's output becomes input for next round."""
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
 
@@ -166,27 +170,25 @@ class TestMultiTurnEditTask:
             response.usage.completion_tokens = 25
             return response
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = mock_completion
+        mock_litellm.completion.side_effect = mock_completion
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            task.execute("Original", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        task.execute("Original", "claude-sonnet-4-20250514")
 
-            # Round 2 should receive Output1, Round 3 should receive Output2
-            assert "Output1" in call_inputs[1]
-            assert "Output2" in call_inputs[2]
+        # Round 2 should receive Output1, Round 3 should receive Output2
+        assert "Output1" in call_inputs[1]
+        assert "Output2" in call_inputs[2]
 
-    def test_execute_handles_api_error(self) -> None:
+    def test_execute_handles_api_error(self, mock_litellm: MagicMock) -> None:
         """Test that execute handles API errors gracefully."""
         from benchmarks.tasks.base import TaskResult
         from benchmarks.tasks.edit_multiturn import MultiTurnEditTask
 
-        with patch("benchmarks.tasks.edit_multiturn.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = Exception("API failed")
+        mock_litellm.completion.side_effect = Exception("API failed")
 
-            task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
-            result = task.execute("Content", "claude-sonnet-4-20250514")
+        task = MultiTurnEditTask(edit_instructions=["E1", "E2", "E3"])
+        result = task.execute("Content", "claude-sonnet-4-20250514")
 
-            assert isinstance(result, TaskResult)
-            assert result.error is not None
-            assert "API failed" in result.error
+        assert isinstance(result, TaskResult)
+        assert result.error is not None
+        assert "API failed" in result.error
@@ -1,11 +1,30 @@
 """Tests for single-edit task (US-019)."""
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import MagicMock
 
 import pytest
 
 
+def _fake_response(text: str, prompt_tokens: int, completion_tokens: int) -> SimpleNamespace:
+    """Build a minimal litellm completion response."""
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens, completion_tokens=completion_tokens
+        ),
+    )
+
+
+@pytest.fixture
+def mock_litellm(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Replace the litellm module used by the task with a MagicMock."""
+    fake = MagicMock()
+    monkeypatch.setattr("benchmarks.tasks.edit_single.litellm", fake)
+    return fake
+
+
 class TestSingleEditTask:
     """Test the single-edit task (US-019)."""
 
@@ -42,88 +61,69 @@ class TestSingleEditTask:
         assert hasattr(task, "execute")
         assert callable(task.execute)
 
-    def test_execute_returns_task_result(self) -> None:
+    def test_execute_returns_task_result(self, mock_litellm: MagicMock) -> None:
         """Test that execute returns a TaskResult."""
         from benchmarks.tasks.base import TaskResult
         from benchmarks.tasks.edit_single import SingleEditTask
 
-        mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = "Edited content here"
-        mock_response.choices = [mock_choice]
-        mock_response.usage.prompt_tokens = 150
-        mock_response.usage.completion_tokens = 75
+        mock_response = _fake_response("Edited content here", 150, 75)
 
-        with patch("benchmarks.tasks.edit_single.litellm") as mock_litellm:
-            mock_litellm.completion.return_value = mock_response
+        mock_litellm.completion.return_value = mock_response
 
-            task = SingleEditTask(edit_instruction="Make it shorter")
-            result = task.execute("Original content that is long", "claude-sonnet-4-20250514")
+        task = SingleEditTask(edit_instruction="Make it shorter")
+        result = task.execute("Original content that is long", "claude-sonnet-4-20250514")
 
-            assert isinstance(result, TaskResult)
-            assert result.prompt_tokens == 150
-            assert result.completion_tokens == 75
-            assert "Edited content" in result.result_text
+        assert isinstance(result, TaskResult)
+        assert result.prompt_tokens == 150
+        assert result.completion_tokens == 75
+        assert "Edited content" in result.result_text
 
-    def test_execute_sends_instruction_and_content(self) -> None:
+    def test_execute_sends_instruction_and_content(self, mock_litellm: MagicMock) -> None:
         """Test that execute sends both instruction and content to API."""
         from benchmarks.tasks.edit_single import SingleEditTask
 
-        mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = "Edited"
-        mock_response.choices = [mock_choice]
-        mock_response.usage.prompt_tokens = 50
-        mock_response.usage.completion_tokens = 20
+        mock_response = _fake_response("Edited", 50, 20)
 
         test_instruction = "Add more details about XYZ"
         test_content = "Document content ABC123"
 
-        with patch("benchmarks.tasks.edit_single.litellm") as mock_litellm:
-            mock_litellm.completion.return_value = mock_response
+        mock_litellm.completion.return_value = mock_response
 
-            task = SingleEditTask(edit_instruction=test_instruction)
-            task.execute(test_content, "claude-sonnet-4-20250514")
+        task = SingleEditTask(edit_instruction=test_instruction)
+        task.execute(test_content, "claude-sonnet-4-20250514")
 
-            call_args = mock_litellm.completion.call_args
-            call_str = str(call_args)
+        call_args = mock_litellm.completion.call_args
+        call_str = str(call_args)
 
-            # Both instruction and content should be in the call
-            assert "XYZ" in call_str or test_instruction in call_str
-            assert "ABC123" in call_str or test_content in call_str
+        # Both instruction and content should be in the call
+        assert "XYZ" in call_str or test_instruction in call_str
+        assert "ABC123" in call_str or test_content in call_str
 
-    def test_execute_handles_api_error(self) -> None:
+    def test_execute_handles_api_error(self, mock_litellm: MagicMock) -> None:
         """Test that execute handles API errors gracefully."""
         from benchmarks.tasks.base import TaskResult
         from benchmarks.tasks.edit_single import SingleEditTask
 
-        with patch("benchmarks.tasks.edit_single.litellm") as mock_litellm:
-            mock_litellm.completion.side_effect = Exception("Connection failed")
+        mock_litellm.completion.side_effect = Exception("Connection failed")
 
-            task = SingleEditTask(edit_instruction="Edit this")
-            result = task.execute("Content", "claude-sonnet-4-20250514")
+        task = SingleEditTask(edit_instruction="Edit this")
+        result = task.execute("Content", "claude-sonnet-4-20250514")
 
-            assert isinstance(result, TaskResult)
-            assert result.error is not None
-            assert "Connection failed" in result.error
+        assert isinstance(result, TaskResult)
+        assert result.error is not None
+        assert "Connection failed" in result.error
 
-    def test_result_contains_edited_content(self) -> None:
+    def test_result_contains_edited_content(self, mock_litellm: MagicMock) -> None:
         """Test that the result contains the edited content from API."""
         from benchmarks.tasks.edit_single import SingleEditTask
 
         edited_text = "This is the edited version of the document"
 
-        mock_response = MagicMock()
-        mock_choice = MagicMock()
-        mock_choice.message.content = edited_text
-        mock_response.choices = [mock_choice]
-        mock_response.usage.prompt_tokens = 100
-        mock_response.usage.completion_tokens = 50
+        mock_response = _fake_response(edited_text, 100, 50)
 
-        with patch("benchmarks.tasks.edit_single.litellm") as mock_litellm:
-            mock_litellm.completion.return_value = mock_response
+        mock_litellm.completion.return_value = mock_response
 
-            task = SingleEditTask(edit_instruction="Improve clarity")
-            result = task.execute("Original document", "claude-sonnet-4-20250514")
+        task = SingleEditTask(edit_instruction="Improve clarity")
+        result = task.execute("Original document", "claude-sonnet-4-20250514")
 
-            assert result.result_text == edited_text
+        assert result.result_text == edited_text
@@ -2,15 +2,147 @@
 
 import shutil
 import tempfile
+import zipfile
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 from docx import Document
 from docx.shared import Pt
 
-BENCHMARKS_DIR = Path(__file__).parent.parent
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent
 SYNTHETIC_DIR = BENCHMARKS_DIR / "corpus" / "synthetic"
 
+# Synthetic corpus documents used across tests, keyed by file stem
+_FIXTURES = {
+    name: SYNTHETIC_DIR / f"{name}.docx"
+    for name in (
+        "simple",
+        "formatted",
+        "lists",
+        "hyperlinks",
+        "tables_simple",
+        "track_changes_simple",
+    )
+}
+
+
+def _run_doc(**attrs: object) -> Document:
+    """Build a document with one paragraph holding a single formatted run."""
+    doc = Document()
+    run = doc.add_paragraph().add_run("Test content")
+    for name, value in attrs.items():
+        target = run.font if name in ("name", "size") else run
+        setattr(target, name, value)
+    return doc
+
+
+def _save_pair(tmp_dir: Path, original: Document, rebuilt: Document) -> tuple[Path, Path]:
+    """Save an original/rebuilt document pair and return their paths."""
+    original_path = tmp_dir / "original.docx"
+    rebuilt_path = tmp_dir / "rebuilt.docx"
+    original.save(str(original_path))
+    rebuilt.save(str(rebuilt_path))
+    return original_path, rebuilt_path
+
+
+def _copy_as_rebuilt(path: str | Path, directory: Path) -> Path:
+    """Copy a document to a second path so scoring runs the full comparison."""
+    rebuilt_path = directory / f"rebuilt_{Path(path).name}"
+    shutil.copyfile(path, rebuilt_path)
+    return rebuilt_path
+
+
+@pytest.fixture(scope="session")
+def two_heading_docs(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Original with two headings, rebuilt with one."""
+    doc1 = Document()
+    doc1.add_heading("Heading 1", level=1)
+    doc1.add_paragraph("Content 1")
+    doc1.add_heading("Heading 2", level=2)
+    doc1.add_paragraph("Content 2")
+
+    doc2 = Document()
+    doc2.add_heading("Heading 1", level=1)
+    doc2.add_paragraph("Content 1")
+    doc2.add_paragraph("Content 2")  # No heading here
+
+    return _save_pair(tmp_path_factory.mktemp("fidelity"), doc1, doc2)
+
+
+@pytest.fixture(scope="session")
+def two_para_count_docs(tmp_path_factory: pytest.TempPathFactory) -> tuple[Path, Path]:
+    """Original with three paragraphs, rebuilt with two."""
+    doc1 = Document()
+    doc1.add_paragraph("Paragraph 1")
+    doc1.add_paragraph("Paragraph 2")
+    doc1.add_paragraph("Paragraph 3")
+
+    doc2 = Document()
+    doc2.add_paragraph("Paragraph 1")
+    doc2.add_paragraph("Paragraph 2")
+
+    return _save_pair(tmp_path_factory.mktemp("fidelity"), doc1, doc2)
+
+
+# (run attribute, original value, rebuilt value) for the formatting diff tests
+_RUN_ATTRIBUTE_DIFFS = [
+    ("bold", True, False),
+    ("italic", True, False),
+    ("underline", True, False),
+    ("name", "Arial", "Times New Roman"),
+    ("size", Pt(12), Pt(24)),
+]
+
+
+@pytest.fixture(
+    scope="session",
+    params=_RUN_ATTRIBUTE_DIFFS,
+    ids=[attr for attr, _, _ in _RUN_ATTRIBUTE_DIFFS],
+)
+def run_attribute_diff_docs(
+    request: pytest.FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> tuple[Path, Path]:
+    """Single-run documents differing only in one run attribute."""
+    attr, original_value, rebuilt_value = request.param
+    return _save_pair(
+        tmp_path_factory.mktemp("fidelity"),
+        _run_doc(**{attr: original_value}),
+        _run_doc(**{attr: rebuilt_value}),
+    )
+
+
+@pytest.fixture(scope="session")
+def many_paras_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Document with ten heading/paragraph pairs."""
+    path = tmp_path_factory.mktemp("fidelity") / "many.docx"
+    doc = Document()
+    for i in range(10):
+        doc.add_heading(f"Heading {i}", level=1)
+        doc.add_paragraph(f"Paragraph {i}")
+    doc.save(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def minimal_content_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Document with a single "Minimal content" paragraph."""
+    path = tmp_path_factory.mktemp("fidelity") / "minimal.docx"
+    doc = Document()
+    doc.add_paragraph("Minimal content")
+    doc.save(str(path))
+    return path
+
+
+@pytest.fixture(scope="session")
+def empty_paras_docx(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Document with a single empty paragraph and no runs."""
+    path = tmp_path_factory.mktemp("fidelity") / "empty.docx"
+    doc = Document()
+    doc.add_paragraph()
+    doc.save(str(path))
+    return path
+
 
 class TestFidelityStructuralScorer:
     """Test the structural fidelity scorer (US-013)."""
@@ -26,93 +158,97 @@ class TestFidelityStructuralScorer:
 
         assert FidelityScorer is not None
 
-    def test_score_structure_returns_numeric(self) -> None:
+    def test_score_structure_returns_numeric(self, tmp_path: Path) -> None:
         """Test that score_structure returns a 0-100 score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        # Comparing a document to itself should return 100
-        score = scorer.score_structure(simple_docx, simple_docx)
+        # Comparing a document to a copy of itself should return 100
+        score = scorer.score_structure(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert isinstance(score, (int, float))
         assert 0 <= score <= 100
 
-    def test_identical_documents_score_100(self) -> None:
+    def test_identical_documents_score_100(self, tmp_path: Path) -> None:
         """Test that identical documents get a perfect structural score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_structure(simple_docx, simple_docx)
+        score = scorer.score_structure(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert score == 100
 
-    def test_different_heading_counts_reduce_score(self) -> None:
-        """Test that different heading counts reduce the score."""
+    def test_identical_paths_skip_extraction(self) -> None:
+        """Test that scoring a file against itself does not parse it."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
+        simple_docx = _FIXTURES["simple"]
 
-        # Create two temporary documents with different heading counts
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            # Original: 2 headings
-            doc1 = Document()
-            doc1.add_heading("Heading 1", level=1)
-            doc1.add_paragraph("Content 1")
-            doc1.add_heading("Heading 2", level=2)
-            doc1.add_paragraph("Content 2")
-            doc1.save(str(original_path))
+        with patch.object(scorer, "_fast_counts") as mock_count, patch.object(
+            scorer, "_extract_all_run_formatting"
+        ) as mock_formatting:
+            assert scorer.score_structure(simple_docx, str(simple_docx)) == 100
+            assert scorer.score_formatting(simple_docx, simple_docx) == 100
 
-            # Rebuilt: 1 heading (missing one)
-            doc2 = Document()
-            doc2.add_heading("Heading 1", level=1)
-            doc2.add_paragraph("Content 1")
-            doc2.add_paragraph("Content 2")  # No heading here
-            doc2.save(str(rebuilt_path))
+        mock_count.assert_not_called()
+        mock_formatting.assert_not_called()
 
-            score = scorer.score_structure(original_path, rebuilt_path)
-
-            assert score < 100
+    def test_identical_paths_extract_original_only(self) -> None:
+        """Test that the table, hyperlink and track change scores skip the rebuilt side."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
-    def test_different_paragraph_counts_reduce_score(self) -> None:
-        """Test that different paragraph counts reduce the score."""
+        scorer = FidelityScorer()
+        cases = [
+            ("score_tables", "_extract_tables_metadata", _FIXTURES["tables_simple"]),
+            ("score_hyperlinks", "_extract_hyperlinks", _FIXTURES["hyperlinks"]),
+            ("score_track_changes", "_extract_track_changes", _FIXTURES["track_changes_simple"]),
+        ]
+
+        for score_name, extract_name, docx_path in cases:
+            with patch.object(
+                scorer, extract_name, wraps=getattr(scorer, extract_name)
+            ) as mock_extract:
+                assert getattr(scorer, score_name)(docx_path, docx_path) == 100
+
+            assert mock_extract.call_count == 1
+
+    def test_different_heading_counts_reduce_score(
+        self, two_heading_docs: tuple[Path, Path]
+    ) -> None:
+        """Test that different heading counts reduce the score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
+        original_path, rebuilt_path = two_heading_docs
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
+        score = scorer.score_structure(original_path, rebuilt_path)
 
-            # Original: 3 paragraphs
-            doc1 = Document()
-            doc1.add_paragraph("Paragraph 1")
-            doc1.add_paragraph("Paragraph 2")
-            doc1.add_paragraph("Paragraph 3")
-            doc1.save(str(original_path))
+        assert score < 100
 
-            # Rebuilt: 2 paragraphs
-            doc2 = Document()
-            doc2.add_paragraph("Paragraph 1")
-            doc2.add_paragraph("Paragraph 2")
-            doc2.save(str(rebuilt_path))
+    def test_different_paragraph_counts_reduce_score(
+        self, two_para_count_docs: tuple[Path, Path]
+    ) -> None:
+        """Test that different paragraph counts reduce the score."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
-            score = scorer.score_structure(original_path, rebuilt_path)
+        scorer = FidelityScorer()
+        original_path, rebuilt_path = two_para_count_docs
 
-            assert score < 100
+        score = scorer.score_structure(original_path, rebuilt_path)
+
+        assert score < 100
 
     def test_different_list_item_counts_reduce_score(self) -> None:
         """Test that different list item counts reduce the score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        lists_docx = SYNTHETIC_DIR / "lists.docx"
+        lists_docx = _FIXTURES["lists"]
 
         with tempfile.TemporaryDirectory() as tmp_dir:
             rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
@@ -127,40 +263,27 @@ class TestFidelityStructuralScorer:
             # Should be less than 100 due to missing list items
             assert score < 100
 
-    def test_score_never_negative(self) -> None:
+    def test_score_never_negative(
+        self, many_paras_docx: Path, minimal_content_docx: Path
+    ) -> None:
         """Test that the score is never negative."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            # Original: lots of structure
-            doc1 = Document()
-            for i in range(10):
-                doc1.add_heading(f"Heading {i}", level=1)
-                doc1.add_paragraph(f"Paragraph {i}")
-            doc1.save(str(original_path))
-
-            # Rebuilt: minimal structure
-            doc2 = Document()
-            doc2.add_paragraph("Minimal content")
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_structure(original_path, rebuilt_path)
+        # Original: lots of structure; rebuilt: minimal structure
+        score = scorer.score_structure(many_paras_docx, minimal_content_docx)
 
-            assert score >= 0
+        assert score >= 0
 
-    def test_accepts_path_strings(self) -> None:
+    def test_accepts_path_strings(self, tmp_path: Path) -> None:
         """Test that score_structure accepts string paths."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = str(SYNTHETIC_DIR / "simple.docx")
+        simple_docx = str(_FIXTURES["simple"])
 
-        score = scorer.score_structure(simple_docx, simple_docx)
+        score = scorer.score_structure(simple_docx, str(_copy_as_rebuilt(simple_docx, tmp_path)))
 
         assert score == 100
 
@@ -196,8 +319,8 @@ class TestFidelityStructureEnhanced:
 
             assert score < 100
 
-    def test_extract_heading_levels(self) -> None:
-        """Test _extract_heading_levels returns correct ordered levels."""
+    def test_fast_counts_heading_levels(self) -> None:
+        """Test _fast_counts returns correct ordered heading levels."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
@@ -213,10 +336,80 @@ class TestFidelityStructureEnhanced:
             doc.add_heading("H1b", level=1)
             doc.save(str(doc_path))
 
-            levels = scorer._extract_heading_levels(doc_path)
+            levels, _ = scorer._fast_counts(doc_path)
 
             assert levels == [1, 2, 2, 1]
 
+    def test_read_paragraph_style_names_includes_untyped_styles(self) -> None:
+        """Test untyped styles are paragraph styles and the last w:default wins."""
+        from benchmarks.metrics.fidelity_scorer import _read_paragraph_style_names
+
+        w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        styles_xml = (
+            f'<w:styles xmlns:w="{w}">'
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+            '<w:name w:val="Normal"/></w:style>'
+            '<w:style w:styleId="Untyped"><w:name w:val="Untyped"/></w:style>'
+            '<w:style w:type="character" w:styleId="Emph"><w:name w:val="Emph"/></w:style>'
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Body">'
+            '<w:name w:val="Body"/></w:style>'
+            "</w:styles>"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            archive_path = Path(tmp_dir) / "styles.zip"
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("word/styles.xml", styles_xml)
+            with zipfile.ZipFile(archive_path) as archive:
+                names_by_id, default_name = _read_paragraph_style_names(archive)
+
+        assert names_by_id == {"Normal": "Normal", "Untyped": "Untyped", "Body": "Body"}
+        assert default_name == "Body"
+
+    def test_read_paragraph_style_names_accepts_untyped_default(self) -> None:
+        """Test an untyped w:default style is the paragraph default."""
+        from benchmarks.metrics.fidelity_scorer import _read_paragraph_style_names
+
+        w = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+        styles_xml = (
+            f'<w:styles xmlns:w="{w}">'
+            '<w:style w:type="paragraph" w:default="1" w:styleId="Normal">'
+            '<w:name w:val="Normal"/></w:style>'
+            '<w:style w:default="1" w:styleId="Plain"><w:name w:val="Plain"/></w:style>'
+            "</w:styles>"
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            archive_path = Path(tmp_dir) / "styles.zip"
+            with zipfile.ZipFile(archive_path, "w") as archive:
+                archive.writestr("word/styles.xml", styles_xml)
+            with zipfile.ZipFile(archive_path) as archive:
+                _, default_name = _read_paragraph_style_names(archive)
+
+        assert default_name == "Plain"
+
+    def test_fast_counts_ignores_paragraphs_inside_tables(self) -> None:
+        """Test _fast_counts counts only top-level body blocks."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        scorer = FidelityScorer()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            doc_path = Path(tmp_dir) / "test.docx"
+
+            doc = Document()
+            doc.add_heading("H1", level=1)
+            doc.add_paragraph("Content")
+            table = doc.add_table(rows=2, cols=2)
+            table.cell(0, 0).add_paragraph("Nested")
+            doc.add_heading("H2", level=2)
+            doc.save(str(doc_path))
+
+            levels, counts = scorer._fast_counts(doc_path)
+
+            assert levels == [1, 2]
+            assert counts == {"headings": 2, "paragraphs": 1, "list_items": 0, "tables": 1}
+
     def test_table_count_difference_reduces_score(self) -> None:
         """Test that different table counts reduce the structural score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
@@ -259,7 +452,7 @@ class TestFidelityStructureEnhanced:
             doc.add_paragraph("Content")
             doc.save(str(doc_path))
 
-            score = scorer.score_structure(doc_path, doc_path)
+            score = scorer.score_structure(doc_path, _copy_as_rebuilt(doc_path, Path(tmp_dir)))
 
             assert score == 100.0
 
@@ -275,177 +468,55 @@ class TestFidelityFormatting:
         assert hasattr(scorer, "score_formatting")
         assert callable(getattr(scorer, "score_formatting"))
 
-    def test_score_formatting_returns_numeric(self) -> None:
+    def test_score_formatting_returns_numeric(self, tmp_path: Path) -> None:
         """Test that score_formatting returns a 0-100 score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        formatted_docx = SYNTHETIC_DIR / "formatted.docx"
+        formatted_docx = _FIXTURES["formatted"]
 
-        score = scorer.score_formatting(formatted_docx, formatted_docx)
+        score = scorer.score_formatting(formatted_docx, _copy_as_rebuilt(formatted_docx, tmp_path))
 
         assert isinstance(score, (int, float))
         assert 0 <= score <= 100
 
-    def test_identical_documents_score_100(self) -> None:
+    def test_identical_documents_score_100(self, tmp_path: Path) -> None:
         """Test that identical documents get a perfect formatting score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        formatted_docx = SYNTHETIC_DIR / "formatted.docx"
+        formatted_docx = _FIXTURES["formatted"]
 
-        score = scorer.score_formatting(formatted_docx, formatted_docx)
+        score = scorer.score_formatting(formatted_docx, _copy_as_rebuilt(formatted_docx, tmp_path))
 
         assert score == 100.0
 
-    def test_different_bold_reduces_score(self) -> None:
-        """Test that different bold settings reduce the formatting score."""
-        from benchmarks.metrics.fidelity_scorer import FidelityScorer
-
-        scorer = FidelityScorer()
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            # Original: bold text
-            doc1 = Document()
-            para = doc1.add_paragraph()
-            run = para.add_run("Test content")
-            run.bold = True
-            doc1.save(str(original_path))
-
-            # Rebuilt: no bold
-            doc2 = Document()
-            para = doc2.add_paragraph()
-            run = para.add_run("Test content")
-            run.bold = False
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_formatting(original_path, rebuilt_path)
-
-            assert score < 100
-
-    def test_different_italic_reduces_score(self) -> None:
-        """Test that different italic settings reduce the formatting score."""
-        from benchmarks.metrics.fidelity_scorer import FidelityScorer
-
-        scorer = FidelityScorer()
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            doc1 = Document()
-            para = doc1.add_paragraph()
-            run = para.add_run("Test content")
-            run.italic = True
-            doc1.save(str(original_path))
-
-            doc2 = Document()
-            para = doc2.add_paragraph()
-            run = para.add_run("Test content")
-            run.italic = False
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_formatting(original_path, rebuilt_path)
-
-            assert score < 100
-
-    def test_different_underline_reduces_score(self) -> None:
-        """Test that different underline settings reduce the formatting score."""
-        from benchmarks.metrics.fidelity_scorer import FidelityScorer
-
-        scorer = FidelityScorer()
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            doc1 = Document()
-            para = doc1.add_paragraph()
-            run = para.add_run("Test content")
-            run.underline = True
-            doc1.save(str(original_path))
-
-            doc2 = Document()
-            para = doc2.add_paragraph()
-            run = para.add_run("Test content")
-            run.underline = False
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_formatting(original_path, rebuilt_path)
-
-            assert score < 100
-
-    def test_different_font_name_reduces_score(self) -> None:
-        """Test that different font names reduce the formatting score."""
-        from benchmarks.metrics.fidelity_scorer import FidelityScorer
-
-        scorer = FidelityScorer()
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            doc1 = Document()
-            para = doc1.add_paragraph()
-            run = para.add_run("Test content")
-            run.font.name = "Arial"
-            doc1.save(str(original_path))
-
-            doc2 = Document()
-            para = doc2.add_paragraph()
-            run = para.add_run("Test content")
-            run.font.name = "Times New Roman"
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_formatting(original_path, rebuilt_path)
-
-            assert score < 100
-
-    def test_different_font_size_reduces_score(self) -> None:
-        """Test that different font sizes reduce the formatting score."""
+    def test_different_run_attribute_reduces_score(
+        self, run_attribute_diff_docs: tuple[Path, Path]
+    ) -> None:
+        """Test that a differing bold, italic, underline, font name or size reduces the score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
+        original_path, rebuilt_path = run_attribute_diff_docs
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            original_path = Path(tmp_dir) / "original.docx"
-            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
-
-            doc1 = Document()
-            para = doc1.add_paragraph()
-            run = para.add_run("Test content")
-            run.font.size = Pt(12)
-            doc1.save(str(original_path))
-
-            doc2 = Document()
-            para = doc2.add_paragraph()
-            run = para.add_run("Test content")
-            run.font.size = Pt(24)
-            doc2.save(str(rebuilt_path))
-
-            score = scorer.score_formatting(original_path, rebuilt_path)
+        score = scorer.score_formatting(original_path, rebuilt_path)
 
-            assert score < 100
+        assert score < 100
 
-    def test_no_paragraphs_with_runs_returns_100(self) -> None:
+    def test_no_paragraphs_with_runs_returns_100(
+        self, empty_paras_docx: Path, tmp_path: Path
+    ) -> None:
         """Test that documents with no runs return 100."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
 
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            doc_path = Path(tmp_dir) / "empty.docx"
-
-            doc = Document()
-            doc.add_paragraph()  # empty paragraph, no runs
-            doc.save(str(doc_path))
-
-            score = scorer.score_formatting(doc_path, doc_path)
+        score = scorer.score_formatting(
+            empty_paras_docx, _copy_as_rebuilt(empty_paras_docx, tmp_path)
+        )
 
-            assert score == 100.0
+        assert score == 100.0
 
     def test_multiple_runs_per_paragraph_compared(self) -> None:
         """Test that all runs in a paragraph are compared, not just the first."""
@@ -477,14 +548,14 @@ class TestFidelityFormatting:
 
             assert score < 100
 
-    def test_score_styles_deprecated_wrapper(self) -> None:
+    def test_score_styles_deprecated_wrapper(self, tmp_path: Path) -> None:
         """Test that score_styles still works as a deprecated wrapper."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        formatted_docx = SYNTHETIC_DIR / "formatted.docx"
+        formatted_docx = _FIXTURES["formatted"]
 
-        score = scorer.score_styles(formatted_docx, formatted_docx)
+        score = scorer.score_styles(formatted_docx, _copy_as_rebuilt(formatted_docx, tmp_path))
 
         assert score == 100.0
 
@@ -535,25 +606,25 @@ class TestFidelityTables:
         assert hasattr(scorer, "score_tables")
         assert callable(getattr(scorer, "score_tables"))
 
-    def test_identical_tables_score_100(self) -> None:
+    def test_identical_tables_score_100(self, tmp_path: Path) -> None:
         """Test that identical table documents get 100."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        tables_docx = SYNTHETIC_DIR / "tables_simple.docx"
+        tables_docx = _FIXTURES["tables_simple"]
 
-        score = scorer.score_tables(tables_docx, tables_docx)
+        score = scorer.score_tables(tables_docx, _copy_as_rebuilt(tables_docx, tmp_path))
 
         assert score == 100.0
 
-    def test_no_tables_returns_none(self) -> None:
+    def test_no_tables_returns_none(self, tmp_path: Path) -> None:
         """Test that documents without tables return None."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_tables(simple_docx, simple_docx)
+        score = scorer.score_tables(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert score is None
 
@@ -621,7 +692,7 @@ class TestFidelityTables:
             doc.add_table(rows=2, cols=2)
             doc.save(str(doc_path))
 
-            score = scorer.score_tables(doc_path, doc_path)
+            score = scorer.score_tables(doc_path, _copy_as_rebuilt(doc_path, Path(tmp_dir)))
 
             assert score is not None
             assert 0 <= score <= 100
@@ -660,25 +731,27 @@ class TestFidelityHyperlinks:
         assert hasattr(scorer, "score_hyperlinks")
         assert callable(getattr(scorer, "score_hyperlinks"))
 
-    def test_identical_hyperlinks_score_100(self) -> None:
+    def test_identical_hyperlinks_score_100(self, tmp_path: Path) -> None:
         """Test that identical hyperlink documents get 100."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        hyperlinks_docx = SYNTHETIC_DIR / "hyperlinks.docx"
+        hyperlinks_docx = _FIXTURES["hyperlinks"]
 
-        score = scorer.score_hyperlinks(hyperlinks_docx, hyperlinks_docx)
+        score = scorer.score_hyperlinks(
+            hyperlinks_docx, _copy_as_rebuilt(hyperlinks_docx, tmp_path)
+        )
 
         assert score == 100.0
 
-    def test_no_hyperlinks_returns_none(self) -> None:
+    def test_no_hyperlinks_returns_none(self, tmp_path: Path) -> None:
         """Test that documents without hyperlinks return None."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_hyperlinks(simple_docx, simple_docx)
+        score = scorer.score_hyperlinks(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert score is None
 
@@ -743,25 +816,25 @@ class TestFidelityTrackChanges:
         assert hasattr(scorer, "score_track_changes")
         assert callable(getattr(scorer, "score_track_changes"))
 
-    def test_identical_track_changes_score_100(self) -> None:
+    def test_identical_track_changes_score_100(self, tmp_path: Path) -> None:
         """Test that identical track change documents get 100."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        tc_docx = SYNTHETIC_DIR / "track_changes_simple.docx"
+        tc_docx = _FIXTURES["track_changes_simple"]
 
-        score = scorer.score_track_changes(tc_docx, tc_docx)
+        score = scorer.score_track_changes(tc_docx, _copy_as_rebuilt(tc_docx, tmp_path))
 
         assert score == 100.0
 
-    def test_no_track_changes_returns_none(self) -> None:
+    def test_no_track_changes_returns_none(self, tmp_path: Path) -> None:
         """Test that documents without track changes return None."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_track_changes(simple_docx, simple_docx)
+        score = scorer.score_track_changes(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert score is None
 
@@ -770,7 +843,7 @@ class TestFidelityTrackChanges:
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        tc_docx = SYNTHETIC_DIR / "track_changes_simple.docx"
+        tc_docx = _FIXTURES["track_changes_simple"]
 
         result = scorer._extract_track_changes(tc_docx)
 
@@ -791,7 +864,7 @@ class TestFidelityTrackChanges:
 
         with tempfile.TemporaryDirectory() as tmp_dir:
             # Use a track changes doc as original, and simple doc as rebuilt
-            tc_docx = SYNTHETIC_DIR / "track_changes_simple.docx"
+            tc_docx = _FIXTURES["track_changes_simple"]
             no_tc_path = Path(tmp_dir) / "no_tc.docx"
 
             doc = Document()
@@ -808,14 +881,14 @@ class TestFidelityTrackChanges:
 class TestFidelityTotalUpdated:
     """Test the updated score_total with new dimensions."""
 
-    def test_score_total_returns_all_dimension_keys(self) -> None:
+    def test_score_total_returns_all_dimension_keys(self, tmp_path: Path) -> None:
         """Test that score_total returns dict with all 5 dimensions + visual + total."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert isinstance(result, dict)
         assert "structure" in result
@@ -826,15 +899,15 @@ class TestFidelityTotalUpdated:
         assert "visual" in result
         assert "total" in result
 
-    def test_score_total_excludes_none_from_average(self) -> None:
+    def test_score_total_excludes_none_from_average(self, tmp_path: Path) -> None:
         """Test that None dimensions are excluded from the total average."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
         # simple.docx has no tables, hyperlinks, or track changes
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         # tables, hyperlinks, track_changes should be None
         assert result["tables"] is None
@@ -844,52 +917,52 @@ class TestFidelityTotalUpdated:
         expected = (result["structure"] + result["formatting"]) / 2
         assert abs(result["total"] - expected) < 0.01
 
-    def test_score_total_with_tables(self) -> None:
+    def test_score_total_with_tables(self, tmp_path: Path) -> None:
         """Test that total includes table score when tables are present."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        tables_docx = SYNTHETIC_DIR / "tables_simple.docx"
+        tables_docx = _FIXTURES["tables_simple"]
 
-        result = scorer.score_total(tables_docx, tables_docx)
+        result = scorer.score_total(tables_docx, _copy_as_rebuilt(tables_docx, tmp_path))
 
         assert result["tables"] is not None
         assert result["tables"] == 100.0
         # Total should include tables in the average
         assert result["total"] >= 90
 
-    def test_score_total_with_hyperlinks(self) -> None:
+    def test_score_total_with_hyperlinks(self, tmp_path: Path) -> None:
         """Test that total includes hyperlink score when hyperlinks are present."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        hyperlinks_docx = SYNTHETIC_DIR / "hyperlinks.docx"
+        hyperlinks_docx = _FIXTURES["hyperlinks"]
 
-        result = scorer.score_total(hyperlinks_docx, hyperlinks_docx)
+        result = scorer.score_total(hyperlinks_docx, _copy_as_rebuilt(hyperlinks_docx, tmp_path))
 
         assert result["hyperlinks"] is not None
         assert result["hyperlinks"] == 100.0
 
-    def test_score_total_with_track_changes(self) -> None:
+    def test_score_total_with_track_changes(self, tmp_path: Path) -> None:
         """Test that total includes track change score when track changes are present."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        tc_docx = SYNTHETIC_DIR / "track_changes_simple.docx"
+        tc_docx = _FIXTURES["track_changes_simple"]
 
-        result = scorer.score_total(tc_docx, tc_docx)
+        result = scorer.score_total(tc_docx, _copy_as_rebuilt(tc_docx, tmp_path))
 
         assert result["track_changes"] is not None
         assert result["track_changes"] == 100.0
 
-    def test_score_total_visual_not_in_total_calculation(self) -> None:
+    def test_score_total_visual_not_in_total_calculation(self, tmp_path: Path) -> None:
         """Test that visual is reported but not included in total calculation."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         # Total should be mean of non-None dimensions, NOT including visual
         non_null = []
@@ -899,31 +972,61 @@ class TestFidelityTotalUpdated:
         expected_total = sum(non_null) / len(non_null) if non_null else 0
         assert abs(result["total"] - expected_total) < 0.01
 
-    def test_score_total_identical_documents_score_high(self) -> None:
+    def test_score_total_identical_documents_score_high(self, tmp_path: Path) -> None:
         """Test that identical documents get high combined score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert result["structure"] == 100
         assert result["formatting"] == 100
         assert result["total"] >= 90
 
+    def test_score_total_parses_each_document_once(self) -> None:
+        """Test that score_total parses each document once per call, not across calls."""
+        from benchmarks.metrics import fidelity_scorer
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        scorer = FidelityScorer()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            original_path = Path(tmp_dir) / "original.docx"
+            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
+            Document().save(str(original_path))
+            Document().save(str(rebuilt_path))
+
+            with patch.object(
+                fidelity_scorer, "Document", wraps=fidelity_scorer.Document
+            ) as mock_document, patch.object(
+                scorer, "score_visual", side_effect=RuntimeError("soffice missing")
+            ):
+                scorer.score_total(original_path, rebuilt_path)
+                assert mock_document.call_count == 2
 
-def visual_scorer_available() -> bool:
-    """Check if visual scoring dependencies (LibreOffice, Poppler) are available."""
-    from benchmarks.metrics.fidelity_scorer import _SOFFICE_CANDIDATES
+                # Nothing is kept between calls
+                scorer.score_total(original_path, rebuilt_path)
+                assert mock_document.call_count == 4
 
-    return any(shutil.which(p) for p in _SOFFICE_CANDIDATES) and shutil.which("pdfinfo") is not None
+            assert scorer._documents is None
 
+    def test_score_total_skips_visual_without_libreoffice(self) -> None:
+        """Test that score_total does not attempt visual scoring without soffice."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
-visual_scorer_skip = pytest.mark.skipif(
-    not visual_scorer_available(),
-    reason="Visual scoring requires LibreOffice and Poppler (pdfinfo)"
-)
+        scorer = FidelityScorer()
+        simple_docx = _FIXTURES["simple"]
+        formatted_docx = _FIXTURES["formatted"]
+
+        with patch(
+            "benchmarks.metrics.fidelity_scorer._find_soffice", return_value=None
+        ), patch.object(scorer, "score_visual") as mock_visual:
+            result = scorer.score_total(simple_docx, formatted_docx)
+
+        mock_visual.assert_not_called()
+        assert result["visual"] is None
 
 
 class TestFidelityVisualScorer:
@@ -937,32 +1040,32 @@ class TestFidelityVisualScorer:
         assert hasattr(scorer, "score_visual")
         assert callable(getattr(scorer, "score_visual"))
 
-    @visual_scorer_skip
-    def test_score_visual_returns_numeric(self) -> None:
+    @pytest.mark.usefixtures("visual_available")
+    def test_score_visual_returns_numeric(self, tmp_path: Path) -> None:
         """Test that score_visual returns a 0-100 score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_visual(simple_docx, simple_docx)
+        score = scorer.score_visual(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert isinstance(score, (int, float))
         assert 0 <= score <= 100
 
-    @visual_scorer_skip
-    def test_identical_documents_score_high(self) -> None:
+    @pytest.mark.usefixtures("visual_available")
+    def test_identical_documents_score_high(self, tmp_path: Path) -> None:
         """Test that identical documents get a high visual score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        score = scorer.score_visual(simple_docx, simple_docx)
+        score = scorer.score_visual(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert score >= 95
 
-    @visual_scorer_skip
+    @pytest.mark.usefixtures("visual_available")
     def test_different_documents_score_lower(self) -> None:
         """Test that visually different documents get a lower score."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
@@ -988,27 +1091,27 @@ class TestFidelityVisualScorer:
 
             assert score < 100
 
-    @visual_scorer_skip
-    def test_score_visual_accepts_path_strings(self) -> None:
+    @pytest.mark.usefixtures("visual_available")
+    def test_score_visual_accepts_path_strings(self, tmp_path: Path) -> None:
         """Test that score_visual accepts string paths."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = str(SYNTHETIC_DIR / "simple.docx")
+        simple_docx = str(_FIXTURES["simple"])
 
-        score = scorer.score_visual(simple_docx, simple_docx)
+        score = scorer.score_visual(simple_docx, str(_copy_as_rebuilt(simple_docx, tmp_path)))
 
         assert score >= 95
 
-    def test_score_visual_handles_missing_dependencies(self) -> None:
+    def test_score_visual_handles_missing_dependencies(self, tmp_path: Path) -> None:
         """Test that score_visual raises clear error for missing dependencies."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
         try:
-            score = scorer.score_visual(simple_docx, simple_docx)
+            score = scorer.score_visual(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
             assert 0 <= score <= 100
         except Exception as e:
             error_msg = str(e).lower()
@@ -1020,6 +1123,119 @@ class TestFidelityVisualScorer:
             )
 
 
+    def test_score_visual_identical_path_short_circuits(self) -> None:
+        """Test that comparing a file with itself skips rendering entirely."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        scorer = FidelityScorer()
+        simple_docx = _FIXTURES["simple"]
+
+        with patch("benchmarks.metrics.fidelity_scorer.subprocess.run") as mock_run:
+            score = scorer.score_visual(simple_docx, simple_docx)
+
+        assert score == 100.0
+        mock_run.assert_not_called()
+
+    def test_render_first_page_returns_image(self) -> None:
+        """Test that the first page of a PDF is rasterized in-process."""
+        pytest.importorskip("pypdfium2")
+        import io
+
+        from PIL import Image
+
+        from benchmarks.metrics.fidelity_scorer import _render_first_page
+
+        buf = io.BytesIO()
+        Image.new("RGB", (72, 144), "white").save(buf, "PDF", resolution=72)
+
+        image = _render_first_page(buf.getvalue(), dpi=144)
+
+        assert image is not None
+        assert image.size == (144, 288)
+
+    def test_convert_docx_to_pdfs_uses_one_soffice_call(self) -> None:
+        """Test that both documents convert in one cached soffice launch."""
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        def fake_soffice(cmd: list[str], **kwargs: object) -> None:
+            outdir = Path(cmd[cmd.index("--outdir") + 1])
+            for src in cmd[cmd.index("--outdir") + 2:]:
+                (outdir / f"{Path(src).stem}.pdf").write_bytes(Path(src).stem.encode())
+
+        scorer = FidelityScorer()
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            original_path = Path(tmp_dir) / "original.docx"
+            rebuilt_path = Path(tmp_dir) / "rebuilt.docx"
+            Document().save(str(original_path))
+            Document().save(str(rebuilt_path))
+
+            with patch(
+                "benchmarks.metrics.fidelity_scorer._find_soffice", return_value="soffice"
+            ), patch(
+                "benchmarks.metrics.fidelity_scorer.subprocess.run", side_effect=fake_soffice
+            ) as mock_run:
+                for _ in range(2):
+                    with tempfile.TemporaryDirectory() as out_dir:
+                        pdfs = scorer._convert_docx_to_pdfs(
+                            [original_path, rebuilt_path], Path(out_dir)
+                        )
+
+            assert pdfs == [b"original", b"rebuilt"]
+            assert mock_run.call_count == 1
+
+    def test_identical_pdfs_skip_render(self) -> None:
+        """Test that byte-identical PDFs score 100 without rendering."""
+        pytest.importorskip("imagehash")
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        scorer = FidelityScorer()
+
+        with patch(
+            "benchmarks.metrics.fidelity_scorer._find_soffice", return_value="soffice"
+        ), patch.object(
+            scorer, "_convert_docx_to_pdfs", return_value=[b"%PDF", b"%PDF"]
+        ), patch(
+            "benchmarks.metrics.fidelity_scorer._render_first_page"
+        ) as mock_render:
+            score = scorer.score_visual(_FIXTURES["simple"], _FIXTURES["formatted"])
+
+        assert score == 100.0
+        mock_render.assert_not_called()
+
+    def test_different_pdfs_use_full_render(self) -> None:
+        """Test that differing PDFs are compared at full resolution."""
+        pytest.importorskip("pypdfium2")
+        pytest.importorskip("imagehash")
+        import io
+
+        from PIL import Image
+
+        from benchmarks.metrics import fidelity_scorer
+        from benchmarks.metrics.fidelity_scorer import FidelityScorer
+
+        pdfs = []
+        for color in ("white", "black"):
+            buf = io.BytesIO()
+            Image.new("RGB", (72, 144), color).save(buf, "PDF", resolution=72)
+            pdfs.append(buf.getvalue())
+
+        scorer = FidelityScorer()
+
+        with patch(
+            "benchmarks.metrics.fidelity_scorer._find_soffice", return_value="soffice"
+        ), patch.object(
+            scorer, "_convert_docx_to_pdfs", return_value=pdfs
+        ), patch(
+            "benchmarks.metrics.fidelity_scorer._render_first_page",
+            wraps=fidelity_scorer._render_first_page,
+        ) as mock_render:
+            scorer.score_visual(_FIXTURES["simple"], _FIXTURES["formatted"])
+
+        assert mock_render.call_count == 2
+        assert all("dpi" not in c.kwargs for c in mock_render.call_args_list)
+
+
 class TestFidelityCombinedScorer:
     """Test the combined fidelity scorer (US-016) - backward compatibility."""
 
@@ -1031,14 +1247,14 @@ class TestFidelityCombinedScorer:
         assert hasattr(scorer, "score_total")
         assert callable(getattr(scorer, "score_total"))
 
-    def test_score_total_returns_dict(self) -> None:
+    def test_score_total_returns_dict(self, tmp_path: Path) -> None:
         """Test that score_total returns a dict with expected keys."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         assert isinstance(result, dict)
         assert "structure" in result
@@ -1046,14 +1262,14 @@ class TestFidelityCombinedScorer:
         assert "visual" in result
         assert "total" in result
 
-    def test_score_total_returns_numeric_scores(self) -> None:
+    def test_score_total_returns_numeric_scores(self, tmp_path: Path) -> None:
         """Test that non-None scores are numeric 0-100."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = SYNTHETIC_DIR / "simple.docx"
+        simple_docx = _FIXTURES["simple"]
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, _copy_as_rebuilt(simple_docx, tmp_path))
 
         for key in ["structure", "formatting", "total"]:
             assert isinstance(result[key], (int, float))
@@ -1063,14 +1279,14 @@ class TestFidelityCombinedScorer:
             assert isinstance(result["visual"], (int, float))
             assert 0 <= result["visual"] <= 100
 
-    def test_score_total_accepts_path_strings(self) -> None:
+    def test_score_total_accepts_path_strings(self, tmp_path: Path) -> None:
         """Test that score_total accepts string paths."""
         from benchmarks.metrics.fidelity_scorer import FidelityScorer
 
         scorer = FidelityScorer()
-        simple_docx = str(SYNTHETIC_DIR / "simple.docx")
+        simple_docx = str(_FIXTURES["simple"])
 
-        result = scorer.score_total(simple_docx, simple_docx)
+        result = scorer.score_total(simple_docx, str(_copy_as_rebuilt(simple_docx, tmp_path)))
 
         assert "total" in result
         assert result["total"] >= 90
@@ -1,12 +1,18 @@
 """Tests for report generator CLI (US-024 to US-028)."""
 
 import json
-import tempfile
 from pathlib import Path
 
 import pytest
 from click.testing import CliRunner
 
+from benchmarks.generate_report import (
+    calculate_pipeline_fidelity,
+    cli,
+    generate_fidelity_section,
+    generate_report,
+)
+
 
 # Sample results data for testing
 SAMPLE_RESULTS = {
@@ -41,6 +47,16 @@ SAMPLE_RESULTS = {
     ],
 }
 
+# SAMPLE_RESULTS serialized once for tests that feed it to the CLI
+_SAMPLE_RESULTS_BYTES = json.dumps(SAMPLE_RESULTS).encode()
+
+
+@pytest.fixture(scope="session")
+def sample_report() -> tuple[str, str]:
+    """Report generated once from SAMPLE_RESULTS, plus its lowercased form."""
+    report = generate_report(SAMPLE_RESULTS)
+    return report, report.lower()
+
 
 class TestReportGenerator:
     """Test the report generator CLI (US-024)."""
@@ -60,143 +76,114 @@ class TestReportGenerator:
         """Test that cli is a Click command."""
         import click
 
-        from benchmarks.generate_report import cli
-
         assert isinstance(cli, click.core.Command)
 
     def test_cli_takes_input_file(self) -> None:
         """Test that CLI takes input file argument."""
-        from benchmarks.generate_report import cli
-
         runner = CliRunner()
         result = runner.invoke(cli, ["--help"])
 
-        assert "input" in result.output.lower() or "file" in result.output.lower()
+        output_lower = result.output.lower()
+        assert "input" in output_lower or "file" in output_lower
 
-    def test_cli_outputs_markdown(self) -> None:
+    def test_cli_outputs_markdown(self, tmp_path: Path) -> None:
         """Test that CLI outputs markdown report."""
-        from benchmarks.generate_report import cli
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            input_path = Path(tmp_dir) / "results.json"
-            output_path = Path(tmp_dir) / "report.md"
+        input_path = tmp_path / "results.json"
+        output_path = tmp_path / "report.md"
 
-            with open(input_path, "w") as f:
-                json.dump(SAMPLE_RESULTS, f)
+        input_path.write_bytes(_SAMPLE_RESULTS_BYTES)
 
-            runner = CliRunner()
-            result = runner.invoke(
-                cli, [str(input_path), "--output", str(output_path)]
-            )
+        runner = CliRunner()
+        result = runner.invoke(
+            cli, [str(input_path), "--output", str(output_path)]
+        )
 
-            assert result.exit_code == 0
-            assert output_path.exists()
+        assert result.exit_code == 0
+        assert output_path.exists()
 
 
 class TestReportExecutiveSummary:
     """Test the executive summary section (US-025)."""
 
-    def test_report_has_executive_summary(self) -> None:
+    def test_report_has_executive_summary(self, sample_report: tuple[str, str]) -> None:
         """Test that report includes executive summary section."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         assert "## Executive Summary" in report
 
-    def test_executive_summary_has_token_reduction(self) -> None:
+    def test_executive_summary_has_token_reduction(self, sample_report: tuple[str, str]) -> None:
         """Test that executive summary shows token reduction."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention tokens or reduction
-        assert "token" in report.lower()
+        assert "token" in report_lower
 
-    def test_executive_summary_has_fidelity_comparison(self) -> None:
+    def test_executive_summary_has_fidelity_comparison(self, sample_report: tuple[str, str]) -> None:
         """Test that executive summary shows fidelity comparison."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention fidelity
-        assert "fidelity" in report.lower() or "format" in report.lower()
+        assert "fidelity" in report_lower or "format" in report_lower
 
-    def test_executive_summary_has_cost_savings(self) -> None:
+    def test_executive_summary_has_cost_savings(self, sample_report: tuple[str, str]) -> None:
         """Test that executive summary shows cost savings."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention cost
-        assert "cost" in report.lower()
+        assert "cost" in report_lower
 
 
 class TestReportMethodology:
     """Test the methodology section (US-026)."""
 
-    def test_report_has_methodology(self) -> None:
+    def test_report_has_methodology(self, sample_report: tuple[str, str]) -> None:
         """Test that report includes methodology section."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         assert "## Methodology" in report
 
-    def test_methodology_lists_corpus(self) -> None:
+    def test_methodology_lists_corpus(self, sample_report: tuple[str, str]) -> None:
         """Test that methodology lists test corpus."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention corpus or documents
-        assert "corpus" in report.lower() or "document" in report.lower()
+        assert "corpus" in report_lower or "document" in report_lower
 
-    def test_methodology_lists_pipelines(self) -> None:
+    def test_methodology_lists_pipelines(self, sample_report: tuple[str, str]) -> None:
         """Test that methodology lists pipelines compared."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention pipelines
-        assert "sidedoc" in report.lower() or "pipeline" in report.lower()
+        assert "sidedoc" in report_lower or "pipeline" in report_lower
 
-    def test_methodology_lists_tasks(self) -> None:
+    def test_methodology_lists_tasks(self, sample_report: tuple[str, str]) -> None:
         """Test that methodology lists tasks executed."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should mention tasks
-        assert "task" in report.lower() or "summarize" in report.lower()
+        assert "task" in report_lower or "summarize" in report_lower
 
 
 class TestReportResultsTables:
     """Test the results tables section (US-027)."""
 
-    def test_report_has_results_section(self) -> None:
+    def test_report_has_results_section(self, sample_report: tuple[str, str]) -> None:
         """Test that report includes results section."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         assert "## Results" in report
 
-    def test_results_has_token_efficiency_table(self) -> None:
+    def test_results_has_token_efficiency_table(self, sample_report: tuple[str, str]) -> None:
         """Test that results include token efficiency table."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, report_lower = sample_report
 
         # Should have table with pipeline names
         assert "|" in report  # Markdown table format
-        assert "token" in report.lower()
+        assert "token" in report_lower
 
-    def test_results_tables_formatted_as_markdown(self) -> None:
+    def test_results_tables_formatted_as_markdown(self, sample_report: tuple[str, str]) -> None:
         """Test that tables are formatted as Markdown."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         # Should have markdown table syntax
         assert "| " in report
@@ -206,32 +193,26 @@ class TestReportResultsTables:
 class TestReportConclusions:
     """Test the conclusions section (US-028)."""
 
-    def test_report_has_conclusions(self) -> None:
+    def test_report_has_conclusions(self, sample_report: tuple[str, str]) -> None:
         """Test that report includes conclusions section."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         assert "## Conclusions" in report
 
-    def test_conclusions_has_best_pipeline(self) -> None:
+    def test_conclusions_has_best_pipeline(self, sample_report: tuple[str, str]) -> None:
         """Test that conclusions summarize best pipeline."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        report, _ = sample_report
 
         # Should mention best or recommend
-        conclusions_section = report.split("## Conclusions")[1] if "## Conclusions" in report else ""
-        assert "best" in conclusions_section.lower() or "recommend" in conclusions_section.lower()
+        conclusions_section = report.split("## Conclusions")[1].lower() if "## Conclusions" in report else ""
+        assert "best" in conclusions_section or "recommend" in conclusions_section
 
-    def test_conclusions_has_recommendations(self) -> None:
+    def test_conclusions_has_recommendations(self, sample_report: tuple[str, str]) -> None:
         """Test that conclusions list recommendations."""
-        from benchmarks.generate_report import generate_report
-
-        report = generate_report(SAMPLE_RESULTS)
+        _, report_lower = sample_report
 
         # Should have recommendation
-        assert "recommend" in report.lower() or "use case" in report.lower()
+        assert "recommend" in report_lower or "use case" in report_lower
 
 
 SAMPLE_RESULTS_WITH_FIDELITY = {
@@ -278,8 +259,6 @@ class TestReportFidelitySection:
 
     def test_fidelity_section_with_data(self) -> None:
         """Test fidelity section renders table when data is present."""
-        from benchmarks.generate_report import generate_fidelity_section
-
         section = generate_fidelity_section(SAMPLE_RESULTS_WITH_FIDELITY)
         assert "Structure" in section
         assert "Formatting" in section
@@ -287,15 +266,11 @@ class TestReportFidelitySection:
 
     def test_fidelity_section_without_data(self) -> None:
         """Test fidelity section shows placeholder when no data."""
-        from benchmarks.generate_report import generate_fidelity_section
-
         section = generate_fidelity_section(SAMPLE_RESULTS)  # no fidelity_results
         assert "fidelity" in section.lower() or "Fidelity" in section
 
     def test_calculate_pipeline_fidelity(self) -> None:
         """Test averaging fidelity scores per pipeline."""
-        from benchmarks.generate_report import calculate_pipeline_fidelity
-
         fidelity = calculate_pipeline_fidelity(SAMPLE_RESULTS_WITH_FIDELITY)
         assert "sidedoc" in fidelity
         assert "pandoc" in fidelity
@@ -303,15 +278,11 @@ class TestReportFidelitySection:
 
     def test_fidelity_null_shown_as_na(self) -> None:
         """Test that None scores are shown as N/A in the table."""
-        from benchmarks.generate_report import generate_fidelity_section
-
         section = generate_fidelity_section(SAMPLE_RESULTS_WITH_FIDELITY)
         assert "N/A" in section
 
     def test_report_includes_fidelity_when_present(self) -> None:
         """Test that full report includes fidelity data when present."""
-        from benchmarks.generate_report import generate_report
-
         report = generate_report(SAMPLE_RESULTS_WITH_FIDELITY)
         assert "Structure" in report
         assert "Formatting" in report
@@ -4,6 +4,15 @@ from pathlib import Path
 
 import pytest
 
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
+def readme_text() -> tuple[str, str]:
+    """README contents read once, plus its lowercased form."""
+    text = (BENCHMARKS_DIR / "README.md").read_text()
+    return text, text.lower()
+
 
 class TestBenchmarkReadme:
     """Test the benchmark README (US-029)."""
@@ -13,76 +22,40 @@ class TestBenchmarkReadme:
         readme_path = benchmarks_dir / "README.md"
         assert readme_path.exists(), "benchmarks/README.md does not exist"
 
-    def test_readme_has_overview(self, benchmarks_dir: Path) -> None:
+    def test_readme_has_overview(self, readme_text: tuple[str, str]) -> None:
         """Test that README has overview section."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
+        content, content_lower = readme_text
 
-        assert "overview" in content.lower() or "# " in content
+        assert "overview" in content_lower or "# " in content
 
-    def test_readme_has_prerequisites(self, benchmarks_dir: Path) -> None:
+    def test_readme_has_prerequisites(self, readme_text: tuple[str, str]) -> None:
         """Test that README lists prerequisites."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "prerequisite" in content.lower() or "require" in content.lower()
+        _, content_lower = readme_text
 
-    def test_readme_mentions_python(self, benchmarks_dir: Path) -> None:
-        """Test that README mentions Python 3.11+."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "python" in content.lower()
-
-    def test_readme_mentions_pandoc(self, benchmarks_dir: Path) -> None:
-        """Test that README mentions Pandoc."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
+        assert "prerequisite" in content_lower or "require" in content_lower
 
-        assert "pandoc" in content.lower()
+    @pytest.mark.parametrize(
+        "keyword", ["python", "pandoc", "libreoffice", "install", "usage"]
+    )
+    def test_readme_mentions(self, readme_text: tuple[str, str], keyword: str) -> None:
+        """Test that README mentions Python, Pandoc, LibreOffice, installation and usage."""
+        _, content_lower = readme_text
 
-    def test_readme_mentions_libreoffice(self, benchmarks_dir: Path) -> None:
-        """Test that README mentions LibreOffice."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "libreoffice" in content.lower()
-
-    def test_readme_has_installation(self, benchmarks_dir: Path) -> None:
-        """Test that README has installation section."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "install" in content.lower()
-
-    def test_readme_has_usage(self, benchmarks_dir: Path) -> None:
-        """Test that README has usage section."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "usage" in content.lower()
+        assert keyword in content_lower
 
 
 class TestBenchmarkReadmeTroubleshooting:
     """Test the troubleshooting section (US-030)."""
 
-    def test_readme_has_troubleshooting(self, benchmarks_dir: Path) -> None:
-        """Test that README has troubleshooting section."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
-
-        assert "troubleshoot" in content.lower()
+    @pytest.mark.parametrize("keyword", ["troubleshoot", "example"])
+    def test_readme_has_section(self, readme_text: tuple[str, str], keyword: str) -> None:
+        """Test that README has troubleshooting and examples."""
+        _, content_lower = readme_text
 
-    def test_readme_has_examples(self, benchmarks_dir: Path) -> None:
-        """Test that README has examples."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
+        assert keyword in content_lower
 
-        assert "example" in content.lower()
-
-    def test_readme_has_environment_variables(self, benchmarks_dir: Path) -> None:
+    def test_readme_has_environment_variables(self, readme_text: tuple[str, str]) -> None:
         """Test that README documents environment variables."""
-        readme_path = benchmarks_dir / "README.md"
-        content = readme_path.read_text()
+        content, content_lower = readme_text
 
-        assert "environment" in content.lower() or "ANTHROPIC" in content
+        assert "environment" in content_lower or "ANTHROPIC" in content
@@ -1,9 +1,34 @@
 """Tests for benchmark requirements.txt (US-002)."""
 
+import re
 from pathlib import Path
 
 import pytest
 
+# A requirement line that is not blank, not a comment, and has no == or >= pin
+_UNPINNED_RE = re.compile(r"^(?!\s*#)(?!\s*$)(?!.*(?:==|>=)).+$", re.MULTILINE)
+
+BENCHMARKS_DIR = Path(__file__).resolve().parent.parent
+
+REQUIRED_PACKAGES = [
+    "pytest",
+    "click",
+    "python-docx",
+    "tiktoken",
+    "litellm",
+    "azure-ai-formrecognizer",
+    "pypandoc",
+    "pdf2image",
+    "imagehash",
+    "Pillow",
+]
+
+
+@pytest.fixture(scope="session")
+def requirements_lower() -> str:
+    """Lowercased contents of benchmarks/requirements.txt, read once."""
+    return (BENCHMARKS_DIR / "requirements.txt").read_text().lower()
+
 
 class TestBenchmarkRequirements:
     """Test that benchmark requirements.txt is properly configured."""
@@ -13,42 +38,22 @@ class TestBenchmarkRequirements:
         requirements_path = benchmarks_dir / "requirements.txt"
         assert requirements_path.exists(), "benchmarks/requirements.txt does not exist"
 
-    def test_required_packages_listed(self, benchmarks_dir: Path) -> None:
-        """Test that all required packages are listed."""
-        requirements_path = benchmarks_dir / "requirements.txt"
-        content = requirements_path.read_text()
-
-        required_packages = [
-            "pytest",
-            "click",
-            "python-docx",
-            "tiktoken",
-            "litellm",
-            "azure-ai-formrecognizer",
-            "pypandoc",
-            "pdf2image",
-            "imagehash",
-            "Pillow",
-        ]
-
-        for package in required_packages:
-            # Check for package name (case-insensitive for some packages)
-            package_lower = package.lower()
-            content_lower = content.lower()
-            assert package_lower in content_lower, f"Package {package} not found in requirements.txt"
+    @pytest.mark.parametrize("package", REQUIRED_PACKAGES)
+    def test_required_packages_listed(
+        self, requirements_lower: str, package: str
+    ) -> None:
+        """Test that each required package is listed (case-insensitive)."""
+        assert package.lower() in requirements_lower, (
+            f"Package {package} not found in requirements.txt"
+        )
 
     def test_versions_are_pinned(self, benchmarks_dir: Path) -> None:
         """Test that package versions are pinned for reproducibility."""
         requirements_path = benchmarks_dir / "requirements.txt"
-        lines = requirements_path.read_text().strip().split("\n")
-
-        for line in lines:
-            line = line.strip()
-            # Skip comments and empty lines
-            if not line or line.startswith("#"):
-                continue
-
-            # Check that version is pinned with == or >=
-            assert "==" in line or ">=" in line, (
-                f"Package {line} does not have a pinned version (use == or >=)"
-            )
+        content = requirements_path.read_text()
+
+        # Check that every package line is pinned with == or >=
+        match = _UNPINNED_RE.search(content)
+        assert match is None, (
+            f"Package {match.group(0).strip()} does not have a pinned version (use == or >=)"
+        )
@@ -3,7 +3,29 @@
 from pathlib import Path
 
 import pytest
-from click.testing import CliRunner
+from click.testing import CliRunner, Result
+
+
+@pytest.fixture(scope="module")
+def help_result() -> Result:
+    """Result of invoking the runner CLI with --help, shared by the module."""
+    from benchmarks.run_benchmark import cli
+
+    return CliRunner().invoke(cli, ["--help"])
+
+
+@pytest.fixture(scope="module")
+def help_output(help_result: Result) -> str:
+    """Lowercased --help output."""
+    return help_result.output.lower()
+
+
+@pytest.fixture(scope="module")
+def cli_param_names() -> set[str]:
+    """Names of the runner CLI's parameters."""
+    from benchmarks.run_benchmark import cli
+
+    return {p.name for p in cli.params}
 
 
 class TestBenchmarkRunner:
@@ -28,70 +50,38 @@ class TestBenchmarkRunner:
 
         assert isinstance(cli, click.core.Command)
 
-    def test_cli_has_pipeline_option(self) -> None:
+    def test_cli_has_pipeline_option(self, cli_param_names: set[str]) -> None:
         """Test that CLI has --pipeline option."""
-        from benchmarks.run_benchmark import cli
+        assert "pipeline" in cli_param_names
 
-        param_names = [p.name for p in cli.params]
-        assert "pipeline" in param_names
-
-    def test_cli_has_task_option(self) -> None:
+    def test_cli_has_task_option(self, cli_param_names: set[str]) -> None:
         """Test that CLI has --task option."""
-        from benchmarks.run_benchmark import cli
+        assert "task" in cli_param_names
 
-        param_names = [p.name for p in cli.params]
-        assert "task" in param_names
-
-    def test_cli_has_corpus_option(self) -> None:
+    def test_cli_has_corpus_option(self, cli_param_names: set[str]) -> None:
         """Test that CLI has --corpus option."""
-        from benchmarks.run_benchmark import cli
-
-        param_names = [p.name for p in cli.params]
-        assert "corpus" in param_names
+        assert "corpus" in cli_param_names
 
-    def test_cli_runs_without_error(self) -> None:
+    def test_cli_runs_without_error(self, help_result: Result) -> None:
         """Test that CLI runs without error (with --dry-run if available)."""
-        from benchmarks.run_benchmark import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
+        assert help_result.exit_code == 0
+        assert "Usage" in help_result.output
 
-        assert result.exit_code == 0
-        assert "Usage" in result.output
-
-    def test_cli_shows_available_pipelines(self) -> None:
+    def test_cli_shows_available_pipelines(self, help_output: str) -> None:
         """Test that CLI help shows available pipelines."""
-        from benchmarks.run_benchmark import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-
         # Help should mention pipeline options
-        assert "pipeline" in result.output.lower()
+        assert "pipeline" in help_output
 
-    def test_cli_shows_available_tasks(self) -> None:
+    def test_cli_shows_available_tasks(self, help_output: str) -> None:
         """Test that CLI help shows available tasks."""
-        from benchmarks.run_benchmark import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-
         # Help should mention task options
-        assert "task" in result.output.lower()
+        assert "task" in help_output
 
-    def test_cli_shows_corpus_options(self) -> None:
+    def test_cli_shows_corpus_options(self, help_output: str) -> None:
         """Test that CLI help shows corpus options."""
-        from benchmarks.run_benchmark import cli
-
-        runner = CliRunner()
-        result = runner.invoke(cli, ["--help"])
-
         # Help should mention corpus
-        assert "corpus" in result.output.lower()
+        assert "corpus" in help_output
 
-    def test_cli_has_fidelity_option(self) -> None:
+    def test_cli_has_fidelity_option(self, cli_param_names: set[str]) -> None:
         """Test that CLI has --fidelity option."""
-        from benchmarks.run_benchmark import cli
-
-        param_names = [p.name for p in cli.params]
-        assert "fidelity" in param_names
+        assert "fidelity" in cli_param_names
@@ -1,12 +1,34 @@
 """Tests for Sidedoc pipeline implementation (US-006)."""
 
+from collections.abc import Iterator
 from pathlib import Path
-import tempfile
+from typing import Any
 import zipfile
 
 import pytest
 
 
+@pytest.fixture(scope="module")
+def extracted(simple_docx: Path) -> Iterator[tuple[Any, str]]:
+    """A pipeline with simple.docx extracted, shared by tests that do not edit it."""
+    from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
+
+    with SidedocPipeline() as pipeline:
+        yield pipeline, pipeline.extract_content(simple_docx)
+
+
+@pytest.fixture(scope="session")
+def outdir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """One output directory for rebuilt documents across the session."""
+    return tmp_path_factory.mktemp("sidedoc-out")
+
+
+@pytest.fixture
+def output_path(outdir: Path, request: pytest.FixtureRequest) -> Path:
+    """A per-test rebuilt-document path inside the shared output directory."""
+    return outdir / f"{request.node.name}.docx"
+
+
 class TestSidedocPipeline:
     """Test that the Sidedoc pipeline works correctly."""
 
@@ -35,23 +57,17 @@ class TestSidedocPipeline:
         pipeline = SidedocPipeline()
         assert pipeline is not None
 
-    def test_extract_content_with_simple_fixture(self, simple_docx: Path) -> None:
+    def test_extract_content_with_simple_fixture(self, extracted: tuple[Any, str]) -> None:
         """Test that extract_content extracts markdown from a docx file."""
-        from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
-
-        pipeline = SidedocPipeline()
-        content = pipeline.extract_content(simple_docx)
+        _, content = extracted
 
         # Should return non-empty string with markdown content
         assert isinstance(content, str)
         assert len(content) > 0
 
-    def test_extract_content_creates_sidedoc(self, simple_docx: Path) -> None:
+    def test_extract_content_creates_sidedoc(self, extracted: tuple[Any, str]) -> None:
         """Test that extract_content creates a sidedoc archive."""
-        from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
-
-        pipeline = SidedocPipeline()
-        pipeline.extract_content(simple_docx)
+        pipeline, _ = extracted
 
         # Check that sidedoc was created
         assert pipeline._sidedoc_path is not None
@@ -88,42 +104,68 @@ class TestSidedocPipeline:
             content_md = zip_file.read("content.md").decode("utf-8")
             assert edit_text in content_md
 
-    def test_rebuild_document_creates_docx(self, simple_docx: Path) -> None:
-        """Test that rebuild_document creates a new docx file."""
+    def test_apply_edit_keeps_member_compression(self, simple_docx: Path) -> None:
+        """Test that copied archive members keep their original compress_type."""
         from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
 
         pipeline = SidedocPipeline()
-        content = pipeline.extract_content(simple_docx)
+        pipeline.extract_content(simple_docx)
+        assert pipeline._sidedoc_path is not None
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.docx"
+        with zipfile.ZipFile(pipeline._sidedoc_path, "a") as zip_file:
+            zip_file.writestr("assets/image1.png", b"png", compress_type=zipfile.ZIP_STORED)
+            zip_file.writestr("assets/image2.emf", b"emf", compress_type=zipfile.ZIP_DEFLATED)
 
-            result = pipeline.rebuild_document(content, simple_docx, output_path)
+        pipeline.apply_edit(pipeline._current_content, "\n\nEdited.")
 
-            # Check that output was created
-            assert output_path.exists()
-            assert result.output_path == output_path
-            assert result.error is None
+        with zipfile.ZipFile(pipeline._sidedoc_path, "r") as zip_file:
+            assert zip_file.getinfo("assets/image1.png").compress_type == zipfile.ZIP_STORED
+            assert zip_file.getinfo("assets/image2.emf").compress_type == zipfile.ZIP_DEFLATED
+            assert zip_file.read("assets/image2.emf") == b"emf"
 
-    def test_rebuild_document_returns_pipeline_result(self, simple_docx: Path) -> None:
-        """Test that rebuild_document returns PipelineResult with metrics."""
+    def test_apply_edit_skips_rewrite_when_content_unchanged(self, simple_docx: Path) -> None:
+        """Test that an edit producing identical content leaves the archive untouched."""
         from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
-        from benchmarks.pipelines.base import PipelineResult
 
         pipeline = SidedocPipeline()
         content = pipeline.extract_content(simple_docx)
+        assert pipeline._sidedoc_path is not None
+        mtime_before = pipeline._sidedoc_path.stat().st_mtime_ns
+
+        pipeline.apply_edit(content, "")
+        pipeline.apply_edit(content, "")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "output.docx"
+        assert pipeline._sidedoc_path.stat().st_mtime_ns == mtime_before
 
-            result = pipeline.rebuild_document(content, simple_docx, output_path)
+    def test_rebuild_document_creates_docx(
+        self, simple_docx: Path, extracted: tuple[Any, str], output_path: Path
+    ) -> None:
+        """Test that rebuild_document creates a new docx file."""
+        pipeline, content = extracted
+
+        result = pipeline.rebuild_document(content, simple_docx, output_path)
+
+        # Check that output was created
+        assert output_path.exists()
+        assert result.output_path == output_path
+        assert result.error is None
 
-            assert isinstance(result, PipelineResult)
-            assert result.input_tokens >= 0
-            assert result.output_tokens >= 0
-            assert result.time_elapsed >= 0
+    def test_rebuild_document_returns_pipeline_result(
+        self, simple_docx: Path, extracted: tuple[Any, str], output_path: Path
+    ) -> None:
+        """Test that rebuild_document returns PipelineResult with metrics."""
+        from benchmarks.pipelines.base import PipelineResult
 
-    def test_full_pipeline_workflow(self, simple_docx: Path) -> None:
+        pipeline, content = extracted
+
+        result = pipeline.rebuild_document(content, simple_docx, output_path)
+
+        assert isinstance(result, PipelineResult)
+        assert result.input_tokens >= 0
+        assert result.output_tokens >= 0
+        assert result.time_elapsed >= 0
+
+    def test_full_pipeline_workflow(self, simple_docx: Path, output_path: Path) -> None:
         """Test the complete extract -> edit -> rebuild workflow."""
         from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
 
@@ -138,9 +180,28 @@ class TestSidedocPipeline:
         assert "New paragraph added" in edited
 
         # Rebuild
-        with tempfile.TemporaryDirectory() as tmpdir:
-            output_path = Path(tmpdir) / "rebuilt.docx"
-            result = pipeline.rebuild_document(edited, simple_docx, output_path)
+        result = pipeline.rebuild_document(edited, simple_docx, output_path)
+
+        assert output_path.exists()
+        assert result.error is None
+
+    def test_extract_content_reuses_conversion(self, simple_docx: Path) -> None:
+        """Test that extracting the same file twice converts it only once."""
+        from unittest.mock import patch
+
+        from benchmarks.pipelines import sidedoc_pipeline
+        from benchmarks.pipelines.sidedoc_pipeline import SidedocPipeline
+
+        sidedoc_pipeline._build_sidedoc.cache_clear()
+
+        with patch.object(
+            sidedoc_pipeline, "extract_all", wraps=sidedoc_pipeline.extract_all
+        ) as mock_extract:
+            first = SidedocPipeline()
+            second = SidedocPipeline()
+            assert first.extract_content(simple_docx) == second.extract_content(simple_docx)
 
-            assert output_path.exists()
-            assert result.error is None
+        assert mock_extract.call_count == 1
+        # Each pipeline edits its own copy of the archive
+        assert first._sidedoc_path != second._sidedoc_path
+        assert second._sidedoc_path is not None and second._sidedoc_path.exists()
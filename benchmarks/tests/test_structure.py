@@ -1,10 +1,19 @@
 """Tests for benchmark project structure (US-001)."""
 
+import functools
+import os
 from pathlib import Path
 
 import pytest
 
 
+@functools.lru_cache(maxsize=None)
+def _entries(directory: Path) -> dict[str, os.DirEntry[str]]:
+    """Map each entry name in a directory to its DirEntry, via one scandir."""
+    with os.scandir(directory) as it:
+        return {entry.name: entry for entry in it}
+
+
 class TestBenchmarkStructure:
     """Test that the benchmark directory structure is correct."""
 
@@ -16,17 +25,17 @@ class TestBenchmarkStructure:
     def test_required_subdirectories_exist(self, benchmarks_dir: Path) -> None:
         """Test that all required subdirectories exist."""
         required_dirs = ["corpus", "pipelines", "tasks", "metrics", "results", "scripts"]
+        entries = _entries(benchmarks_dir)
         for dir_name in required_dirs:
-            dir_path = benchmarks_dir / dir_name
-            assert dir_path.exists(), f"Directory {dir_name}/ does not exist"
-            assert dir_path.is_dir(), f"{dir_name} is not a directory"
+            assert dir_name in entries, f"Directory {dir_name}/ does not exist"
+            assert entries[dir_name].is_dir(), f"{dir_name} is not a directory"
 
     def test_python_package_init_files_exist(self, benchmarks_dir: Path) -> None:
         """Test that __init__.py files exist for Python package structure."""
         packages = ["", "pipelines", "tasks", "metrics", "scripts", "tests"]
         for pkg in packages:
-            init_path = benchmarks_dir / pkg / "__init__.py" if pkg else benchmarks_dir / "__init__.py"
-            assert init_path.exists(), f"__init__.py missing in {pkg or 'benchmarks'}/"
+            pkg_dir = benchmarks_dir / pkg if pkg else benchmarks_dir
+            assert "__init__.py" in _entries(pkg_dir), f"__init__.py missing in {pkg or 'benchmarks'}/"
 
     def test_corpus_synthetic_symlink(self, benchmarks_dir: Path) -> None:
         """Test that corpus/synthetic/ symlinks to tests/fixtures/."""
@@ -52,6 +61,9 @@ class TestBenchmarkStructure:
         synthetic_path = benchmarks_dir / "corpus" / "synthetic"
         expected_fixtures = ["simple.docx", "lists.docx", "formatted.docx", "images.docx", "complex.docx"]
 
+        entries = _entries(synthetic_path)
         for fixture in expected_fixtures:
-            fixture_path = synthetic_path / fixture
-            assert fixture_path.exists(), f"Fixture {fixture} not accessible via symlink"
+            # is_file() follows the link, so a dangling symlink fails here
+            assert fixture in entries and entries[fixture].is_file(), (
+                f"Fixture {fixture} not accessible via symlink"
+            )
@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -139,3 +139,54 @@ class TestSummarizeTask:
             call_args = mock_litellm.completion.call_args
             call_str = str(call_args)
             assert "12345" in call_str or test_content in call_str
+
+    def test_execute_reuses_cached_summary(self) -> None:
+        """Test that repeat calls with the same content skip the API."""
+        from benchmarks.tasks.summarize import SummarizeTask
+
+        mock_response = MagicMock()
+        mock_choice = MagicMock()
+        mock_choice.message.content = "- Cached summary"
+        mock_response.choices = [mock_choice]
+        mock_response.usage.prompt_tokens = 50
+        mock_response.usage.completion_tokens = 20
+
+        with patch("benchmarks.tasks.summarize.litellm") as mock_litellm:
+            mock_litellm.completion.return_value = mock_response
+
+            task = SummarizeTask()
+            first = task.execute("Content summarized twice 67890", "claude-sonnet-4-20250514")
+            second = task.execute("Content summarized twice 67890", "claude-sonnet-4-20250514")
+
+            assert mock_litellm.completion.call_count == 1
+            assert not first.cached
+            assert second.cached
+            assert second.result_text == first.result_text
+            assert (second.prompt_tokens, second.completion_tokens) == (50, 20)
+
+    def test_execute_many_summarizes_each_document(self) -> None:
+        """Test that execute_many issues one async call per document, in order."""
+        from benchmarks.tasks.summarize import SummarizeTask
+
+        def make_response(text: str) -> MagicMock:
+            mock_response = MagicMock()
+            mock_choice = MagicMock()
+            mock_choice.message.content = text
+            mock_response.choices = [mock_choice]
+            mock_response.usage.prompt_tokens = 40
+            mock_response.usage.completion_tokens = 10
+            return mock_response
+
+        docs = [f"Concurrent document {i} 24680" for i in range(5)]
+
+        with patch("benchmarks.tasks.summarize.litellm") as mock_litellm:
+            mock_litellm.acompletion = AsyncMock(
+                side_effect=[make_response(f"- Summary {i}") for i in range(len(docs))]
+            )
+
+            task = SummarizeTask()
+            results = task.execute_many(docs, "claude-sonnet-4-20250514", concurrency=2)
+
+            assert mock_litellm.acompletion.await_count == len(docs)
+            assert [r.result_text for r in results] == [f"- Summary {i}" for i in range(len(docs))]
+            assert all(r.error is None for r in results)
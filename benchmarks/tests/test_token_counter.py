@@ -115,3 +115,29 @@ class TestTokenCounter:
         result2 = counter.count_tokens(text)
 
         assert result1 == result2
+
+    def test_count_tokens_batch_matches_single_counts(self) -> None:
+        """Test that count_tokens_batch agrees with count_tokens for each text."""
+        from benchmarks.metrics.token_counter import TokenCounter
+
+        counter = TokenCounter()
+        texts = ["Hello, world!", "", "Line 1\nLine 2"]
+
+        assert counter.count_tokens_batch(texts) == [counter.count_tokens(t) for t in texts]
+
+    def test_count_tokens_batch_handles_empty_and_single(self) -> None:
+        """Test that count_tokens_batch accepts empty and one-item sequences."""
+        from benchmarks.metrics.token_counter import TokenCounter
+
+        counter = TokenCounter()
+
+        assert counter.count_tokens_batch([]) == []
+        assert counter.count_tokens_batch(("Hello, world!",)) == [
+            counter.count_tokens("Hello, world!")
+        ]
+
+    def test_counters_share_one_encoding(self) -> None:
+        """Test that the tiktoken encoding is loaded once and shared."""
+        from benchmarks.metrics.token_counter import TokenCounter
+
+        assert TokenCounter()._encoding is TokenCounter()._encoding
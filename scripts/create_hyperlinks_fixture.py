@@ -7,26 +7,101 @@ from docx.shared import Pt, RGBColor
 from docx.oxml.ns import qn, nsmap
 from docx.oxml import OxmlElement
 
+_QN_RID = qn('r:id')
+_QN_WVAL = qn('w:val')
+_QN_XML_SPACE = qn('xml:space')
+_HL_RELTYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink"
 
-def add_hyperlink(paragraph, text: str, url: str, bold: bool = False, italic: bool = False):
+
+def link(text: str, url: str, bold: bool = False, italic: bool = False) -> tuple[str, str, bool, bool]:
+    """Describe a hyperlink segment for PARAGRAPHS."""
+    return (text, url, bold, italic)
+
+
+# Each entry is (paragraph style id, segments); a segment is plain run text
+# or a link() tuple.
+PARAGRAPHS = [
+    # 1. Simple hyperlink
+    (None, ["Visit ", link("Google", "https://www.google.com"), " for search."]),
+    # 2. Multiple hyperlinks in one paragraph
+    (None, [
+        "Check out ",
+        link("GitHub", "https://github.com"),
+        " and ",
+        link("Stack Overflow", "https://stackoverflow.com"),
+        " for coding help.",
+    ]),
+    # 3. Bold hyperlink
+    (None, ["This is a ", link("bold link", "https://example.com/bold", bold=True), " in the text."]),
+    # 4. Italic hyperlink
+    (None, ["This is an ", link("italic link", "https://example.com/italic", italic=True), " in the text."]),
+    # 5. Bold and italic hyperlink
+    (None, [
+        "This is a ",
+        link("bold italic link", "https://example.com/bolditalic", bold=True, italic=True),
+        " in the text.",
+    ]),
+    # 6. Hyperlink in heading
+    ("Heading1", ["Heading with ", link("link", "https://example.com/heading")]),
+    # 7. Hyperlink in Heading 2
+    ("Heading2", ["Subheading with ", link("another link", "https://example.com/heading2")]),
+    # 8. Hyperlink in bulleted list
+    ("ListBullet", ["First item with ", link("link one", "https://example.com/list1")]),
+    ("ListBullet", ["Second item with ", link("link two", "https://example.com/list2")]),
+    # 9. Hyperlink in numbered list
+    ("ListNumber", ["Numbered item with ", link("link three", "https://example.com/list3")]),
+    ("ListNumber", ["Numbered item with ", link("link four", "https://example.com/list4")]),
+    # 10. Long URL
+    (None, [
+        "Here's a ",
+        link("long URL link", "https://example.com/very/long/path/with/many/segments/and/query?param1=value1&param2=value2&param3=value3"),
+        ".",
+    ]),
+    # 11. URL with special characters (parentheses, spaces encoded)
+    (None, [
+        "Wikipedia article: ",
+        link("Article with (parentheses)", "https://en.wikipedia.org/wiki/Python_(programming_language)"),
+    ]),
+    # 12. Link text with special markdown characters
+    (None, ["Link with special chars: ", link("text with *asterisks* and [brackets]", "https://example.com/special")]),
+    # 13. URL with percent-encoded characters
+    (None, ["Link with encoded URL: ", link("encoded spaces", "https://example.com/path%20with%20spaces")]),
+    # 14. Email link (mailto)
+    (None, ["Contact us at ", link("support@example.com", "mailto:support@example.com"), "."]),
+    # 15. Plain paragraph after links (for context)
+    (None, ["This is a plain paragraph with no links."]),
+]
+
+
+def add_text_run(p, text: str):
+    """Append a plain text run to a <w:p> element.
+
+    Args:
+        p: The paragraph element to append to
+        text: The run text
+    """
+    run = OxmlElement('w:r')
+    text_elem = OxmlElement('w:t')
+    text_elem.text = text
+    if text != text.strip():
+        text_elem.set(_QN_XML_SPACE, 'preserve')
+    run.append(text_elem)
+    p.append(run)
+
+
+def add_hyperlink(p, text: str, r_id: str, bold: bool = False, italic: bool = False):
     """Add a hyperlink to a paragraph.
 
     Args:
-        paragraph: The paragraph to add the hyperlink to
+        p: The paragraph element to add the hyperlink to
         text: The display text for the hyperlink
-        url: The URL the hyperlink points to
+        r_id: Relationship id of the hyperlink target
         bold: Whether the hyperlink text should be bold
         italic: Whether the hyperlink text should be italic
     """
-    # Get the document part to access relationships
-    part = paragraph.part
-
-    # Create the relationship
-    r_id = part.relate_to(url, "http://schemas.openxmlformats.org/officeDocument/2006/relationships/hyperlink", is_external=True)
-
     # Create the hyperlink element
     hyperlink = OxmlElement('w:hyperlink')
-    hyperlink.set(qn('r:id'), r_id)
+    hyperlink.set(_QN_RID, r_id)
 
     # Create a run for the text
     run = OxmlElement('w:r')
@@ -36,11 +111,11 @@ def add_hyperlink(paragraph, text: str, url: str, bold: bool = False, italic: bo
 
     # Add hyperlink style (blue color and underline)
     color = OxmlElement('w:color')
-    color.set(qn('w:val'), '0563C1')  # Standard hyperlink blue
+    color.set(_QN_WVAL, '0563C1')  # Standard hyperlink blue
     rPr.append(color)
 
     underline = OxmlElement('w:u')
-    underline.set(qn('w:val'), 'single')
+    underline.set(_QN_WVAL, 'single')
     rPr.append(underline)
 
     # Add bold if requested
@@ -64,90 +139,55 @@ def add_hyperlink(paragraph, text: str, url: str, bold: bool = False, italic: bo
     hyperlink.append(run)
 
     # Add hyperlink to paragraph
-    paragraph._p.append(hyperlink)
+    p.append(hyperlink)
 
     return hyperlink
 
 
-def create_hyperlinks_docx():
-    """Create hyperlinks.docx with various hyperlink scenarios."""
-    doc = Document()
-
-    # 1. Simple hyperlink
-    para = doc.add_paragraph("Visit ")
-    add_hyperlink(para, "Google", "https://www.google.com")
-    run = para.add_run(" for search.")
-
-    # 2. Multiple hyperlinks in one paragraph
-    para = doc.add_paragraph("Check out ")
-    add_hyperlink(para, "GitHub", "https://github.com")
-    run = para.add_run(" and ")
-    add_hyperlink(para, "Stack Overflow", "https://stackoverflow.com")
-    run = para.add_run(" for coding help.")
-
-    # 3. Bold hyperlink
-    para = doc.add_paragraph("This is a ")
-    add_hyperlink(para, "bold link", "https://example.com/bold", bold=True)
-    run = para.add_run(" in the text.")
-
-    # 4. Italic hyperlink
-    para = doc.add_paragraph("This is an ")
-    add_hyperlink(para, "italic link", "https://example.com/italic", italic=True)
-    run = para.add_run(" in the text.")
-
-    # 5. Bold and italic hyperlink
-    para = doc.add_paragraph("This is a ")
-    add_hyperlink(para, "bold italic link", "https://example.com/bolditalic", bold=True, italic=True)
-    run = para.add_run(" in the text.")
-
-    # 6. Hyperlink in heading
-    heading = doc.add_paragraph("", style="Heading 1")
-    heading.add_run("Heading with ")
-    add_hyperlink(heading, "link", "https://example.com/heading")
-
-    # 7. Hyperlink in Heading 2
-    heading2 = doc.add_paragraph("", style="Heading 2")
-    heading2.add_run("Subheading with ")
-    add_hyperlink(heading2, "another link", "https://example.com/heading2")
+def build_paragraph(style_id: str | None, segments: list, r_ids: dict[str, str]):
+    """Build a <w:p> element from a PARAGRAPHS entry.
 
-    # 8. Hyperlink in bulleted list
-    bullet1 = doc.add_paragraph("First item with ", style="List Bullet")
-    add_hyperlink(bullet1, "link one", "https://example.com/list1")
-
-    bullet2 = doc.add_paragraph("Second item with ", style="List Bullet")
-    add_hyperlink(bullet2, "link two", "https://example.com/list2")
-
-    # 9. Hyperlink in numbered list
-    num1 = doc.add_paragraph("Numbered item with ", style="List Number")
-    add_hyperlink(num1, "link three", "https://example.com/list3")
+    Args:
+        style_id: Paragraph style id, or None for the default style
+        segments: Plain run strings and link() tuples
+        r_ids: Relationship ids keyed by hyperlink URL
+    """
+    p = OxmlElement('w:p')
+    if style_id:
+        pPr = OxmlElement('w:pPr')
+        p_style = OxmlElement('w:pStyle')
+        p_style.set(_QN_WVAL, style_id)
+        pPr.append(p_style)
+        p.append(pPr)
 
-    num2 = doc.add_paragraph("Numbered item with ", style="List Number")
-    add_hyperlink(num2, "link four", "https://example.com/list4")
+    for segment in segments:
+        if isinstance(segment, str):
+            add_text_run(p, segment)
+        else:
+            text, url, bold, italic = segment
+            add_hyperlink(p, text, r_ids[url], bold=bold, italic=italic)
 
-    # 10. Long URL
-    para = doc.add_paragraph("Here's a ")
-    add_hyperlink(para, "long URL link", "https://example.com/very/long/path/with/many/segments/and/query?param1=value1&param2=value2&param3=value3")
-    run = para.add_run(".")
+    return p
 
-    # 11. URL with special characters (parentheses, spaces encoded)
-    para = doc.add_paragraph("Wikipedia article: ")
-    add_hyperlink(para, "Article with (parentheses)", "https://en.wikipedia.org/wiki/Python_(programming_language)")
 
-    # 12. Link text with special markdown characters
-    para = doc.add_paragraph("Link with special chars: ")
-    add_hyperlink(para, "text with *asterisks* and [brackets]", "https://example.com/special")
+def create_hyperlinks_docx():
+    """Create hyperlinks.docx with various hyperlink scenarios."""
+    doc = Document()
+    part = doc.part
 
-    # 13. URL with percent-encoded characters
-    para = doc.add_paragraph("Link with encoded URL: ")
-    add_hyperlink(para, "encoded spaces", "https://example.com/path%20with%20spaces")
+    # Create every hyperlink relationship up front
+    r_ids: dict[str, str] = {}
+    for _, segments in PARAGRAPHS:
+        for segment in segments:
+            if not isinstance(segment, str) and segment[1] not in r_ids:
+                r_ids[segment[1]] = part.relate_to(segment[1], _HL_RELTYPE, is_external=True)
 
-    # 14. Email link (mailto)
-    para = doc.add_paragraph("Contact us at ")
-    add_hyperlink(para, "support@example.com", "mailto:support@example.com")
-    run = para.add_run(".")
+    paras = [build_paragraph(style_id, segments, r_ids) for style_id, segments in PARAGRAPHS]
 
-    # 15. Plain paragraph after links (for context)
-    doc.add_paragraph("This is a plain paragraph with no links.")
+    # Insert all paragraphs in one step, ahead of the trailing sectPr
+    body = doc.element.body
+    sect_pr_index = body.index(body.sectPr)
+    body[sect_pr_index:sect_pr_index] = paras
 
     # Save the document
     output_path = Path(__file__).parent.parent / "tests" / "fixtures" / "hyperlinks.docx"
@@ -1,5 +1,21 @@
 """Allow running sidedoc as `python -m sidedoc`."""
 
-from sidedoc.cli import main
+import sys
 
-main()
+from sidedoc import __version__
+
+
+def run() -> None:
+    """Console entry point; answers a bare --version before loading Click."""
+    if sys.argv[1:] == ["--version"]:
+        # Same text as click.version_option on the main group
+        print(f"sidedoc, version {__version__}")
+        return
+
+    from sidedoc.cli import main
+
+    main()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1 @@
+"""Sidedoc CLI subcommands, one module per command, loaded on demand by sidedoc.cli."""
@@ -0,0 +1,36 @@
+"""The ``sidedoc build`` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_NOT_FOUND, EXIT_SUCCESS
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+@click.option("-o", "--output", help="Output path for .docx file")
+def build(input_file: str, output: str | None) -> None:
+    """Reconstruct a Word document from a sidedoc directory or archive.
+
+    Accepts both .sidedoc/ directories and .sdoc ZIP archives.
+    """
+    from sidedoc.reconstruct import build_docx_from_sidedoc
+
+    try:
+        if output is None:
+            # Place output alongside input (not inside directory)
+            input_path = Path(input_file)
+            output = str(input_path.parent / (input_path.stem + ".docx"))
+
+        build_docx_from_sidedoc(input_file, output)
+
+        click.echo(f"✓ Built document: {output}")
+        sys.exit(EXIT_SUCCESS)
+    except FileNotFoundError:
+        click.echo(f"Error: File not found: {input_file}", err=True)
+        sys.exit(EXIT_NOT_FOUND)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
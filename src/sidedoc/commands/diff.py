@@ -0,0 +1,127 @@
+"""The ``sidedoc diff`` command."""
+
+import json
+import sys
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import (
+    EXIT_ERROR,
+    EXIT_INVALID_FORMAT,
+    EXIT_NOT_FOUND,
+    EXIT_SUCCESS,
+    _convert_structure_to_blocks,
+    _reject_if_zip,
+)
+from sidedoc.constants import CONTENT_PREVIEW_LENGTH
+from sidedoc.models import Block
+from sidedoc.store import SidedocStore
+
+# ANSI prefixes for per-block diff lines, built once rather than per block.
+# click.echo still strips them when output is not a terminal.
+_RED = click.style("", fg="red", reset=False)
+_GREEN = click.style("", fg="green", reset=False)
+_YELLOW = click.style("", fg="yellow", reset=False)
+_RESET = "\x1b[0m"
+
+
+def _block_description(block: Block) -> str:
+    """Return a short description like 'heading (level 2)' for diff output."""
+    desc = block.type
+    if block.level:
+        desc += f" (level {block.level})"
+    return desc
+
+
+def _content_preview(block: Block) -> str:
+    """Return a truncated content preview for diff output."""
+    preview = block.content[:CONTENT_PREVIEW_LENGTH]
+    return preview + "..." if len(block.content) > CONTENT_PREVIEW_LENGTH else preview
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+def diff(input_file: str) -> None:
+    """Show changes in content.md since last sync.
+
+    Displays added, removed, and modified blocks with +/- markers.
+    Only works with .sidedoc/ directories.
+    """
+    from sidedoc.reconstruct import parse_markdown_to_blocks
+    from sidedoc.sync import match_blocks
+
+    try:
+        _reject_if_zip(Path(input_file), "diff")
+
+        with SidedocStore.open(input_file) as store:
+            try:
+                content_md = store.read_text("content.md")
+            except FileNotFoundError:
+                click.echo("Error: content.md not found in sidedoc", err=True)
+                sys.exit(EXIT_INVALID_FORMAT)
+
+            if not store.has_file("structure.json"):
+                click.echo("No sync history. Run `sidedoc sync` to establish a baseline.")
+                sys.exit(EXIT_SUCCESS)
+
+            try:
+                old_structure = store.read_json("structure.json")
+            except json.JSONDecodeError:
+                click.echo("Error: Invalid JSON in structure.json", err=True)
+                sys.exit(EXIT_INVALID_FORMAT)
+
+            new_blocks = parse_markdown_to_blocks(content_md)
+
+            old_blocks = _convert_structure_to_blocks(old_structure)
+
+            # Match blocks to find differences
+            matches = match_blocks(old_blocks, new_blocks)
+
+            # Identify changes (matches is keyed by old block ID)
+            old_by_id = {b.id: b for b in old_blocks}
+            matched_new_block_ids = {b.id for b in matches.values()}
+
+            deleted_blocks = [b for b in old_blocks if b.id not in matches]
+            added_blocks = [b for b in new_blocks if b.id not in matched_new_block_ids]
+
+            modified_blocks = []
+            for old_id, new_block in matches.items():
+                old_block = old_by_id[old_id]
+                if old_block.content_hash != new_block.content_hash:
+                    modified_blocks.append((old_block, new_block))
+
+            has_changes = deleted_blocks or added_blocks or modified_blocks
+
+            if not has_changes:
+                click.echo("No changes detected in content.md")
+            else:
+                click.echo("Changes in content.md:\n")
+
+                if deleted_blocks:
+                    click.echo(click.style("Removed blocks:", fg="red", bold=True))
+                    for block in deleted_blocks:
+                        click.echo(f"{_RED}  - [{_block_description(block)}] {_RESET}")
+
+                if added_blocks:
+                    if deleted_blocks:
+                        click.echo()
+                    click.echo(click.style("Added blocks:", fg="green", bold=True))
+                    for block in added_blocks:
+                        click.echo(f"{_GREEN}  + [{_block_description(block)}] {_content_preview(block)}{_RESET}")
+
+                if modified_blocks:
+                    if deleted_blocks or added_blocks:
+                        click.echo()
+                    click.echo(click.style("Modified blocks:", fg="yellow", bold=True))
+                    for old_block, new_block in modified_blocks:
+                        click.echo(f"{_YELLOW}  ~ [{_block_description(new_block)}] {_content_preview(new_block)}{_RESET}")
+
+            sys.exit(EXIT_SUCCESS)
+
+    except FileNotFoundError:
+        click.echo(f"Error: File not found: {input_file}", err=True)
+        sys.exit(EXIT_NOT_FOUND)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
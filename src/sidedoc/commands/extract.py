@@ -0,0 +1,90 @@
+"""The ``sidedoc extract`` command."""
+
+import shutil
+import sys
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_NOT_FOUND, EXIT_SUCCESS
+from sidedoc.constants import SIDEDOC_DIR_EXTENSION, SIDEDOC_ZIP_EXTENSION
+from sidedoc.utils import ensure_sdoc_extension, ensure_sidedoc_extension
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+@click.option("-o", "--output", help="Output path")
+@click.option("--force", is_flag=True, help="Overwrite existing output directory")
+@click.option("--pack", is_flag=True, help="Create .sdoc ZIP archive instead of directory")
+@click.option(
+    "--track-changes/--no-track-changes",
+    default=None,
+    help="Force enable/disable track changes extraction. Default: auto-detect",
+)
+def extract(input_file: str, output: str | None, force: bool, pack: bool, track_changes: bool | None) -> None:
+    """Extract a Word document into a sidedoc directory.
+
+    Converts document.docx to document.sidedoc/ directory (or document.sdoc with --pack).
+
+    Track changes behavior:
+    - Default: Auto-detect track changes in the document
+    - --track-changes: Force extract track changes as CriticMarkup
+    - --no-track-changes: Accept all changes (ignore track changes)
+    """
+    from docx import Document
+
+    from sidedoc.extract import blocks_to_markdown, extract_all, extract_section_metadata, extract_sections
+    from sidedoc.package import create_sidedoc_archive, create_sidedoc_directory
+
+    try:
+        if pack:
+            # Create ZIP archive with .sdoc extension
+            if output is None:
+                output = str(Path(input_file).with_suffix(SIDEDOC_ZIP_EXTENSION))
+            else:
+                output = ensure_sdoc_extension(output)
+
+            doc = Document(input_file)
+            blocks, styles, image_data = extract_all(doc, track_changes=track_changes)
+            sections = extract_sections(body=doc.element.body)
+            hf_sections, section_images = extract_section_metadata(doc)
+            image_data.update(section_images)
+            content_md = blocks_to_markdown(blocks)
+            create_sidedoc_archive(output, content_md, blocks, styles, input_file, image_data, sections, hf_sections)
+        else:
+            # Create directory with .sidedoc extension
+            if output is None:
+                output = str(Path(input_file).with_suffix(SIDEDOC_DIR_EXTENSION))
+            else:
+                output = ensure_sidedoc_extension(output)
+
+            output_path = Path(output)
+            if output_path.is_symlink():
+                click.echo("Error: output path is a symlink.", err=True)
+                sys.exit(EXIT_ERROR)
+
+            if output_path.exists():
+                if not force:
+                    click.echo(
+                        f"Error: {output} already exists. Use --force to overwrite.",
+                        err=True,
+                    )
+                    sys.exit(EXIT_ERROR)
+                shutil.rmtree(output_path)
+
+            doc = Document(input_file)
+            blocks, styles, image_data = extract_all(doc, track_changes=track_changes)
+            sections = extract_sections(body=doc.element.body)
+            hf_sections, section_images = extract_section_metadata(doc)
+            image_data.update(section_images)
+            content_md = blocks_to_markdown(blocks)
+            create_sidedoc_directory(output, content_md, blocks, styles, input_file, image_data, sections, hf_sections)
+
+        click.echo(f"✓ Extracted to {output}")
+        sys.exit(EXIT_SUCCESS)
+    except FileNotFoundError:
+        click.echo(f"Error: File not found: {input_file}", err=True)
+        sys.exit(EXIT_NOT_FOUND)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
@@ -0,0 +1,44 @@
+"""The ``sidedoc info`` command."""
+
+import sys
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_SUCCESS
+from sidedoc.constants import HASH_DISPLAY_LENGTH
+from sidedoc.store import SidedocStore
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+def info(input_file: str) -> None:
+    """Display metadata about a sidedoc.
+
+    Shows version, timestamps, source info, and hashes from manifest.json.
+    """
+    try:
+        with SidedocStore.open(input_file) as store:
+            if store.is_zip:
+                click.echo("Tip: Use `sidedoc unpack` to convert to directory format for editing.", err=True)
+
+            if not store.has_file("manifest.json"):
+                click.echo("No manifest found. Run `sidedoc sync` to generate metadata.")
+                sys.exit(EXIT_SUCCESS)
+
+            manifest = store.read_json("manifest.json")
+
+            click.echo("Sidedoc Information")
+            click.echo("=" * 40)
+            click.echo(f"Format:        {'directory' if store.is_directory else 'ZIP archive'}")
+            click.echo(f"Version:       {manifest.get('sidedoc_version', 'N/A')}")
+            click.echo(f"Created:       {manifest.get('created_at', 'N/A')}")
+            click.echo(f"Modified:      {manifest.get('modified_at', 'N/A')}")
+            click.echo(f"Source File:   {manifest.get('source_file', 'N/A')}")
+            click.echo(f"Source Hash:   {manifest.get('source_hash', 'N/A')[:HASH_DISPLAY_LENGTH]}...")
+            click.echo(f"Content Hash:  {manifest.get('content_hash', 'N/A')[:HASH_DISPLAY_LENGTH]}...")
+            click.echo(f"Generator:     {manifest.get('generator', 'N/A')}")
+
+            sys.exit(EXIT_SUCCESS)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
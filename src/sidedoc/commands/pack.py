@@ -0,0 +1,77 @@
+"""The ``sidedoc pack`` command."""
+
+import sys
+import zipfile
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_INVALID_FORMAT, EXIT_SUCCESS, _parse_json_files
+from sidedoc.constants import (
+    ALL_FILES,
+    JSON_FILES,
+    MAX_ASSET_SIZE,
+    PRECOMPRESSED_EXTENSIONS,
+    SIDEDOC_ZIP_EXTENSION,
+    TRACKING_FILES,
+)
+from sidedoc.utils import ensure_sdoc_extension
+
+
+@click.command()
+@click.argument("input_dir", type=click.Path(exists=True))
+@click.option("-o", "--output", help="Output path for .sdoc file (default: alongside input)")
+def pack(input_dir: str, output: str | None) -> None:
+    """Create a .sdoc ZIP archive from a .sidedoc/ directory.
+
+    All files (content.md, styles.json, structure.json, manifest.json) must be present.
+    Run `sidedoc sync` first to generate tracking files if needed.
+    """
+    try:
+        input_path = Path(input_dir)
+
+        # Require all files for ZIP distribution
+        required = ALL_FILES
+        for req_file in required:
+            if not (input_path / req_file).exists():
+                if req_file in TRACKING_FILES:
+                    click.echo(
+                        f"✗ Missing required file: {req_file}. Run `sidedoc sync` first to generate tracking files.",
+                        err=True,
+                    )
+                else:
+                    click.echo(f"✗ Missing required file: {req_file}", err=True)
+                sys.exit(EXIT_INVALID_FORMAT)
+
+        _parse_json_files({
+            json_file: (input_path / json_file).read_bytes()
+            for json_file in JSON_FILES
+        })
+
+        # Size-check every file before creating the archive so an oversized
+        # file never leaves a partial .sdoc behind
+        files = [p for p in input_path.rglob("*") if p.is_file()]
+        for file_path in files:
+            if file_path.stat().st_size > MAX_ASSET_SIZE:
+                arcname = str(file_path.relative_to(input_path))
+                click.echo(f"✗ File exceeds MAX_ASSET_SIZE: {arcname}", err=True)
+                sys.exit(EXIT_INVALID_FORMAT)
+
+        if output is None:
+            output = str(input_path.with_suffix(SIDEDOC_ZIP_EXTENSION))
+        else:
+            output = ensure_sdoc_extension(output)
+
+        with zipfile.ZipFile(output, "w", zipfile.ZIP_DEFLATED) as zip_file:
+            for file_path in files:
+                arcname = str(file_path.relative_to(input_path))
+                if file_path.suffix.lower() in PRECOMPRESSED_EXTENSIONS:
+                    zip_file.write(file_path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zip_file.write(file_path, arcname)
+
+        click.echo(f"✓ Packed to {output}")
+        sys.exit(EXIT_SUCCESS)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
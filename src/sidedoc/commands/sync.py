@@ -0,0 +1,75 @@
+"""The ``sidedoc sync`` command."""
+
+import sys
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import (
+    EXIT_ERROR,
+    EXIT_NOT_FOUND,
+    EXIT_SUCCESS,
+    _convert_structure_to_blocks,
+    _read_sidedoc_files,
+    _reject_if_zip,
+)
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+@click.option("-o", "--output", help="Optional: build updated docx to this path")
+@click.option("--author", default="Sidedoc AI", help="Author name for track changes (default: 'Sidedoc AI')")
+def sync(input_file: str, output: str | None, author: str) -> None:
+    """Sync changes from edited content.md back to the document.
+
+    Updates structure.json, remaps styles.json, and updates manifest.json.
+    Only works with .sidedoc/ directories.
+
+    CriticMarkup syntax ({++insert++}, {--delete--}, {~~old~>new~~}) in content.md
+    will be converted to track changes in the output docx with the specified author.
+    """
+    from sidedoc.reconstruct import parse_markdown_to_blocks
+    from sidedoc.sync import match_blocks, sync_sidedoc_to_docx, update_sidedoc_metadata
+
+    try:
+        _reject_if_zip(Path(input_file), "sync")
+
+        content_md, styles_data, old_structure = _read_sidedoc_files(input_file)
+        new_blocks = parse_markdown_to_blocks(content_md)
+
+        # Match blocks for style remapping
+        old_blocks = _convert_structure_to_blocks(old_structure)
+        matches = match_blocks(old_blocks, new_blocks)
+
+        update_sidedoc_metadata(
+            input_file,
+            new_blocks,
+            content_md,
+            matches=matches,
+            styles_data=styles_data,
+            existing_structure=old_structure,
+        )
+
+        click.echo(f"✓ Synced changes in {input_file}")
+
+        if output:
+            # Use sync_sidedoc_to_docx for track changes support
+            # Section metadata and blocks are unchanged by the metadata update,
+            # so reuse them rather than re-parsing structure.json and content.md
+            sync_sidedoc_to_docx(
+                input_file,
+                output,
+                author=author,
+                blocks=new_blocks,
+                structure_data=old_structure,
+            )
+            click.echo(f"✓ Built updated document: {output}")
+
+        sys.exit(EXIT_SUCCESS)
+
+    except FileNotFoundError:
+        click.echo(f"Error: File not found: {input_file}", err=True)
+        sys.exit(EXIT_NOT_FOUND)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
@@ -0,0 +1,83 @@
+"""The ``sidedoc unpack`` command."""
+
+import shutil
+import sys
+import zipfile
+from pathlib import Path
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_INVALID_FORMAT, EXIT_SUCCESS
+from sidedoc.constants import SIDEDOC_DIR_EXTENSION, ZIP_COPY_CHUNK_SIZE
+from sidedoc.utils import is_safe_path
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+@click.option("-o", "--output", help="Output directory for unpacked contents (default: input with .sidedoc extension)")
+def unpack(input_file: str, output: str | None) -> None:
+    """Unpack a .sdoc ZIP archive to a .sidedoc/ directory.
+
+    Also accepts legacy .sidedoc ZIP files.
+    """
+    try:
+        input_path = Path(input_file)
+
+        if not zipfile.is_zipfile(input_path):
+            click.echo(f"Error: {input_file} is not a ZIP archive", err=True)
+            sys.exit(EXIT_INVALID_FORMAT)
+
+        if output is None:
+            output = str(input_path.with_suffix(SIDEDOC_DIR_EXTENSION))
+
+        output_path = Path(output)
+
+        # Edge case: if input is a .sidedoc ZIP and output would collide
+        if input_path.resolve() == output_path.resolve():
+            click.echo(
+                "Error: Input and output would have the same name. Use `-o` to specify a different output path.",
+                err=True,
+            )
+            sys.exit(EXIT_ERROR)
+
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        with zipfile.ZipFile(input_file, "r") as zip_file:
+            members = zip_file.infolist()
+            for member_info in members:
+                if not is_safe_path(member_info.filename, output_path):
+                    click.echo(
+                        "Error: Archive contains invalid path that could lead to path traversal: "
+                        f"{member_info.filename}",
+                        err=True,
+                    )
+                    sys.exit(EXIT_INVALID_FORMAT)
+
+            # Create every directory in one pass so the copy loop only writes files
+            directories = {
+                (output_path / member_info.filename).parent
+                for member_info in members
+                if not member_info.is_dir()
+            }
+            directories.update(
+                output_path / member_info.filename for member_info in members if member_info.is_dir()
+            )
+            for directory in sorted(directories):
+                directory.mkdir(parents=True, exist_ok=True)
+
+            # Stream each member to disk with a tuned copy buffer
+            for member_info in members:
+                if member_info.is_dir():
+                    continue
+                target = output_path / member_info.filename
+                with zip_file.open(member_info) as src, open(target, "wb", buffering=0) as dst:
+                    shutil.copyfileobj(src, dst, ZIP_COPY_CHUNK_SIZE)
+
+        click.echo(f"✓ Unpacked to {output}")
+        sys.exit(EXIT_SUCCESS)
+    except zipfile.BadZipFile:
+        click.echo(f"Error: Invalid sidedoc file: {input_file}", err=True)
+        sys.exit(EXIT_INVALID_FORMAT)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
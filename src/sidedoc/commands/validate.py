@@ -0,0 +1,225 @@
+"""The ``sidedoc validate`` command."""
+
+import sys
+import zipfile
+
+import click
+
+from sidedoc.cli import EXIT_ERROR, EXIT_INVALID_FORMAT, EXIT_SUCCESS, _parse_json_files
+from sidedoc.constants import ALL_FILES, CORE_FILES, JSON_FILES, TRACKING_FILES
+from sidedoc.store import SidedocStore, detect_sidedoc_format
+
+
+def _validate_track_changes(structure: dict, content: str) -> list[str]:
+    """Validate track changes in structure.json.
+
+    Checks:
+    - Track change positions are within block bounds
+    - Track change metadata is complete (author, date)
+
+    Args:
+        structure: Parsed structure.json data
+        content: Content from content.md
+
+    Returns:
+        List of warning messages (empty if no issues)
+    """
+    warnings = []
+
+    for block in structure.get("blocks", []):
+        block_id = block.get("id", "unknown")
+        track_changes = block.get("track_changes") or []
+        content_start = block.get("content_start", 0)
+        content_end = block.get("content_end", 0)
+        block_length = content_end - content_start
+
+        for i, tc in enumerate(track_changes):
+            tc_start = tc.get("start", 0)
+            tc_end = tc.get("end", 0)
+
+            # Check positions are within block bounds
+            if tc_end > block_length:
+                warnings.append(
+                    f"Track change {i+1} in {block_id} has invalid position: "
+                    f"end ({tc_end}) exceeds block length ({block_length})"
+                )
+
+            # Check start is before end
+            if tc_start > tc_end:
+                warnings.append(
+                    f"Track change {i+1} in {block_id} has invalid positions: "
+                    f"start ({tc_start}) is after end ({tc_end})"
+                )
+
+            # Check metadata completeness
+            if not tc.get("author"):
+                warnings.append(
+                    f"Track change {i+1} in {block_id} is missing author metadata"
+                )
+            if not tc.get("date"):
+                warnings.append(
+                    f"Track change {i+1} in {block_id} is missing date metadata"
+                )
+
+    return warnings
+
+
+def _validate_tables(structure: dict, content: str, styles: dict | None = None) -> list[str]:
+    """Validate table blocks in structure.json against content.md.
+
+    Checks:
+    - Table metadata rows/cols match content dimensions
+    - Merged cell regions are within bounds
+    - styles.json has entries for table blocks (when styles provided)
+
+    Args:
+        structure: Parsed structure.json data
+        content: Content from content.md
+        styles: Optional parsed styles.json data
+
+    Returns:
+        List of warning messages (empty if no issues)
+    """
+    from sidedoc.reconstruct import parse_gfm_table, validate_gfm_table_dimensions
+
+    warnings = []
+
+    for block in structure.get("blocks", []):
+        if block.get("type") != "table":
+            continue
+
+        block_id = block.get("id", "unknown")
+        metadata = block.get("table_metadata")
+        if not metadata:
+            continue
+
+        # Extract table content from content.md
+        start = block.get("content_start", 0)
+        end = block.get("content_end", 0)
+        table_content = content[start:end]
+
+        # Parse GFM to get actual dimensions
+        try:
+            validate_gfm_table_dimensions(table_content)
+            rows, _ = parse_gfm_table(table_content)
+        except ValueError as e:
+            warnings.append(f"Table {block_id}: unable to parse GFM content: {e}")
+            continue
+
+        actual_rows = len(rows)
+        actual_cols = len(rows[0]) if rows else 0
+        expected_rows = metadata.get("rows", 0)
+        expected_cols = metadata.get("cols", 0)
+
+        if actual_rows != expected_rows:
+            warnings.append(
+                f"Table {block_id}: row count mismatch "
+                f"(metadata={expected_rows}, content={actual_rows})"
+            )
+        if actual_cols != expected_cols:
+            warnings.append(
+                f"Table {block_id}: column count mismatch "
+                f"(metadata={expected_cols}, content={actual_cols})"
+            )
+
+        # Validate merged cell regions
+        for merge in metadata.get("merged_cells", []):
+            end_row = merge.get("start_row", 0) + merge.get("row_span", 1) - 1
+            end_col = merge.get("start_col", 0) + merge.get("col_span", 1) - 1
+            if end_row >= expected_rows:
+                warnings.append(
+                    f"Table {block_id}: merged cell exceeds row bounds "
+                    f"(end_row={end_row}, rows={expected_rows})"
+                )
+            if end_col >= expected_cols:
+                warnings.append(
+                    f"Table {block_id}: merged cell exceeds column bounds "
+                    f"(end_col={end_col}, cols={expected_cols})"
+                )
+
+    # Check styles.json for missing table formatting entries
+    if styles is not None:
+        block_styles = styles.get("block_styles", {})
+        for block in structure.get("blocks", []):
+            if block.get("type") != "table":
+                continue
+            block_id = block.get("id", "unknown")
+            if block_id not in block_styles:
+                warnings.append(
+                    f"Table {block_id}: no style entry in styles.json"
+                )
+            elif "table_formatting" not in block_styles[block_id]:
+                warnings.append(
+                    f"Table {block_id}: missing table_formatting in style entry"
+                )
+
+    return warnings
+
+
+@click.command()
+@click.argument("input_file", type=click.Path(exists=True))
+def validate(input_file: str) -> None:
+    """Validate a sidedoc directory or archive for correctness.
+
+    For directories: content.md + styles.json required; structure.json + manifest.json optional.
+    For ZIP archives (.sdoc): all files required.
+    Also checks track change integrity when structure.json is present.
+    """
+    try:
+        fmt = detect_sidedoc_format(input_file)
+        with SidedocStore.open(input_file) as store:
+            if fmt == "zip":
+                click.echo("Tip: Use `sidedoc unpack` to convert to directory format for editing.", err=True)
+
+            files = set(store.list_files())
+
+            if fmt == "zip":
+                # ZIP: all files required
+                required = ALL_FILES
+            else:
+                # Directory: only core files required
+                required = CORE_FILES
+
+            missing = [f for f in required if f not in files]
+            if missing:
+                click.echo(f"✗ Missing required files: {', '.join(missing)}", err=True)
+                sys.exit(EXIT_INVALID_FORMAT)
+
+            # Check for optional tracking files in directory format
+            if fmt == "directory":
+                missing_tracking = [f for f in TRACKING_FILES if f not in files]
+                if missing_tracking:
+                    click.echo(f"Note: Optional tracking files not present: {', '.join(missing_tracking)}")
+                    click.echo("Run `sidedoc sync` to generate them.")
+
+            # Validate JSON files, parsing each once for reuse below
+            payloads = {f: store.read_bytes(f) for f in JSON_FILES if f in files}
+            parsed = _parse_json_files(payloads)
+
+            # Validate track changes and tables if structure.json is present
+            if "structure.json" in parsed and "content.md" in files:
+                content = store.read_text("content.md")
+                structure = parsed["structure.json"]
+                styles_data = parsed.get("styles.json")
+
+                tc_warnings = _validate_track_changes(structure, content)
+                table_warnings = _validate_tables(structure, content, styles_data)
+                all_warnings = tc_warnings + table_warnings
+
+                if all_warnings:
+                    for warning in all_warnings:
+                        click.echo(f"⚠ Warning: {warning}", err=True)
+                    click.echo(f"✗ Sidedoc has {len(all_warnings)} issue(s)")
+                    sys.exit(EXIT_INVALID_FORMAT)
+
+            click.echo("✓ Sidedoc is valid")
+            sys.exit(EXIT_SUCCESS)
+    except ValueError:
+        click.echo(f"✗ Not a valid sidedoc: {input_file}", err=True)
+        sys.exit(EXIT_INVALID_FORMAT)
+    except zipfile.BadZipFile:
+        click.echo(f"✗ Invalid ZIP file: {input_file}", err=True)
+        sys.exit(EXIT_INVALID_FORMAT)
+    except Exception as e:
+        click.echo(f"Error: {e}", err=True)
+        sys.exit(EXIT_ERROR)
@@ -3,7 +3,7 @@
 This module centralizes magic numbers and configuration values for better maintainability.
 """
 
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+from typing import Any
 
 # =============================================================================
 # XML Namespace Constants
@@ -15,6 +15,13 @@ WORDPROCESSINGML_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/m
 # XML namespace for preserving whitespace (used in reconstruct.py and sync.py)
 XML_SPACE_NS = "{http://www.w3.org/XML/1998/namespace}space"
 
+# CLI exit codes as per specification (re-exported by sidedoc.cli)
+EXIT_SUCCESS = 0
+EXIT_ERROR = 1
+EXIT_NOT_FOUND = 2
+EXIT_INVALID_FORMAT = 3
+EXIT_SYNC_CONFLICT = 4
+
 # Hash display length for CLI output
 # Used when displaying abbreviated hash values in info command
 HASH_DISPLAY_LENGTH = 16
@@ -31,6 +38,14 @@ DEFAULT_IMAGE_WIDTH_INCHES = 3.0
 # Buffer size in bytes for reading files in chunks when computing hashes
 FILE_READ_CHUNK_SIZE = 4096
 
+# Copy buffer size for extracting archive members
+# 1MB chunks mean most assets are copied with a single read/write pair
+ZIP_COPY_CHUNK_SIZE = 1024 * 1024
+
+# File extensions whose contents are already compressed
+# Stored rather than deflated when packing, since deflate gains almost nothing on them
+PRECOMPRESSED_EXTENSIONS = frozenset({".png", ".jpg", ".jpeg", ".gif", ".webp", ".pdf"})
+
 # Maximum image size (10MB)
 # Prevents memory issues and potential attacks from extremely large images
 MAX_IMAGE_SIZE = 10 * 1024 * 1024
@@ -51,14 +66,9 @@ SIMILARITY_THRESHOLD = 0.7
 # Default alignment when none specified
 DEFAULT_ALIGNMENT = "left"
 
-# Alignment string to WD_ALIGN_PARAGRAPH enum mapping
-# Used when applying alignment from styles to paragraphs
-ALIGNMENT_STRING_TO_ENUM = {
-    "left": WD_ALIGN_PARAGRAPH.LEFT,
-    "center": WD_ALIGN_PARAGRAPH.CENTER,
-    "right": WD_ALIGN_PARAGRAPH.RIGHT,
-    "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
-}
+# Alignment string to WD_ALIGN_PARAGRAPH enum mapping (ALIGNMENT_STRING_TO_ENUM)
+# Used when applying alignment from styles to paragraphs. Built on first access
+# by __getattr__ below so importing constants does not load python-docx.
 
 # WD_ALIGN_PARAGRAPH numeric value to string mapping
 # Used when extracting alignment from paragraphs (enum value → string for JSON)
@@ -69,6 +79,24 @@ ALIGNMENT_NUMERIC_TO_STRING = {
     3: "justify",   # WD_ALIGN_PARAGRAPH.JUSTIFY
 }
 
+# WD_ALIGN_PARAGRAPH numeric value to GFM table column alignment
+# GFM tables only support left/center/right, so justify maps to left
+ALIGNMENT_NUMERIC_TO_GFM = {
+    0: "left",      # WD_ALIGN_PARAGRAPH.LEFT
+    1: "center",    # WD_ALIGN_PARAGRAPH.CENTER
+    2: "right",     # WD_ALIGN_PARAGRAPH.RIGHT
+    3: "left",      # WD_ALIGN_PARAGRAPH.JUSTIFY → left for GFM
+}
+
+# Table w:jc value to alignment string (start/end are the bidi-aware names)
+TABLE_JC_TO_ALIGNMENT = {
+    "left": "left",
+    "center": "center",
+    "right": "right",
+    "start": "left",
+    "end": "right",
+}
+
 # Maximum table dimensions to prevent memory exhaustion from malicious input
 MAX_TABLE_ROWS = 1000
 MAX_TABLE_COLS = 100
@@ -186,6 +214,23 @@ SIDEDOC_DIR_EXTENSION = ".sidedoc"
 SIDEDOC_ZIP_EXTENSION = ".sdoc"
 
 # File classification for sidedoc containers
-CORE_FILES = ["content.md", "styles.json"]           # Required for build
-TRACKING_FILES = ["structure.json", "manifest.json"]  # Required for sync/diff
-ALL_FILES = CORE_FILES + TRACKING_FILES               # Required in .sdoc ZIP
+CORE_FILES: tuple[str, ...] = ("content.md", "styles.json")           # Required for build
+TRACKING_FILES: tuple[str, ...] = ("structure.json", "manifest.json")  # Required for sync/diff
+ALL_FILES: tuple[str, ...] = CORE_FILES + TRACKING_FILES               # Required in .sdoc ZIP
+JSON_FILES: tuple[str, ...] = ("structure.json", "styles.json", "manifest.json")  # Parsed by validate/pack
+
+
+def __getattr__(name: str) -> Any:
+    """Build python-docx-backed constants on first access."""
+    if name == "ALIGNMENT_STRING_TO_ENUM":
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+        value = {
+            "left": WD_ALIGN_PARAGRAPH.LEFT,
+            "center": WD_ALIGN_PARAGRAPH.CENTER,
+            "right": WD_ALIGN_PARAGRAPH.RIGHT,
+            "justify": WD_ALIGN_PARAGRAPH.JUSTIFY,
+        }
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
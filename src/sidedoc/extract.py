@@ -1,7 +1,9 @@
 """Extract content from Word documents to sidedoc format."""
 
+import functools
 import hashlib
 import io
+import os
 from pathlib import Path
 from typing import Any, Literal, Optional
 from docx import Document
@@ -16,9 +18,11 @@ from sidedoc.constants import (
     MAX_TABLE_ROWS,
     MAX_TABLE_COLS,
     EMUS_PER_INCH,
+    ALIGNMENT_NUMERIC_TO_GFM,
     ALIGNMENT_NUMERIC_TO_STRING,
     GFM_ALIGNMENT_TO_SEPARATOR,
     DEFAULT_ALIGNMENT,
+    TABLE_JC_TO_ALIGNMENT,
     WORDPROCESSINGML_NS,
 )
 
@@ -31,6 +35,61 @@ WPS_NS = "http://schemas.microsoft.com/office/word/2010/wordprocessingShape"
 MC_NS = "http://schemas.openxmlformats.org/markup-compatibility/2006"
 CHART_NS = "http://schemas.openxmlformats.org/drawingml/2006/chart"
 
+# Clark-notation tags built once for the per-paragraph image scan
+_W_R = f"{{{WORDPROCESSINGML_NS}}}r"
+_W_DRAWING = f"{{{WORDPROCESSINGML_NS}}}drawing"
+_A_BLIP = f"{{{DRAWINGML_NS}}}blip"
+_R_EMBED = f"{{{RELATIONSHIPS_NS}}}embed"
+
+# Clark-notation tags for the per-child dispatch in extract_paragraph_content
+_W_P = f"{{{WORDPROCESSINGML_NS}}}p"
+_W_INS = f"{{{WORDPROCESSINGML_NS}}}ins"
+_W_DEL = f"{{{WORDPROCESSINGML_NS}}}del"
+_W_HYPERLINK = f"{{{WORDPROCESSINGML_NS}}}hyperlink"
+_W_T = f"{{{WORDPROCESSINGML_NS}}}t"
+_W_BR = f"{{{WORDPROCESSINGML_NS}}}br"
+_W_RPR = f"{{{WORDPROCESSINGML_NS}}}rPr"
+_W_FOOTNOTE_REFERENCE = f"{{{WORDPROCESSINGML_NS}}}footnoteReference"
+_W_ENDNOTE_REFERENCE = f"{{{WORDPROCESSINGML_NS}}}endnoteReference"
+_W_ID = f"{{{WORDPROCESSINGML_NS}}}id"
+_W_TYPE = f"{{{WORDPROCESSINGML_NS}}}type"
+_W_VAL = f"{{{WORDPROCESSINGML_NS}}}val"
+_W_AUTHOR = f"{{{WORDPROCESSINGML_NS}}}author"
+_W_DATE = f"{{{WORDPROCESSINGML_NS}}}date"
+
+# Run property tags checked by is_formatting_enabled, keyed by local name
+_W_FORMAT_TAGS = {tag: f"{{{WORDPROCESSINGML_NS}}}{tag}" for tag in ("b", "i", "u")}
+
+
+# Module-level alias saves a hashlib attribute lookup for every block hashed
+_sha256 = hashlib.sha256
+
+# Number of block hashes memoized by compute_content_hash, and the longest
+# content kept as a cache key (longer blocks are hashed without caching).
+# Together they cap the cached keys at 4096 * 2048 = 8M characters.
+CONTENT_HASH_CACHE_SIZE = 4096
+MAX_CACHED_CONTENT_LENGTH = 2048
+
+# Number of distinct heading style names whose parsed level is memoized
+HEADING_LEVEL_CACHE_SIZE = 64
+
+
+def _open_document(docx: str | os.PathLike[str] | Any) -> Any:
+    """Open a .docx path, or pass an already-opened Document through.
+
+    Callers that run several extractors over one file should open it once
+    and pass the Document to each of them.
+
+    Args:
+        docx: Path to .docx file, or an already-opened Document
+
+    Returns:
+        python-docx Document object
+    """
+    if not isinstance(docx, (str, os.PathLike)):
+        return docx
+    return Document(os.fspath(docx))
+
 
 def wrap_formatting(text: str, bold: bool, italic: bool) -> str:
     """Wrap text with markdown bold/italic markers.
@@ -82,16 +141,67 @@ def generate_block_id(index: int) -> str:
     return f"block-{index}"
 
 
+@functools.lru_cache(maxsize=CONTENT_HASH_CACHE_SIZE)
+def _cached_content_hash(content: str) -> str:
+    """Memoized SHA256 hex digest of content."""
+    return _sha256(content.encode("utf-8")).hexdigest()
+
+
 def compute_content_hash(content: str) -> str:
     """Compute SHA256 hash of content.
 
+    Unchanged blocks on repeated extractions are served from an LRU cache.
+    Content longer than MAX_CACHED_CONTENT_LENGTH is hashed directly, so the
+    cache holds at most CONTENT_HASH_CACHE_SIZE * MAX_CACHED_CONTENT_LENGTH
+    characters of block text.
+
     Args:
         content: Block content text
 
     Returns:
         Hex digest of content hash
     """
-    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+    if len(content) > MAX_CACHED_CONTENT_LENGTH:
+        return _sha256(content.encode("utf-8")).hexdigest()
+    return _cached_content_hash(content)
+
+
+@functools.lru_cache(maxsize=HEADING_LEVEL_CACHE_SIZE)
+def _heading_level(style_name: str) -> int:
+    """Parse the level from a heading style name such as "Heading 2".
+
+    Args:
+        style_name: Paragraph style name starting with "Heading"
+
+    Returns:
+        Heading level, or 1 if the name has no trailing number
+    """
+    try:
+        return int(style_name.split()[-1])
+    except (ValueError, IndexError):
+        return 1
+
+
+def _sniff_format(image_bytes: bytes) -> str | None:
+    """Identify a raster image format from its leading magic bytes.
+
+    Args:
+        image_bytes: Raw image data
+
+    Returns:
+        PIL format name (e.g., 'PNG', 'JPEG'), or None if not recognized
+    """
+    if image_bytes[:8] == b'\x89PNG\r\n\x1a\n':
+        return "PNG"
+    if image_bytes[:3] == b'\xff\xd8\xff':
+        return "JPEG"
+    if image_bytes[:6] in (b'GIF87a', b'GIF89a'):
+        return "GIF"
+    if image_bytes[:2] == b'BM':
+        return "BMP"
+    if image_bytes[:4] in (b'II*\x00', b'MM\x00*'):
+        return "TIFF"
+    return None
 
 
 def validate_image(image_bytes: bytes, expected_extension: str) -> tuple[bool, str]:
@@ -126,38 +236,35 @@ def validate_image(image_bytes: bytes, expected_extension: str) -> tuple[bool, s
             return False, "Invalid WMF: magic bytes not found"
         return True, ""
 
-    # Validate image data and format using PIL
+    # Map extensions to PIL formats
+    # Why mapping: PIL uses format names like "JPEG" while file extensions are
+    # "jpg" or "jpeg". We need to normalize for comparison.
+    extension_to_format = {
+        'png': 'PNG',
+        'jpg': 'JPEG',
+        'jpeg': 'JPEG',
+        'gif': 'GIF',
+        'bmp': 'BMP',
+        'tiff': 'TIFF',
+        'tif': 'TIFF',
+    }
+    expected_format = extension_to_format.get(ext_lower)
+
+    # Why check format: Detects extension spoofing (e.g., malware.exe renamed
+    # to image.png). Sniffing the header rejects a mismatch before PIL is involved.
+    sniffed_format = _sniff_format(image_bytes)
+    if expected_format and sniffed_format and sniffed_format != expected_format:
+        return False, f"Image format mismatch (extension: {expected_extension}, actual: {sniffed_format})"
+
+    # Validate image integrity using PIL
     try:
-        # First pass: verify image integrity
         # Why verify: Detects corrupted or malicious image data before we try to
         # process it further. This prevents crashes from malformed images.
-        # Note: We must load the image twice because PIL's verify() method makes
-        # the image object unusable for further operations. This is a known PIL
-        # limitation. For large images near the 10MB limit, this doubles memory
-        # usage temporarily, but it's necessary to ensure both integrity and
-        # format validation.
+        # verify() leaves the image unusable, but .format is still set, so a
+        # single open covers formats the sniffer does not recognize as well.
         img = Image.open(io.BytesIO(image_bytes))
-        img.verify()  # Verify that it's a valid image
-
-        # Second pass: reopen to check format (verify() makes the image unusable)
-        # Why check format: Detects extension spoofing (e.g., malware.exe renamed
-        # to image.png). We verify the actual image format matches the extension.
-        img = Image.open(io.BytesIO(image_bytes))
-
-        # Map extensions to PIL formats
-        # Why mapping: PIL uses format names like "JPEG" while file extensions are
-        # "jpg" or "jpeg". We need to normalize for comparison.
-        extension_to_format = {
-            'png': 'PNG',
-            'jpg': 'JPEG',
-            'jpeg': 'JPEG',
-            'gif': 'GIF',
-            'bmp': 'BMP',
-            'tiff': 'TIFF',
-            'tif': 'TIFF',
-        }
+        img.verify()
 
-        expected_format = extension_to_format.get(expected_extension.lower())
         if expected_format and img.format != expected_format:
             return False, f"Image format mismatch (extension: {expected_extension}, actual: {img.format})"
 
@@ -174,7 +281,11 @@ def validate_image(image_bytes: bytes, expected_extension: str) -> tuple[bool, s
 
 
 def _extract_blip_image(
-    blip: Any, doc_part: Any, filename_prefix: str, counter: int
+    blip: Any,
+    doc_part: Any,
+    filename_prefix: str,
+    counter: int,
+    validated_parts: Optional[dict[Any, str]] = None,
 ) -> Optional[tuple[str, str, bytes, str]]:
     """Extract image data from a blip element via relationship lookup.
 
@@ -183,11 +294,13 @@ def _extract_blip_image(
         doc_part: Document part for accessing relationships
         filename_prefix: Prefix for the filename (e.g., "image" or "chart")
         counter: Counter for generating unique filenames
+        validated_parts: Optional cache of validation error messages keyed by
+            image part, so an image referenced repeatedly is validated once
 
     Returns:
         Tuple of (filename, extension, image_bytes, error_message) or None.
     """
-    r_embed = blip.get(f'{{{RELATIONSHIPS_NS}}}embed')
+    r_embed = blip.get(_R_EMBED)
     if not r_embed or r_embed not in doc_part.rels:
         return None
 
@@ -200,22 +313,33 @@ def _extract_blip_image(
     extension = ''.join(c for c in raw_ext if c.isalnum())[:10] or "bin"
     image_bytes = image_part.blob
 
-    is_valid, error_message = validate_image(image_bytes, extension)
-    # Enforce validate_image contract: is_valid=False must include an error message
-    if not is_valid and not error_message:
-        error_message = "Image failed validation"
+    if validated_parts is not None and image_part in validated_parts:
+        error_message = validated_parts[image_part]
+    else:
+        is_valid, error_message = validate_image(image_bytes, extension)
+        # Enforce validate_image contract: is_valid=False must include an error message
+        if not is_valid and not error_message:
+            error_message = "Image failed validation"
+        if validated_parts is not None:
+            validated_parts[image_part] = error_message
     image_filename = f"{filename_prefix}{counter}.{extension}"
 
     return (image_filename, extension, image_bytes, error_message)
 
 
-def extract_image_from_paragraph(paragraph: Any, doc_part: Any, image_counter: int) -> Optional[tuple[str, str, bytes, str]]:
+def extract_image_from_paragraph(
+    paragraph: Any,
+    doc_part: Any,
+    image_counter: int,
+    validated_parts: Optional[dict[Any, str]] = None,
+) -> Optional[tuple[str, str, bytes, str]]:
     """Check if paragraph contains an image and extract it.
 
     Args:
         paragraph: python-docx paragraph object
         doc_part: Document part for accessing relationships
         image_counter: Counter for generating unique image names
+        validated_parts: Optional validation cache shared across paragraphs
 
     Returns:
         Tuple of (image_filename, image_extension, image_bytes, error_message) if image found.
@@ -225,12 +349,12 @@ def extract_image_from_paragraph(paragraph: Any, doc_part: Any, image_counter: i
     # Check for drawing elements (images) in paragraph runs
     # Why check runs: Word documents store images inside run elements within paragraphs.
     # A paragraph may have multiple runs, and any of them could contain an image.
-    for run in paragraph.runs:
-        drawing_elems = run._element.findall(f'.//{{{WORDPROCESSINGML_NS}}}drawing')
-        for drawing in drawing_elems:
-            blips = drawing.findall(f'.//{{{DRAWINGML_NS}}}blip')
-            for blip in blips:
-                result = _extract_blip_image(blip, doc_part, "image", image_counter)
+    # Walk the w:r children directly (the same runs as paragraph.runs) without
+    # building Run wrappers, using iter() rather than re-parsed findall paths.
+    for run_elem in paragraph._p.iterchildren(_W_R):
+        for drawing in run_elem.iter(_W_DRAWING):
+            for blip in drawing.iter(_A_BLIP):
+                result = _extract_blip_image(blip, doc_part, "image", image_counter, validated_parts)
                 if result is not None:
                     return result
 
@@ -284,7 +408,7 @@ def extract_chart_from_paragraph(
             return ("", "", b"", "", chart_rel_id)
 
         # Case 2: Flat w:drawing with c:chart in graphicData (no mc:AlternateContent)
-        drawing_elems = run._element.findall(f'{{{WORDPROCESSINGML_NS}}}drawing')
+        drawing_elems = run._element.findall(_W_DRAWING)
         for drawing in drawing_elems:
             charts = drawing.findall(f'.//{{{CHART_NS}}}chart')
             if charts:
@@ -311,7 +435,7 @@ def extract_textbox_from_paragraph(paragraph: Any) -> Optional[list[dict[str, An
     results = []
 
     for run in paragraph.runs:
-        drawing_elems = run._element.findall(f'{{{WORDPROCESSINGML_NS}}}drawing')
+        drawing_elems = run._element.findall(_W_DRAWING)
         for drawing in drawing_elems:
             txbx_contents = drawing.findall(f'.//{{{WPS_NS}}}txbxContent')
             if not txbx_contents:
@@ -374,10 +498,10 @@ def extract_textbox_from_paragraph(paragraph: Any) -> Optional[list[dict[str, An
                 texts = []
                 # txbxContent contains WordProcessingML elements (w:p/w:r/w:t),
                 # not DrawingML elements (a:p/a:r/a:t)
-                for w_p in txbx.findall(f'{{{WORDPROCESSINGML_NS}}}p'):
+                for w_p in txbx.findall(_W_P):
                     parts = []
-                    for w_r in w_p.findall(f'{{{WORDPROCESSINGML_NS}}}r'):
-                        for w_t in w_r.findall(f'{{{WORDPROCESSINGML_NS}}}t'):
+                    for w_r in w_p.findall(_W_R):
+                        for w_t in w_r.findall(_W_T):
                             if w_t.text:
                                 parts.append(w_t.text)
                     if parts:
@@ -476,12 +600,12 @@ def is_formatting_enabled(rPr: Any, format_tag: str) -> bool:
     if rPr is None:
         return False
 
-    elem = rPr.find(f'{{{WORDPROCESSINGML_NS}}}{format_tag}')
+    elem = rPr.find(_W_FORMAT_TAGS.get(format_tag) or f'{{{WORDPROCESSINGML_NS}}}{format_tag}')
     if elem is None:
         return False
 
     # Check the val attribute
-    val = elem.get(qn('w:val'))
+    val = elem.get(_W_VAL)
     if val is None:
         # Element present without val attribute means enabled
         return True
@@ -505,47 +629,40 @@ def extract_hyperlink_text_and_formatting(hyperlink_elem: Any) -> tuple[str, boo
     is_italic = False
 
     # Find all w:r (run) elements within the hyperlink
-    for run_elem in hyperlink_elem.findall(f'.//{{{WORDPROCESSINGML_NS}}}r'):
+    for run_elem in hyperlink_elem.iter(_W_R):
         # Check for bold/italic in run properties
-        rPr = run_elem.find(f'{{{WORDPROCESSINGML_NS}}}rPr')
+        rPr = run_elem.find(_W_RPR)
         if is_formatting_enabled(rPr, 'b'):
             is_bold = True
         if is_formatting_enabled(rPr, 'i'):
             is_italic = True
 
         # Get text from w:t elements
-        for text_elem in run_elem.findall(f'{{{WORDPROCESSINGML_NS}}}t'):
+        for text_elem in run_elem.iterchildren(_W_T):
             if text_elem.text:
                 text_parts.append(text_elem.text)
 
     return "".join(text_parts), is_bold, is_italic
 
 
-def detect_track_changes(docx_path: str) -> bool:
+def detect_track_changes(docx_path: str | Any) -> bool:
     """Detect whether a Word document contains track changes.
 
     Scans the document for any w:ins (insertion) or w:del (deletion) elements
     to determine if the document has revision tracking.
 
     Args:
-        docx_path: Path to .docx file
+        docx_path: Path to .docx file, or an already-opened Document
 
     Returns:
         True if the document contains any track changes, False otherwise
     """
-    doc = Document(docx_path)
-
-    for paragraph in doc.paragraphs:
-        para_elem = paragraph._element
-
-        # Check for any insertion elements
-        ins_elements = para_elem.findall(f'.//{{{WORDPROCESSINGML_NS}}}ins')
-        if ins_elements:
-            return True
+    doc = _open_document(docx_path)
 
-        # Check for any deletion elements
-        del_elements = para_elem.findall(f'.//{{{WORDPROCESSINGML_NS}}}del')
-        if del_elements:
+    # Same paragraphs as doc.paragraphs, but one lxml iter() per paragraph finds
+    # either element without building Paragraph wrappers or findall paths
+    for para_elem in doc.element.body.iterchildren(_W_P):
+        if next(para_elem.iter(_W_INS, _W_DEL), None) is not None:
             return True
 
     return False
@@ -560,9 +677,9 @@ def extract_track_change_metadata(element: Any) -> tuple[str, str, str]:
     Returns:
         Tuple of (author, date, revision_id)
     """
-    author = element.get(f'{{{WORDPROCESSINGML_NS}}}author') or ""
-    date = element.get(f'{{{WORDPROCESSINGML_NS}}}date') or ""
-    revision_id = element.get(f'{{{WORDPROCESSINGML_NS}}}id') or ""
+    author = element.get(_W_AUTHOR) or ""
+    date = element.get(_W_DATE) or ""
+    revision_id = element.get(_W_ID) or ""
     return author, date, revision_id
 
 
@@ -627,7 +744,7 @@ def extract_paragraph_content(
     for child in para_elem:
         tag = child.tag
 
-        if tag == f'{{{WORDPROCESSINGML_NS}}}ins':
+        if tag == _W_INS:
             if mode == "normal":
                 pass  # Ignore insertions in normal mode
             elif mode == "accept_all":
@@ -650,7 +767,7 @@ def extract_paragraph_content(
                     ))
                     plain_text_position += len(inserted_text)
 
-        elif tag == f'{{{WORDPROCESSINGML_NS}}}del':
+        elif tag == _W_DEL:
             if mode == "normal" or mode == "accept_all":
                 pass  # Skip deletions in normal and accept_all modes
             elif mode == "track_changes":
@@ -669,7 +786,7 @@ def extract_paragraph_content(
                     ))
                     plain_text_position += len(deleted_text)
 
-        elif tag == f'{{{WORDPROCESSINGML_NS}}}hyperlink':
+        elif tag == _W_HYPERLINK:
             if doc_part is None:
                 continue
 
@@ -697,12 +814,12 @@ def extract_paragraph_content(
 
             plain_text_position += len(text)
 
-        elif tag == f'{{{WORDPROCESSINGML_NS}}}r':
+        elif tag == _W_R:
             # Check for footnote/endnote references in this run
-            fn_ref = child.find(f'{{{WORDPROCESSINGML_NS}}}footnoteReference')
-            en_ref = child.find(f'{{{WORDPROCESSINGML_NS}}}endnoteReference')
+            fn_ref = child.find(_W_FOOTNOTE_REFERENCE)
+            en_ref = child.find(_W_ENDNOTE_REFERENCE)
             if fn_ref is not None:
-                note_id = fn_ref.get(qn('w:id'))
+                note_id = fn_ref.get(_W_ID)
                 if note_id and int(note_id) > 0:
                     footnote_counter += 1
                     marker = f"[^{footnote_counter}]"
@@ -716,7 +833,7 @@ def extract_paragraph_content(
                     plain_text_position += len(marker)
                 continue
             if en_ref is not None:
-                note_id = en_ref.get(qn('w:id'))
+                note_id = en_ref.get(_W_ID)
                 if note_id and int(note_id) > 0:
                     footnote_counter += 1
                     marker = f"[^{footnote_counter}]"
@@ -733,11 +850,11 @@ def extract_paragraph_content(
             text_parts = []
             for run_child in child:
                 run_child_tag = run_child.tag
-                if run_child_tag == f'{{{WORDPROCESSINGML_NS}}}t':
+                if run_child_tag == _W_T:
                     if run_child.text:
                         text_parts.append(run_child.text)
-                elif run_child_tag == f'{{{WORDPROCESSINGML_NS}}}br':
-                    br_type = run_child.get(qn('w:type'))
+                elif run_child_tag == _W_BR:
+                    br_type = run_child.get(_W_TYPE)
                     if br_type == 'column':
                         text_parts.append('\n<!-- column-break -->\n')
                     else:
@@ -747,7 +864,13 @@ def extract_paragraph_content(
             if not text:
                 continue
 
-            rPr = child.find(f'{{{WORDPROCESSINGML_NS}}}rPr')
+            rPr = child.find(_W_RPR)
+            if rPr is None:
+                # Fast path: a run without w:rPr carries no bold/italic/underline
+                markdown_parts.append(text)
+                plain_text_position += len(text)
+                continue
+
             is_bold = is_formatting_enabled(rPr, 'b')
             is_italic = is_formatting_enabled(rPr, 'i')
             is_underline = is_formatting_enabled(rPr, 'u')
@@ -796,16 +919,11 @@ def get_cell_alignment(cell: Any) -> str:
     # Check if cell has paragraphs with alignment
     if cell.paragraphs:
         para = cell.paragraphs[0]
-        if para.alignment is not None:
-            # Note: GFM tables only support left/center/right, so we map
-            # justify to left. This is different from ALIGNMENT_NUMERIC_TO_STRING.
-            cell_alignment_map = {
-                0: "left",      # WD_ALIGN_PARAGRAPH.LEFT
-                1: "center",    # WD_ALIGN_PARAGRAPH.CENTER
-                2: "right",     # WD_ALIGN_PARAGRAPH.RIGHT
-                3: "left",      # WD_ALIGN_PARAGRAPH.JUSTIFY → left for GFM
-            }
-            return cell_alignment_map.get(para.alignment, DEFAULT_ALIGNMENT)
+        para_alignment = para.alignment
+        if para_alignment is not None:
+            # Note: GFM tables only support left/center/right, so justify maps
+            # to left. This is different from ALIGNMENT_NUMERIC_TO_STRING.
+            return ALIGNMENT_NUMERIC_TO_GFM.get(para_alignment, DEFAULT_ALIGNMENT)
 
     return DEFAULT_ALIGNMENT
 
@@ -873,7 +991,7 @@ def _extract_cell_text_with_formatting(cell: Any, doc_part: Any = None) -> str:
 
         for child in para_elem:
             tag = child.tag
-            if tag == f'{{{WORDPROCESSINGML_NS}}}hyperlink':
+            if tag == _W_HYPERLINK:
                 if doc_part is None:
                     text, is_bold, is_italic = extract_hyperlink_text_and_formatting(child)
                     if text:
@@ -891,11 +1009,11 @@ def _extract_cell_text_with_formatting(cell: Any, doc_part: Any = None) -> str:
                 if text:
                     para_parts.append(format_hyperlink_md(text, url, is_bold, is_italic))
 
-            elif tag == f'{{{WORDPROCESSINGML_NS}}}r':
+            elif tag == _W_R:
                 text_parts = []
                 for run_child in child:
                     run_child_tag = run_child.tag
-                    if run_child_tag == f'{{{WORDPROCESSINGML_NS}}}t':
+                    if run_child_tag == _W_T:
                         if run_child.text:
                             text_parts.append(run_child.text)
 
@@ -903,7 +1021,7 @@ def _extract_cell_text_with_formatting(cell: Any, doc_part: Any = None) -> str:
                 if not text:
                     continue
 
-                rPr = child.find(f'{{{WORDPROCESSINGML_NS}}}rPr')
+                rPr = child.find(_W_RPR)
                 is_bold = is_formatting_enabled(rPr, 'b')
                 is_italic = is_formatting_enabled(rPr, 'i')
 
@@ -987,14 +1105,14 @@ def extract_merged_cells(table: Any) -> list[dict[str, int]]:
             if tcPr is not None:
                 gridSpan = tcPr.find(qn('w:gridSpan'))
                 if gridSpan is not None:
-                    col_span = int(gridSpan.get(qn('w:val'), '1'))
+                    col_span = int(gridSpan.get(_W_VAL, '1'))
 
             # Check if this is a vertical merge start (vMerge=restart)
             row_span = 1
             if tcPr is not None:
                 vMerge = tcPr.find(qn('w:vMerge'))
                 if vMerge is not None:
-                    val = vMerge.get(qn('w:val'))
+                    val = vMerge.get(_W_VAL)
                     if val == 'restart':
                         # Count continuation cells below by checking raw tc elements
                         for check_row in range(row_idx + 1, num_rows):
@@ -1004,7 +1122,7 @@ def extract_merged_cells(table: Any) -> list[dict[str, int]]:
                                 check_tcPr = check_tcs[col_idx].find(qn('w:tcPr'))
                                 if check_tcPr is not None:
                                     check_vMerge = check_tcPr.find(qn('w:vMerge'))
-                                    if check_vMerge is not None and check_vMerge.get(qn('w:val')) is None:
+                                    if check_vMerge is not None and check_vMerge.get(_W_VAL) is None:
                                         row_span += 1
                                         continue
                             break
@@ -1067,7 +1185,7 @@ def extract_table_metadata(table: Any, table_index: int) -> dict[str, Any]:
         if trPr is not None:
             tblHeader = trPr.find(qn('w:tblHeader'))
             if tblHeader is not None:
-                val = tblHeader.get(qn('w:val'))
+                val = tblHeader.get(_W_VAL)
                 if val is None or val.lower() not in ('0', 'false'):
                     header_rows += 1
                     continue
@@ -1106,6 +1224,8 @@ def _process_paragraph(
     extract_track_changes: bool = False,
     track_changes_explicit: Optional[bool] = None,
     footnote_counter: int = 0,
+    validated_image_parts: Optional[dict[Any, str]] = None,
+    style_cache: Optional[dict[Optional[str], tuple[str, str, int]]] = None,
 ) -> tuple[Block, int, int, Optional[str], dict[str, bytes], int]:
     """Process a single paragraph element.
 
@@ -1121,11 +1241,17 @@ def _process_paragraph(
         image_data: Dictionary to store image data
         extract_track_changes: Whether to extract track changes as CriticMarkup
         track_changes_explicit: The explicit track_changes parameter (None, True, or False)
+        validated_image_parts: Validation results for image parts seen in this document
+        style_cache: Resolved style properties keyed by style ID (see _paragraph_style_properties)
 
     Returns:
         Tuple of (block, new_image_counter, new_list_counter, new_list_type, image_data, footnote_counter)
     """
-    style_name = paragraph.style.name if paragraph.style else "Normal"
+    # paragraph.style scans every style in styles.xml on each access, so the
+    # name is resolved once per style ID for the whole document
+    if style_cache is None:
+        style_cache = {}
+    style_name = _paragraph_style_properties(paragraph, style_cache)[0]
     image_path = None
     block_track_changes = None
     footnote_refs: list[dict[str, Any]] = []
@@ -1163,7 +1289,7 @@ def _process_paragraph(
         image_counter += 1
         list_number_counter = 0
         previous_list_type = None
-    elif (image_info := extract_image_from_paragraph(paragraph, doc_part, image_counter)):
+    elif (image_info := extract_image_from_paragraph(paragraph, doc_part, image_counter, validated_image_parts)):
         # This is an image paragraph
         image_filename, image_extension, image_bytes, error_message = image_info
 
@@ -1198,10 +1324,7 @@ def _process_paragraph(
         )
 
         if style_name.startswith("Heading"):
-            try:
-                level = int(style_name.split()[-1])
-            except (ValueError, IndexError):
-                level = 1
+            level = _heading_level(style_name)
             markdown_content = "#" * level + " " + text_content
             block_type = "heading"
             level_value = level
@@ -1218,7 +1341,7 @@ def _process_paragraph(
             if previous_list_type != "number":
                 list_number_counter = 0
             list_number_counter += 1
-            markdown_content = f"{list_number_counter}. " + text_content
+            markdown_content = f"{list_number_counter}. {text_content}"
             block_type = "list"
             level_value = None
             previous_list_type = "number"
@@ -1256,6 +1379,7 @@ def extract_blocks(
     track_changes: Optional[bool] = None,
     *,
     _doc: Any = None,
+    _styles: Optional[list[Style]] = None,
 ) -> tuple[list[Block], dict[str, bytes]]:
     """Extract blocks from a Word document.
 
@@ -1268,6 +1392,8 @@ def extract_blocks(
                       If True, extract track changes as CriticMarkup.
                       If False, accept all changes and extract plain text.
         _doc: Pre-opened Document object (internal use by extract_document).
+        _styles: When given, the Style for each block is appended to it during
+                 the same body pass (internal use by extract_all).
 
     Returns:
         Tuple of (blocks, image_data) where image_data maps filenames to image bytes
@@ -1275,7 +1401,7 @@ def extract_blocks(
     from docx.table import Table
     from docx.text.paragraph import Paragraph
 
-    doc = _doc if _doc is not None else Document(docx_path)
+    doc = _doc if _doc is not None else _open_document(docx_path)
     blocks: list[Block] = []
     image_data: dict[str, bytes] = {}
     content_position = 0
@@ -1286,12 +1412,14 @@ def extract_blocks(
     para_index = 0
     table_index = 0
     footnote_counter = 0
+    style_cache: dict[Optional[str], tuple[str, str, int]] = {}  # Shared by style names and _styles
+    validated_image_parts: dict[Any, str] = {}  # Image part -> validation error ("" if valid)
 
     # Determine track changes mode
     # If not specified (None), auto-detect based on document content
     extract_track_changes = track_changes
     if extract_track_changes is None:
-        extract_track_changes = detect_track_changes(docx_path)
+        extract_track_changes = detect_track_changes(doc)
 
     # Iterate over document body elements in order
     # This correctly interleaves paragraphs and tables
@@ -1340,6 +1468,8 @@ def extract_blocks(
                     )
 
                     blocks.append(block)
+                    if _styles is not None:
+                        _styles.append(_textbox_style(block.id))
                     content_position = content_end + 1
                     block_index += 1
 
@@ -1360,9 +1490,13 @@ def extract_blocks(
                     extract_track_changes=extract_track_changes,
                     track_changes_explicit=track_changes,
                     footnote_counter=footnote_counter,
+                    validated_image_parts=validated_image_parts,
+                    style_cache=style_cache,
                 )
 
                 blocks.append(block)
+                if _styles is not None:
+                    _styles.append(_paragraph_style(paragraph, block.id, style_cache))
                 content_position = block.content_end + 1
                 block_index += 1
                 para_index += 1
@@ -1400,6 +1534,8 @@ def extract_blocks(
             )
 
             blocks.append(block)
+            if _styles is not None:
+                _styles.append(_table_style(table, block.id))
             content_position = content_end + 1
             block_index += 1
             table_index += 1
@@ -1428,6 +1564,65 @@ def extract_blocks(
     return blocks, image_data
 
 
+def extract_all(
+    docx_path: str | Any,
+    track_changes: Optional[bool] = None,
+) -> tuple[list[Block], list[Style], dict[str, bytes]]:
+    """Extract blocks and their styles from a Word document in one body pass.
+
+    Equivalent to extract_blocks followed by extract_styles, but each paragraph
+    and table is visited once and its style is built alongside its block.
+
+    Args:
+        docx_path: Path to .docx file, or an already-opened Document
+        track_changes: Track changes mode (see extract_blocks).
+
+    Returns:
+        Tuple of (blocks, styles, image_data)
+    """
+    doc = _open_document(docx_path)
+    styles: list[Style] = []
+    blocks, image_data = extract_blocks(docx_path, track_changes=track_changes, _doc=doc, _styles=styles)
+    return blocks, styles, image_data
+
+
+def extract_many(
+    docx_paths: list[str | Path],
+    track_changes: Optional[bool] = None,
+    max_workers: Optional[int] = None,
+) -> list[tuple[list[Block], list[Style], dict[str, bytes]]]:
+    """Run extract_all over several documents in parallel worker processes.
+
+    XML parsing holds the GIL, so documents are spread across processes rather
+    than threads. Larger files are submitted first so a big document does not
+    end up as the last task on an otherwise idle pool.
+
+    Args:
+        docx_paths: Paths to .docx files
+        track_changes: Track changes mode applied to every document (see extract_blocks)
+        max_workers: Worker process count (defaults to the CPU count, capped at
+            the number of paths)
+
+    Returns:
+        One (blocks, styles, image_data) tuple per path, in input order
+    """
+    workers = min(max_workers or os.cpu_count() or 1, len(docx_paths))
+    if workers <= 1:
+        return [extract_all(str(path), track_changes=track_changes) for path in docx_paths]
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    largest_first = sorted(
+        range(len(docx_paths)), key=lambda i: os.stat(docx_paths[i]).st_size, reverse=True
+    )
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {
+            i: executor.submit(extract_all, str(docx_paths[i]), track_changes)
+            for i in largest_first
+        }
+        return [futures[i].result() for i in range(len(docx_paths))]
+
+
 def _extract_footnote_definitions(doc: Any, blocks: list[Block]) -> list[str]:
     """Extract footnote/endnote definitions from the document.
 
@@ -1568,7 +1763,7 @@ def extract_document(
     Returns:
         Tuple of (blocks, image_data, sections)
     """
-    doc = Document(docx_path)
+    doc = _open_document(docx_path)
     blocks, image_data = extract_blocks(docx_path, track_changes=track_changes, _doc=doc)
     sections = extract_sections(body=doc.element.body)
     return blocks, image_data, sections
@@ -1661,7 +1856,7 @@ def extract_sections(docx_path: str | None = None, *, body: Any = None) -> list[
     if body is None:
         if docx_path is None:
             raise ValueError("Either docx_path or body must be provided")
-        doc = Document(docx_path)
+        doc = _open_document(docx_path)
         body = doc.element.body
     sections: list[SectionProperties] = []
     block_index = 0
@@ -1741,7 +1936,7 @@ def extract_cell_pattern_fill(cell: Any) -> str | None:
     shd = tcPr.find(qn('w:shd'))
     if shd is None:
         return None
-    val = shd.get(qn('w:val'))
+    val = shd.get(_W_VAL)
     if val and str(val) not in ('clear', 'nil', 'solid'):
         return str(val)
     return None
@@ -1767,7 +1962,7 @@ def extract_cell_borders(cell: Any) -> dict[str, dict[str, Any]] | None:
     for side in ['top', 'bottom', 'left', 'right']:
         border_elem = tcBorders.find(qn(f'w:{side}'))
         if border_elem is not None:
-            val = border_elem.get(qn('w:val'))
+            val = border_elem.get(_W_VAL)
             if val and val != 'nil':
                 borders[side] = {
                     'style': val,
@@ -1811,16 +2006,9 @@ def extract_table_formatting(table: Any) -> dict[str, Any]:
     if tblPr is not None:
         jc = tblPr.find(f'{{{WORDPROCESSINGML_NS}}}jc')
         if jc is not None:
-            val = jc.get(qn('w:val'))
+            val = jc.get(_W_VAL)
             if val:
-                alignment_map = {
-                    'left': 'left',
-                    'center': 'center',
-                    'right': 'right',
-                    'start': 'left',
-                    'end': 'right'
-                }
-                table_alignment = alignment_map.get(val, 'left')
+                table_alignment = TABLE_JC_TO_ALIGNMENT.get(val, 'left')
 
     # Extract table style name if present
     table_style_name = None
@@ -1860,11 +2048,87 @@ def extract_table_formatting(table: Any) -> dict[str, Any]:
     return result
 
 
-def extract_styles(docx_path: str, blocks: list[Block]) -> list[Style]:
+def _textbox_style(block_id: str) -> Style:
+    """Build the fixed Style used for text box blocks."""
+    return Style(
+        block_id=block_id,
+        docx_style="TextBox",
+        font_name="Calibri",
+        font_size=11,
+        alignment="left",
+    )
+
+
+def _paragraph_style_properties(
+    paragraph: Any, style_cache: dict[Optional[str], tuple[str, str, int]]
+) -> tuple[str, str, int]:
+    """Return (docx_style, font_name, font_size) for a paragraph's style.
+
+    Resolving paragraph.style walks the styles part XML, and a document uses
+    only a handful of styles, so results are memoized in style_cache keyed by
+    the paragraph's w:pStyle value (None for the default style).
+    """
+    style_id = paragraph._p.style
+    cached = style_cache.get(style_id)
+    if cached is not None:
+        return cached
+
+    docx_style = "Normal"
+    font_name = "Calibri"
+    font_size = 11
+
+    para_style = paragraph.style
+    if para_style:
+        docx_style = para_style.name
+        font = para_style.font
+        if font.name:
+            font_name = font.name
+        if font.size:
+            font_size = int(font.size.pt)
+
+    style_cache[style_id] = (docx_style, font_name, font_size)
+    return docx_style, font_name, font_size
+
+
+def _paragraph_style(
+    paragraph: Any,
+    block_id: str,
+    style_cache: dict[Optional[str], tuple[str, str, int]],
+) -> Style:
+    """Build the Style for a paragraph block."""
+    docx_style, font_name, font_size = _paragraph_style_properties(paragraph, style_cache)
+
+    alignment = "left"
+    paragraph_alignment = paragraph.alignment
+    if paragraph_alignment is not None:
+        alignment = ALIGNMENT_NUMERIC_TO_STRING.get(paragraph_alignment, DEFAULT_ALIGNMENT)
+
+    return Style(
+        block_id=block_id,
+        docx_style=docx_style,
+        font_name=font_name,
+        font_size=font_size,
+        alignment=alignment,
+    )
+
+
+def _table_style(table: Any, block_id: str) -> Style:
+    """Build the Style, including table_formatting, for a table block."""
+    return Style(
+        block_id=block_id,
+        docx_style="Table",
+        font_name="Calibri",  # Default for tables
+        font_size=11,
+        alignment="left",
+        table_formatting=extract_table_formatting(table),
+    )
+
+
+def extract_styles(docx_path: str | Any, blocks: list[Block]) -> list[Style]:
     """Extract style information from Word document.
 
     Args:
-        docx_path: Path to .docx file
+        docx_path: Path to .docx file, or an already-opened Document
         blocks: List of Block objects
 
     Returns:
@@ -1873,8 +2137,9 @@ def extract_styles(docx_path: str, blocks: list[Block]) -> list[Style]:
     from docx.table import Table
     from docx.text.paragraph import Paragraph
 
-    doc = Document(docx_path)
+    doc = _open_document(docx_path)
     styles: list[Style] = []
+    style_cache: dict[Optional[str], tuple[str, str, int]] = {}
 
     # Iterate over document body in order to match blocks correctly
     body = doc.element.body
@@ -1893,59 +2158,16 @@ def extract_styles(docx_path: str, blocks: list[Block]) -> list[Style]:
             # Check if this paragraph produced text box blocks
             if block.type == "textbox":
                 while block_index < len(blocks) and blocks[block_index].type == "textbox":
-                    style = Style(
-                        block_id=blocks[block_index].id,
-                        docx_style="TextBox",
-                        font_name="Calibri",
-                        font_size=11,
-                        alignment="left",
-                    )
-                    styles.append(style)
+                    styles.append(_textbox_style(blocks[block_index].id))
                     block_index += 1
                 continue
 
-            # Get font properties
-            font_name = "Calibri"
-            font_size = 11
-            alignment = "left"
-
-            if paragraph.style and paragraph.style.font.name:
-                font_name = paragraph.style.font.name
-
-            if paragraph.style and paragraph.style.font.size:
-                font_size = int(paragraph.style.font.size.pt)
-
-            if paragraph.alignment is not None:
-                alignment = ALIGNMENT_NUMERIC_TO_STRING.get(
-                    paragraph.alignment, DEFAULT_ALIGNMENT
-                )
-
-            style = Style(
-                block_id=block.id,
-                docx_style=paragraph.style.name if paragraph.style else "Normal",
-                font_name=font_name,
-                font_size=font_size,
-                alignment=alignment,
-            )
-            styles.append(style)
+            styles.append(_paragraph_style(paragraph, block.id, style_cache))
             block_index += 1
 
         elif tag == 'tbl':
             table = Table(child, doc)
-
-            # Extract table-specific formatting
-            table_formatting = extract_table_formatting(table)
-
-            # Create style with table_formatting
-            style = Style(
-                block_id=block.id,
-                docx_style="Table",
-                font_name="Calibri",  # Default for tables
-                font_size=11,
-                alignment="left",
-                table_formatting=table_formatting
-            )
-            styles.append(style)
+            styles.append(_table_style(table, block.id))
             block_index += 1
 
     return styles
@@ -2002,13 +2224,16 @@ def _extract_header_footer_paragraphs(
     return paragraphs, image_data, image_counter
 
 
-def extract_section_metadata(docx_path: str) -> tuple[list[dict], dict[str, bytes]]:
+def extract_section_metadata(docx_path: str | Any) -> tuple[list[dict], dict[str, bytes]]:
     """Extract section metadata (headers, footers, page setup) from a Word document.
 
+    Args:
+        docx_path: Path to .docx file, or an already-opened Document
+
     Returns:
         Tuple of (sections_data, image_data) where image_data maps filenames to bytes.
     """
-    doc = Document(docx_path)
+    doc = _open_document(docx_path)
     sections_data = []
     image_data: dict[str, bytes] = {}
     image_counter = 1
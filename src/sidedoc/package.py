@@ -1,9 +1,11 @@
 """Package and unpackage sidedoc archives."""
 
+import io
 import json
 import re
 import zipfile
 from pathlib import Path
+from sidedoc.constants import PRECOMPRESSED_EXTENSIONS
 from sidedoc.models import Block, SectionProperties, Style, Manifest
 from sidedoc.utils import compute_file_hash, get_iso_timestamp
 from sidedoc import __version__
@@ -224,13 +226,25 @@ def create_sidedoc_archive(
 
     with zipfile.ZipFile(output_path, "w", zipfile.ZIP_DEFLATED) as zip_file:
         zip_file.writestr("content.md", content_md)
-        zip_file.writestr("structure.json", json.dumps(structure_data, indent=2))
-        zip_file.writestr("styles.json", json.dumps(styles_data, indent=2))
-        zip_file.writestr("manifest.json", json.dumps(manifest_data, indent=2))
+        # Serialize metadata straight into the archive entry rather than
+        # building each JSON document as one large string first
+        for name, data in (
+            ("structure.json", structure_data),
+            ("styles.json", styles_data),
+            ("manifest.json", manifest_data),
+        ):
+            with io.TextIOWrapper(zip_file.open(name, "w"), encoding="utf-8", newline="\n") as fp:
+                json.dump(data, fp, indent=2)
 
         if image_data:
             for filename, image_bytes in image_data.items():
-                zip_file.writestr(f"assets/{filename}", image_bytes)
+                # Deflating PNG/JPEG data costs CPU and gains almost nothing
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if Path(filename).suffix.lower() in PRECOMPRESSED_EXTENSIONS
+                    else None
+                )
+                zip_file.writestr(f"assets/{filename}", image_bytes, compress_type=compress_type)
 
 
 def create_sidedoc_directory(
@@ -1,6 +1,5 @@
 """Reconstruct Word documents from sidedoc format."""
 
-import hashlib
 import re
 import warnings
 from pathlib import Path
@@ -40,6 +39,7 @@ from sidedoc.constants import (
     FOOTNOTES_CT,
     ENDNOTES_CT,
 )
+from sidedoc.extract import compute_content_hash
 from sidedoc.store import SidedocStore
 
 import mistune
@@ -60,7 +60,6 @@ _INLINE_FORMAT_PATTERN = re.compile(r'(\*{1,3})(.*?)\1')
 # Cache the mistune parser at module level to avoid recreating per paragraph
 _MARKDOWN_PARSER = mistune.create_markdown(renderer=None)
 
-
 def _extract_textbox_inner_content(content: str) -> str:
     """Extract inner text from textbox markdown markers.
 
@@ -744,7 +743,7 @@ def parse_markdown_to_blocks(markdown_content: str) -> list[Block]:
                 docx_paragraph_index=block_id,
                 content_start=content_position,
                 content_end=content_position + len(textbox_content),
-                content_hash=hashlib.sha256(textbox_content.encode()).hexdigest(),
+                content_hash=compute_content_hash(textbox_content),
             )
             blocks.append(block)
             block_id += 1
@@ -787,7 +786,7 @@ def parse_markdown_to_blocks(markdown_content: str) -> list[Block]:
                     docx_paragraph_index=-1,
                     content_start=content_position,
                     content_end=content_position + len(table_content),
-                    content_hash=hashlib.sha256(table_content.encode()).hexdigest(),
+                    content_hash=compute_content_hash(table_content),
                     table_metadata={
                         "rows": num_rows,
                         "cols": num_cols,
@@ -826,7 +825,7 @@ def parse_markdown_to_blocks(markdown_content: str) -> list[Block]:
                 docx_paragraph_index=block_id,
                 content_start=content_position,
                 content_end=content_position + len(stripped_line),
-                content_hash=hashlib.sha256(stripped_line.encode()).hexdigest(),
+                content_hash=compute_content_hash(stripped_line),
                 image_path=image_path,
             )
         elif stripped_line.startswith("#"):
@@ -841,7 +840,7 @@ def parse_markdown_to_blocks(markdown_content: str) -> list[Block]:
                 docx_paragraph_index=block_id,
                 content_start=content_position,
                 content_end=content_position + len(stripped_line),
-                content_hash=hashlib.sha256(stripped_line.encode()).hexdigest(),
+                content_hash=compute_content_hash(stripped_line),
                 level=level,
             )
         else:
@@ -852,7 +851,7 @@ def parse_markdown_to_blocks(markdown_content: str) -> list[Block]:
                 docx_paragraph_index=block_id,
                 content_start=content_position,
                 content_end=content_position + len(stripped_line),
-                content_hash=hashlib.sha256(stripped_line.encode()).hexdigest(),
+                content_hash=compute_content_hash(stripped_line),
             )
 
         blocks.append(block)
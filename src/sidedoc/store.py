@@ -5,7 +5,36 @@ import shutil
 import tempfile
 import zipfile
 from pathlib import Path
-from typing import Literal
+from typing import Any, Literal
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _HAS_ORJSON = False
+
+
+def load_json_bytes(data: bytes) -> Any:
+    """Parse JSON from raw bytes, using orjson when it is installed.
+
+    orjson rejects the NaN, Infinity and -Infinity literals that stdlib
+    json.loads accepts, so anything orjson refuses is parsed again with
+    json.loads. Metadata containing those literals stays readable, and
+    malformed input raises json.JSONDecodeError either way.
+
+    Args:
+        data: Raw JSON document
+
+    Returns:
+        Parsed JSON value
+    """
+    if _HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
 
 
 def detect_sidedoc_format(path: str | Path) -> Literal["directory", "zip"]:
@@ -38,6 +67,7 @@ class SidedocStore:
         self._path = path
         self._fmt = fmt
         self._temp_dir: str | None = None  # For ZIP asset extraction
+        self._zip_file: zipfile.ZipFile | None = None  # Shared handle, closed on __exit__
 
     @staticmethod
     def open(path: str | Path) -> "SidedocStore":
@@ -46,6 +76,15 @@ class SidedocStore:
         fmt = detect_sidedoc_format(p)
         return SidedocStore(p, fmt)
 
+    def _zip(self) -> zipfile.ZipFile:
+        """Return the archive handle, opening it on first use.
+
+        Reads share one handle so the central directory is parsed once per store.
+        """
+        if self._zip_file is None:
+            self._zip_file = zipfile.ZipFile(self._path, "r")
+        return self._zip_file
+
     def _validate_name(self, name: str) -> None:
         """Validate that a file name doesn't escape the container.
 
@@ -71,14 +110,16 @@ class SidedocStore:
             return file_path.read_text(encoding="utf-8")
         else:
             try:
-                with zipfile.ZipFile(self._path, "r") as zf:
-                    return zf.read(name).decode("utf-8")
+                return self._zip().read(name).decode("utf-8")
             except KeyError:
                 raise FileNotFoundError(f"{name} not found in {self._path}")
 
     def read_json(self, name: str) -> dict:
-        """Read and parse a JSON file from the container."""
-        result: dict = json.loads(self.read_text(name))
+        """Read and parse a JSON file from the container.
+
+        Parses the raw bytes directly with load_json_bytes.
+        """
+        result: dict = load_json_bytes(self.read_bytes(name))
         return result
 
     def read_bytes(self, name: str) -> bytes:
@@ -91,8 +132,7 @@ class SidedocStore:
             return file_path.read_bytes()
         else:
             try:
-                with zipfile.ZipFile(self._path, "r") as zf:
-                    return zf.read(name)
+                return self._zip().read(name)
             except KeyError:
                 raise FileNotFoundError(f"{name} not found in {self._path}")
 
@@ -102,8 +142,7 @@ class SidedocStore:
         if self._fmt == "directory":
             return (self._path / name).exists()
         else:
-            with zipfile.ZipFile(self._path, "r") as zf:
-                return name in zf.namelist()
+            return name in self._zip().namelist()
 
     def list_files(self) -> list[str]:
         """List all files in the container."""
@@ -114,8 +153,7 @@ class SidedocStore:
                     files.append(str(p.relative_to(self._path)))
             return sorted(files)
         else:
-            with zipfile.ZipFile(self._path, "r") as zf:
-                return sorted(zf.namelist())
+            return sorted(self._zip().namelist())
 
     def list_assets(self) -> list[str]:
         """List asset filenames (without the assets/ prefix)."""
@@ -125,12 +163,11 @@ class SidedocStore:
                 return []
             return sorted(p.name for p in assets_dir.iterdir() if p.is_file())
         else:
-            with zipfile.ZipFile(self._path, "r") as zf:
-                return sorted(
-                    name.removeprefix("assets/")
-                    for name in zf.namelist()
-                    if name.startswith("assets/") and name != "assets/"
-                )
+            return sorted(
+                name.removeprefix("assets/")
+                for name in self._zip().namelist()
+                if name.startswith("assets/") and name != "assets/"
+            )
 
     @property
     def assets_dir(self) -> Path:
@@ -145,17 +182,17 @@ class SidedocStore:
             if self._temp_dir is None:
                 self._temp_dir = tempfile.mkdtemp()
                 assets_path = Path(self._temp_dir)
-                with zipfile.ZipFile(self._path, "r") as zf:
-                    for file_info in zf.filelist:
-                        if file_info.filename.startswith("assets/") and file_info.filename != "assets/":
-                            filename = file_info.filename.removeprefix("assets/")
-                            target = (assets_path / filename).resolve()
-                            if not target.is_relative_to(assets_path.resolve()):
-                                raise ValueError(
-                                    f"Unsafe path traversal detected: {file_info.filename}"
-                                )
-                            target.parent.mkdir(parents=True, exist_ok=True)
-                            target.write_bytes(zf.read(file_info.filename))
+                zf = self._zip()
+                for file_info in zf.filelist:
+                    if file_info.filename.startswith("assets/") and file_info.filename != "assets/":
+                        filename = file_info.filename.removeprefix("assets/")
+                        target = (assets_path / filename).resolve()
+                        if not target.is_relative_to(assets_path.resolve()):
+                            raise ValueError(
+                                f"Unsafe path traversal detected: {file_info.filename}"
+                            )
+                        target.parent.mkdir(parents=True, exist_ok=True)
+                        target.write_bytes(zf.read(file_info.filename))
             return Path(self._temp_dir)
 
     @property
@@ -174,6 +211,9 @@ class SidedocStore:
         return self
 
     def __exit__(self, *args: object) -> None:
+        if self._zip_file is not None:
+            self._zip_file.close()
+            self._zip_file = None
         if self._temp_dir is not None:
             shutil.rmtree(self._temp_dir, ignore_errors=True)
             self._temp_dir = None
@@ -10,6 +10,7 @@ from sidedoc.constants import (
     SIMILARITY_THRESHOLD,
 )
 from sidedoc.reconstruct import apply_sections_to_document, create_docx_from_blocks
+from sidedoc.store import load_json_bytes
 
 # Default author for new track changes created during sync
 DEFAULT_SYNC_AUTHOR = "Sidedoc AI"
@@ -157,6 +158,8 @@ def update_sidedoc_metadata(
     new_blocks: list[Block],
     new_content: str,
     matches: Optional[dict[str, Block]] = None,
+    styles_data: Optional[dict[str, Any]] = None,
+    existing_structure: Optional[dict[str, Any]] = None,
 ) -> None:
     """Update metadata files in a sidedoc directory after sync.
 
@@ -168,6 +171,8 @@ def update_sidedoc_metadata(
         new_blocks: Updated list of Block objects from edited content
         new_content: New markdown content
         matches: Optional mapping from old block IDs to new blocks for style remapping
+        styles_data: Already-parsed styles.json; read from disk when omitted
+        existing_structure: Already-parsed structure.json; read from disk when omitted
 
     Raises:
         ValueError: If sidedoc_path is not a directory
@@ -178,7 +183,9 @@ def update_sidedoc_metadata(
             f"Cannot update metadata for '{sidedoc_path}': not a directory. "
             "Run `sidedoc unpack` to convert to directory format first."
         )
-    _update_directory_metadata(sidedoc_path, new_blocks, new_content, matches)
+    _update_directory_metadata(
+        sidedoc_path, new_blocks, new_content, matches, styles_data, existing_structure
+    )
 
 
 def _build_structure_data(new_blocks: list[Block], existing_structure: dict | None = None) -> dict:
@@ -216,12 +223,15 @@ def _update_directory_metadata(
     new_blocks: list[Block],
     new_content: str,
     matches: Optional[dict[str, Block]] = None,
+    styles_data: Optional[dict[str, Any]] = None,
+    existing_structure: Optional[dict[str, Any]] = None,
 ) -> None:
     """Update metadata in a sidedoc directory."""
     dir_path = Path(sidedoc_path)
 
-    # Read existing styles
-    styles_data = json.loads((dir_path / "styles.json").read_text(encoding="utf-8"))
+    # Read existing styles unless the caller already parsed them
+    if styles_data is None:
+        styles_data = load_json_bytes((dir_path / "styles.json").read_bytes())
 
     # Remap styles if matches provided
     if matches:
@@ -229,14 +239,13 @@ def _update_directory_metadata(
 
     # Read existing structure.json to preserve sections
     structure_path = dir_path / "structure.json"
-    existing_structure = None
-    if structure_path.exists():
-        existing_structure = json.loads(structure_path.read_text(encoding="utf-8"))
+    if existing_structure is None and structure_path.exists():
+        existing_structure = load_json_bytes(structure_path.read_bytes())
 
     # Read old manifest if it exists
     manifest_path = dir_path / "manifest.json"
     if manifest_path.exists():
-        old_manifest = json.loads(manifest_path.read_text(encoding="utf-8"))
+        old_manifest = load_json_bytes(manifest_path.read_bytes())
     else:
         old_manifest = {
             "sidedoc_version": "1.0.0",
@@ -276,6 +285,8 @@ def sync_sidedoc_to_docx(
     sidedoc_path: str,
     output_path: str,
     author: Optional[str] = None,
+    blocks: Optional[list[Block]] = None,
+    structure_data: Optional[dict[str, Any]] = None,
 ) -> None:
     """Sync a sidedoc archive to a Word document with CriticMarkup support.
 
@@ -287,6 +298,9 @@ def sync_sidedoc_to_docx(
         sidedoc_path: Path to .sidedoc file
         output_path: Path for output .docx file
         author: Author name for new track changes (default: 'Sidedoc AI')
+        blocks: Blocks already parsed from content.md; parsed here when omitted
+        structure_data: Already-parsed structure.json, used for its section
+            metadata; read from the sidedoc when omitted
     """
     from sidedoc.reconstruct import parse_markdown_to_blocks
 
@@ -300,11 +314,13 @@ def sync_sidedoc_to_docx(
     with SidedocStore.open(sidedoc_path) as store:
         content_md = store.read_text("content.md")
         styles_data = store.read_json("styles.json")
-        structure_data = store.read_json("structure.json") if store.has_file("structure.json") else {}
+        if structure_data is None:
+            structure_data = store.read_json("structure.json") if store.has_file("structure.json") else {}
         assets_dir = store.assets_dir if store.list_assets() else None
         hf_sections_data = structure_data.get("hf_sections", [])
 
-    blocks = parse_markdown_to_blocks(content_md)
+    if blocks is None:
+        blocks = parse_markdown_to_blocks(content_md)
     sections = deserialize_sections(structure_data)
 
     # Note: no style_id_remap needed here because update_sidedoc_metadata()
@@ -117,6 +117,31 @@ def test_cli_executable_installed():
     assert __version__ in result.stdout or __version__ in result.stderr
 
 
+def test_version_fast_path_matches_click_output():
+    """Test that the entry point's --version fast path prints what Click would."""
+    runner = CliRunner()
+    click_result = runner.invoke(main, ["--version"])
+
+    result = subprocess.run(
+        [sys.executable, "-m", "sidedoc", "--version"],
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0
+    assert result.stdout == click_result.output
+
+
+def test_cli_import_defers_subcommands_and_docx():
+    """Test that importing the CLI loads no subcommand modules or python-docx."""
+    code = (
+        "import sys, sidedoc.cli; "
+        "print([m for m in sys.modules if m.startswith(('sidedoc.commands.', 'docx'))])"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.returncode == 0
+    assert result.stdout.strip() == "[]"
+
+
 def test_convert_structure_to_blocks_preserves_table_metadata():
     """Test that _convert_structure_to_blocks includes table_metadata from structure.json.
 
@@ -182,3 +182,21 @@ def test_diff_rejects_zip_archive() -> None:
 
         assert result.exit_code != 0
         assert "Cannot diff a ZIP archive" in result.output
+
+
+def test_diff_block_lines_are_colored_only_for_terminals() -> None:
+    """Test that per-block lines carry click's ANSI styling, stripped when piped."""
+    import click
+
+    runner = CliRunner()
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidedoc_path = Path(temp_dir) / "test.sidedoc"
+        create_sidedoc_dir(sidedoc_path, "New paragraph added.", {"blocks": []})
+
+        colored = runner.invoke(main, ["diff", str(sidedoc_path)], color=True)
+        plain = runner.invoke(main, ["diff", str(sidedoc_path)])
+
+        assert click.style("  + [paragraph] New paragraph added.", fg="green") in colored.output
+        assert "  + [paragraph] New paragraph added.\n" in plain.output
+        assert "\x1b[" not in plain.output
@@ -238,6 +238,24 @@ def test_sync_handles_invalid_structure_json():
             f"Expected JSON error message, got: {result.output}"
 
 
+def test_pack_reports_first_invalid_json_file():
+    """Test that pack reports invalid JSON files in a stable order."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidedoc_path = Path(temp_dir) / "test.sidedoc"
+        sidedoc_path.mkdir()
+        (sidedoc_path / "content.md").write_text("# Test")
+        (sidedoc_path / "structure.json").write_text("not valid json at all")
+        (sidedoc_path / "styles.json").write_text("[this is, broken json")
+        (sidedoc_path / "manifest.json").write_text("{}")
+
+        runner = CliRunner()
+        result = runner.invoke(cli.pack, [str(sidedoc_path)])
+
+        assert result.exit_code == cli.EXIT_INVALID_FORMAT
+        assert "Invalid JSON in structure.json" in result.output
+        assert not (Path(temp_dir) / "test.sdoc").exists()
+
+
 # ============================================================================
 # Missing Required Files Tests
 # ============================================================================
@@ -705,3 +723,22 @@ def test_build_handles_write_errors():
             f"Expected write error message, got: {result.output}"
     finally:
         Path(temp_sidedoc.name).unlink()
+
+
+def test_pack_rejects_oversized_file(monkeypatch):
+    """Test that pack refuses files larger than MAX_ASSET_SIZE."""
+    monkeypatch.setattr("sidedoc.commands.pack.MAX_ASSET_SIZE", 16)
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidedoc_path = Path(temp_dir) / "test.sidedoc"
+        (sidedoc_path / "assets").mkdir(parents=True)
+        (sidedoc_path / "content.md").write_text("# Test")
+        for name in ["structure.json", "styles.json", "manifest.json"]:
+            (sidedoc_path / name).write_text("{}")
+        (sidedoc_path / "assets" / "image1.png").write_bytes(b"\x00" * 17)
+
+        runner = CliRunner()
+        result = runner.invoke(cli.pack, [str(sidedoc_path)])
+
+        assert result.exit_code == cli.EXIT_INVALID_FORMAT
+        assert "exceeds MAX_ASSET_SIZE: assets/image1.png" in result.output
+        assert not (Path(temp_dir) / "test.sdoc").exists()
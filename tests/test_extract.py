@@ -1239,3 +1239,211 @@ def test_accept_all_tracks_underline():
     assert inline_fmt is not None, "inline_formatting should not be None"
     underline_entries = [f for f in inline_fmt if f.get("type") == "underline"]
     assert len(underline_entries) >= 1, f"Should have underline entry: {inline_fmt}"
+
+
+def test_open_document_passes_opened_document_through(tmp_path: Path) -> None:
+    """Test that an opened Document is reused as-is and paths are parsed afresh."""
+    from sidedoc.extract import _open_document, extract_styles
+
+    docx_path = tmp_path / "opened.docx"
+    doc = Document()
+    doc.add_paragraph("First version")
+    doc.save(str(docx_path))
+
+    first = _open_document(str(docx_path))
+    assert _open_document(first) is first
+    assert _open_document(docx_path) is not first
+
+    blocks, _ = extract_blocks(str(docx_path))
+    assert len(extract_styles(first, blocks)) == len(blocks)
+
+
+def test_extract_all_matches_separate_block_and_style_passes() -> None:
+    """Test that the fused pass yields the same blocks and styles as two passes."""
+    from sidedoc.extract import extract_all, extract_styles
+
+    for name in ["simple.docx", "formatted.docx", "complex.docx", "lists.docx", "images.docx"]:
+        fixture = str(Path(__file__).parent / "fixtures" / name)
+
+        blocks, styles, image_data = extract_all(fixture)
+        expected_blocks, expected_images = extract_blocks(fixture)
+
+        assert blocks == expected_blocks
+        assert styles == extract_styles(fixture, expected_blocks)
+        assert image_data == expected_images
+
+
+def test_paragraph_style_properties_are_memoized_per_style() -> None:
+    """Test that style properties are resolved once per distinct paragraph style."""
+    from sidedoc.extract import _paragraph_style_properties
+
+    doc = Document()
+    doc.add_paragraph("Title", style="Heading 1")
+    doc.add_paragraph("Body one")
+    doc.add_paragraph("Body two")
+    doc.add_paragraph("Subtitle", style="Heading 1")
+
+    style_cache: dict = {}
+    props = [_paragraph_style_properties(p, style_cache) for p in doc.paragraphs]
+
+    assert len(style_cache) == 2
+    assert props[0] == props[3]
+    assert props[1] == props[2]
+    assert props[0][0] == "Heading 1"
+    assert props[1][0] == "Normal"
+
+
+def test_compute_content_hash_caches_short_content_only() -> None:
+    """Test that block hashes are memoized without caching very large content."""
+    import hashlib
+
+    from sidedoc.extract import (
+        MAX_CACHED_CONTENT_LENGTH,
+        _cached_content_hash,
+        compute_content_hash,
+    )
+
+    _cached_content_hash.cache_clear()
+    short = "A short paragraph."
+    large = "x" * (MAX_CACHED_CONTENT_LENGTH + 1)
+
+    assert compute_content_hash(short) == hashlib.sha256(short.encode("utf-8")).hexdigest()
+    assert compute_content_hash(short) == hashlib.sha256(short.encode("utf-8")).hexdigest()
+    assert compute_content_hash(large) == hashlib.sha256(large.encode("utf-8")).hexdigest()
+
+    info = _cached_content_hash.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+    # Worst case the cache keeps 8M characters of block text alive
+    assert info.maxsize is not None
+    assert info.maxsize * MAX_CACHED_CONTENT_LENGTH <= 8 * 1024 * 1024
+
+
+def test_extract_paragraph_content_mixes_plain_and_formatted_runs() -> None:
+    """Test that unformatted runs keep positions aligned with formatted ones."""
+    from sidedoc.extract import extract_paragraph_content
+
+    doc = Document()
+    para = doc.add_paragraph("Plain ")
+    para.add_run("under").underline = True
+    para.add_run(" tail")
+
+    content, formatting, _, _, _ = extract_paragraph_content(para._p)
+
+    assert content == "Plain under tail"
+    assert formatting is not None
+    assert [(f["start"], f["end"]) for f in formatting] == [(6, 11)]
+
+
+def test_validate_image_rejects_mismatch_from_magic_bytes() -> None:
+    """Test that a sniffed format mismatch is rejected without opening the image."""
+    from unittest.mock import patch
+
+    from sidedoc.extract import _sniff_format, validate_image
+
+    gif_header = b"GIF89a" + b"\x00" * 16
+    assert _sniff_format(gif_header) == "GIF"
+    assert _sniff_format(b"not an image") is None
+
+    with patch("sidedoc.extract.Image.open") as mock_open:
+        is_valid, error = validate_image(gif_header, "png")
+
+    assert is_valid is False
+    assert "format mismatch" in error.lower()
+    mock_open.assert_not_called()
+
+
+def test_repeated_image_is_validated_once(tmp_path: Path) -> None:
+    """Test that an image part referenced twice is validated only once."""
+    from unittest.mock import patch
+
+    from sidedoc import extract
+
+    png_path = tmp_path / "logo.png"
+    png_path.write_bytes(create_minimal_png())
+    doc = Document()
+    doc.add_picture(str(png_path), width=Inches(1.0))
+    doc.add_picture(str(png_path), width=Inches(1.0))
+    docx_path = tmp_path / "repeated.docx"
+    doc.save(str(docx_path))
+
+    with patch.object(extract, "validate_image", wraps=extract.validate_image) as spy:
+        blocks, image_data = extract.extract_blocks(str(docx_path))
+
+    image_blocks = [b for b in blocks if b.type == "image"]
+    assert len(image_blocks) == 2
+    assert image_blocks[0].image_path != image_blocks[1].image_path
+    assert len(image_data) == 2
+    assert spy.call_count == 1
+
+
+def test_heading_level_parsing() -> None:
+    """Test that heading levels are parsed from style names, defaulting to 1."""
+    from sidedoc.extract import _heading_level
+
+    assert _heading_level("Heading 3") == 3
+    assert _heading_level("Heading") == 1
+    assert _heading_level("Heading Custom") == 1
+
+
+def test_extract_many_matches_extract_all_in_input_order(tmp_path: Path) -> None:
+    """Test that parallel batch extraction returns per-document results in order."""
+    from sidedoc.extract import extract_all, extract_many
+
+    paths = []
+    for i, text in enumerate(["First document", "Second document body"]):
+        doc = Document()
+        doc.add_heading(f"Title {i}", level=1)
+        doc.add_paragraph(text)
+        path = tmp_path / f"doc{i}.docx"
+        doc.save(str(path))
+        paths.append(path)
+
+    results = extract_many(paths, max_workers=2)
+
+    assert len(results) == 2
+    for path, (blocks, styles, image_data) in zip(paths, results):
+        expected_blocks, expected_styles, expected_images = extract_all(str(path))
+        assert blocks == expected_blocks
+        assert styles == expected_styles
+        assert image_data == expected_images
+
+
+def test_extract_many_skips_pool_for_single_path(tmp_path: Path) -> None:
+    """Test that one path is extracted in-process even with many workers allowed."""
+    from unittest.mock import patch
+
+    from sidedoc.extract import extract_many
+
+    path = tmp_path / "only.docx"
+    doc = Document()
+    doc.add_paragraph("Only document")
+    doc.save(str(path))
+
+    with patch("concurrent.futures.ProcessPoolExecutor") as mock_pool:
+        results = extract_many([path], max_workers=8)
+
+    mock_pool.assert_not_called()
+    assert len(results) == 1
+
+
+def test_extract_all_resolves_each_paragraph_style_once(tmp_path: Path) -> None:
+    """Test that style lookups are shared across paragraphs with the same style."""
+    from unittest.mock import patch
+
+    from docx.parts.document import DocumentPart
+
+    from sidedoc.extract import extract_all
+
+    doc = Document()
+    for i in range(5):
+        doc.add_heading(f"Heading {i}", level=1)
+        doc.add_paragraph(f"Body {i}")
+    docx_path = tmp_path / "styles.docx"
+    doc.save(str(docx_path))
+
+    with patch.object(DocumentPart, "get_style", autospec=True, side_effect=DocumentPart.get_style) as spy:
+        blocks, styles, _ = extract_all(str(docx_path))
+
+    assert [b.type for b in blocks[:2]] == ["heading", "paragraph"]
+    assert {s.docx_style for s in styles} == {"Heading 1", "Normal"}
+    assert spy.call_count == 2
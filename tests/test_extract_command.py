@@ -175,3 +175,22 @@ def test_extract_pack_creates_zip():
                 assert "styles.json" in names
         finally:
             Path(docx_path).unlink(missing_ok=True)
+
+
+def test_extract_command_parses_docx_once(tmp_path: Path):
+    """Test that extract opens the input once and shares it across extractors."""
+    from unittest.mock import patch
+
+    import docx
+
+    docx_path = tmp_path / "once.docx"
+    doc = Document()
+    doc.add_paragraph("Only once", style="Heading 1")
+    doc.save(str(docx_path))
+
+    spy = patch("docx.Document", wraps=docx.Document)
+    with spy as mock_docx, patch("sidedoc.extract.Document", mock_docx):
+        result = CliRunner().invoke(main, ["extract", str(docx_path)])
+
+    assert result.exit_code == 0
+    assert mock_docx.call_count == 1
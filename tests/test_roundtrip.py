@@ -1,6 +1,7 @@
 """Test roundtrip: extract → build produces correct output."""
 
 import tempfile
+import zipfile
 from pathlib import Path
 from click.testing import CliRunner
 from docx import Document
@@ -132,3 +133,53 @@ def test_complete_workflow():
         texts = [p.text for p in final.paragraphs]
         assert "Test Document" in texts
         assert "This is a test" in texts
+
+
+def test_pack_stores_precompressed_assets():
+    """Test that pack stores image assets as-is and deflates text files."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        doc = Document()
+        doc.add_paragraph("Packed", style="Heading 1")
+        doc.save("original.docx")
+        assert runner.invoke(main, ["extract", "original.docx"]).exit_code == 0
+
+        assets = Path("original.sidedoc/assets")
+        assets.mkdir(exist_ok=True)
+        (assets / "image1.png").write_bytes(b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024)
+
+        result = runner.invoke(main, ["pack", "original.sidedoc", "-o", "distributed.sdoc"])
+        assert result.exit_code == 0
+
+        with zipfile.ZipFile("distributed.sdoc") as zf:
+            assert zf.getinfo("assets/image1.png").compress_type == zipfile.ZIP_STORED
+            assert zf.getinfo("content.md").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_create_sidedoc_archive_streams_json_and_stores_images():
+    """Test that archives keep indented JSON metadata and store image assets as-is."""
+    import json
+
+    from sidedoc.extract import extract_all
+    from sidedoc.package import create_sidedoc_archive
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        doc = Document()
+        doc.add_paragraph("Packed", style="Heading 1")
+        doc.save("original.docx")
+
+        blocks, styles, _ = extract_all("original.docx")
+        png = b"\x89PNG\r\n\x1a\n" + b"\x00" * 1024
+        create_sidedoc_archive(
+            "out.sdoc", "# Packed", blocks, styles, "original.docx", {"image1.png": png}
+        )
+
+        with zipfile.ZipFile("out.sdoc") as zf:
+            assert zf.getinfo("assets/image1.png").compress_type == zipfile.ZIP_STORED
+            assert zf.read("assets/image1.png") == png
+            structure_text = zf.read("structure.json").decode("utf-8")
+
+        structure = json.loads(structure_text)
+        assert structure_text == json.dumps(structure, indent=2)
+        assert structure["blocks"][0]["id"] == blocks[0].id
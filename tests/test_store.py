@@ -7,7 +7,7 @@ from pathlib import Path
 
 import pytest
 
-from sidedoc.store import SidedocStore, detect_sidedoc_format
+from sidedoc.store import SidedocStore, detect_sidedoc_format, load_json_bytes
 
 
 def _create_dir_store(tmp_path: Path, content_md: str = "# Hello", styles: dict | None = None,
@@ -75,6 +75,22 @@ class TestDetectFormat:
             detect_sidedoc_format(f)
 
 
+class TestLoadJsonBytes:
+    def test_parses_bytes(self) -> None:
+        assert load_json_bytes(b'{"a": [1, 2.5, null]}') == {"a": [1, 2.5, None]}
+
+    def test_accepts_non_finite_literals(self) -> None:
+        # orjson rejects these, but stdlib json.loads always accepted them
+        result = load_json_bytes(b'{"a": NaN, "b": Infinity, "c": -Infinity}')
+        assert result["a"] != result["a"]
+        assert result["b"] == float("inf")
+        assert result["c"] == float("-inf")
+
+    def test_invalid_raises_json_decode_error(self) -> None:
+        with pytest.raises(json.JSONDecodeError):
+            load_json_bytes(b"{not json")
+
+
 class TestSidedocStoreDirectory:
     def test_open_directory(self, tmp_path: Path) -> None:
         sidedoc_dir = _create_dir_store(tmp_path)
@@ -93,6 +109,13 @@ class TestSidedocStoreDirectory:
         store = SidedocStore.open(sidedoc_dir)
         assert store.read_json("styles.json") == styles
 
+    def test_read_json_invalid_raises_json_decode_error(self, tmp_path: Path) -> None:
+        sidedoc_dir = _create_dir_store(tmp_path)
+        (sidedoc_dir / "styles.json").write_text("{not json")
+        store = SidedocStore.open(sidedoc_dir)
+        with pytest.raises(json.JSONDecodeError):
+            store.read_json("styles.json")
+
     def test_read_bytes(self, tmp_path: Path) -> None:
         sidedoc_dir = _create_dir_store(tmp_path, assets={"img.png": b"\x89PNG"})
         store = SidedocStore.open(sidedoc_dir)
@@ -214,6 +237,16 @@ class TestSidedocStoreZip:
         # After exiting, temp dir should be cleaned up
         assert not adir.exists()
 
+    def test_reads_share_one_archive_handle(self, tmp_path: Path) -> None:
+        zip_path = _create_zip_store(tmp_path)
+        with SidedocStore.open(zip_path) as store:
+            store.read_text("content.md")
+            handle = store._zip_file
+            store.read_json("styles.json")
+            assert store.has_file("content.md")
+            assert store._zip_file is handle
+        assert handle is not None and handle.fp is None
+
     def test_missing_file_raises(self, tmp_path: Path) -> None:
         zip_path = _create_zip_store(tmp_path)
         store = SidedocStore.open(zip_path)
@@ -731,6 +731,46 @@ def test_update_sidedoc_metadata_preserves_styles() -> None:
         assert styles_data == old_styles
 
 
+def test_update_sidedoc_metadata_uses_preparsed_styles_and_structure() -> None:
+    """Test that styles and structure passed by the caller are used instead of re-read."""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidedoc_path = _create_sidedoc_dir_for_metadata(temp_dir)
+        styles = {"block_styles": {}, "document_defaults": {"font_name": "Arial"}}
+        structure = {"blocks": [], "sections": [{"orientation": "landscape"}]}
+
+        update_sidedoc_metadata(
+            str(sidedoc_path),
+            [],
+            "",
+            styles_data=styles,
+            existing_structure=structure,
+        )
+
+        assert json.loads((sidedoc_path / "styles.json").read_text()) == styles
+        structure_data = json.loads((sidedoc_path / "structure.json").read_text())
+        assert structure_data["sections"] == [{"orientation": "landscape"}]
+
+
+def test_sync_sidedoc_to_docx_uses_preparsed_structure() -> None:
+    """Test that passed-in blocks and structure skip re-reading structure.json."""
+    from sidedoc.reconstruct import parse_markdown_to_blocks
+    from sidedoc.sync import sync_sidedoc_to_docx
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        sidedoc_path = _create_sidedoc_dir_for_metadata(temp_dir, content="Synced paragraph")
+        (sidedoc_path / "structure.json").write_text("not valid json", encoding="utf-8")
+        output_path = Path(temp_dir) / "out.docx"
+
+        sync_sidedoc_to_docx(
+            str(sidedoc_path),
+            str(output_path),
+            blocks=parse_markdown_to_blocks("Synced paragraph"),
+            structure_data={"blocks": []},
+        )
+
+        assert [p.text for p in Document(str(output_path)).paragraphs] == ["Synced paragraph"]
+
+
 # Tests for apply_inline_formatting edge cases (Issue #7)
 from sidedoc.reconstruct import apply_inline_formatting
 
@@ -2032,7 +2032,7 @@ def test_validate_command_pre_validates_table_dimensions() -> None:
 
         runner = CliRunner()
         # Patch MAX_TABLE_ROWS to 3 so the 6-row table is rejected
-        with patch("sidedoc.cli.validate_gfm_table_dimensions") as mock_validate:
+        with patch("sidedoc.reconstruct.validate_gfm_table_dimensions") as mock_validate:
             mock_validate.side_effect = ValueError("Table has too many rows (7), maximum is 3")
             result = runner.invoke(cli, ["validate", str(sidedoc_dir)])
 
@@ -184,3 +184,19 @@ def test_unpack_allows_valid_nested_paths():
             assert (Path(output_dir) / "assets" / "images" / "photo.jpg").exists()
         finally:
             Path(temp_file.name).unlink(missing_ok=True)
+
+
+def test_unpack_streams_assets_into_subdirectory():
+    """Test that unpack writes nested asset members byte-for-byte."""
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        payload = bytes(range(256)) * 1024
+        with zipfile.ZipFile("with_assets.sdoc", "w") as zip_file:
+            zip_file.writestr("content.md", "# Test")
+            zip_file.writestr("assets/image1.png", payload)
+
+        result = runner.invoke(main, ["unpack", "with_assets.sdoc", "-o", "out.sidedoc"])
+
+        assert result.exit_code == 0
+        assert Path("out.sidedoc/assets/image1.png").read_bytes() == payload
+        assert Path("out.sidedoc/content.md").read_text() == "# Test"